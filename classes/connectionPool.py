@@ -0,0 +1,242 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+import pymysql
+from pymysql.constants import SERVER_STATUS
+
+logger = logging.getLogger()
+
+MYSQL_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "",
+    "autocommit": True,
+}
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_TIMEOUT = 30
+# Idle connections are pinged before reuse once they have sat unused this long.
+HEALTH_CHECK_AFTER = 5
+
+
+class PoolTimeoutError(pymysql.OperationalError):
+    """Raised when no pooled connection became free within the timeout."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections shared by every window and thread.
+
+    At most max_connections connections are open at once; callers beyond
+    that wait for one to be returned. connection() hands a thread the same
+    connection for nested uses, so helpers called from inside a job share
+    their caller's connection instead of taking a second one.
+    """
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, **config):
+        self.max_connections = max(1, int(max_connections))
+        self.config = dict(MYSQL_CONFIG)
+        self.config.update(config)
+
+        self._condition = threading.Condition()
+        self._idle = []
+        self._open_count = 0
+        self._local = threading.local()
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._connects = 0
+        self._connect_time = 0.0
+        self._health_failures = 0
+        self._discards = 0
+
+    def open_connection(self, **overrides):
+        """Open a connection that is not managed by the pool (e.g. for KILL QUERY)."""
+        config = dict(self.config)
+        config.update(overrides)
+        started = time.perf_counter()
+        connection = pymysql.connect(**config)
+        elapsed = time.perf_counter() - started
+        with self._condition:
+            self._connects += 1
+            self._connect_time += elapsed
+        return connection
+
+    def kill_query(self, connection_id):
+        """Abort the statement running on another connection with KILL QUERY."""
+        try:
+            connection = self.open_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"KILL QUERY {int(connection_id)}")
+            finally:
+                connection.close()
+            logger.info(f"Sent KILL QUERY for connection {connection_id}.")
+        except pymysql.MySQLError as e:
+            logger.error(f"Failed to cancel query on connection {connection_id}: {e}")
+
+    def acquire(self, timeout=DEFAULT_TIMEOUT):
+        """Check out a healthy connection, waiting if the pool is at its limit."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        wait_started = time.perf_counter()
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection, idle_since = self._idle.pop()
+                    break
+                if self._open_count < self.max_connections:
+                    self._open_count += 1
+                    connection, idle_since = None, None
+                    break
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No MySQL connection became free within {timeout} seconds."
+                    )
+                self._condition.wait(remaining)
+            self._checkouts += 1
+            if waited:
+                self._wait_time += time.perf_counter() - wait_started
+
+        if connection is None:
+            try:
+                connection = self.open_connection()
+            except Exception:
+                with self._condition:
+                    self._open_count -= 1
+                    self._condition.notify()
+                raise
+        elif time.monotonic() - idle_since >= HEALTH_CHECK_AFTER:
+            try:
+                self._check_health(connection)
+            except Exception:
+                # Frees the slot of the stale connection and closes it.
+                self.release(connection, discard=True)
+                raise
+        return connection
+
+    def _check_health(self, connection):
+        try:
+            connection.ping(reconnect=False)
+        except pymysql.MySQLError:
+            with self._condition:
+                self._health_failures += 1
+            logger.debug("Pooled MySQL connection was stale, reconnecting.")
+            started = time.perf_counter()
+            connection.ping(reconnect=True)
+            with self._condition:
+                self._connects += 1
+                self._connect_time += time.perf_counter() - started
+
+    def release(self, connection, discard=False):
+        """Return a connection to the pool, or close it when discard is set or it is broken."""
+        if not discard and connection.open:
+            try:
+                if connection.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                    connection.rollback()
+            except pymysql.MySQLError:
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        with self._condition:
+            if discard:
+                self._open_count -= 1
+                self._discards += 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout=DEFAULT_TIMEOUT):
+        """Context manager giving the calling thread its pooled connection."""
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        connection = self.acquire(timeout)
+        self._local.held = connection
+        self._local.depth = 1
+        broken = False
+        try:
+            yield connection
+        except (pymysql.OperationalError, pymysql.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._local.held = None
+            self._local.depth = 0
+            self.release(connection, discard=broken)
+
+    def stats(self):
+        """Return a snapshot of the pool counters."""
+        with self._condition:
+            return {
+                "max_connections": self.max_connections,
+                "open": self._open_count,
+                "idle": len(self._idle),
+                "in_use": self._open_count - len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "avg_wait_ms": (self._wait_time / self._waits * 1000)
+                if self._waits
+                else 0.0,
+                "connects": self._connects,
+                "avg_connect_ms": (self._connect_time / self._connects * 1000)
+                if self._connects
+                else 0.0,
+                "health_failures": self._health_failures,
+                "discards": self._discards,
+            }
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+        for connection, _ in idle:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the application-wide connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
@@ -0,0 +1,166 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import io
+import os
+import queue
+import threading
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compressed chunks waiting for the compression thread; bounds memory use.
+COMPRESSION_QUEUE_SIZE = 8
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+COMPRESSION_EXTENSIONS = (".gz", ".zst")
+
+
+def available_compressions():
+    """The compression extensions whose packages are installed."""
+    return tuple(
+        extension
+        for extension in COMPRESSION_EXTENSIONS
+        if extension != ".zst" or zstandard is not None
+    )
+
+
+def split_compression(file_path):
+    """Return (path without the compression extension, extension or None)."""
+    base, extension = os.path.splitext(file_path)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        return base, extension.lower()
+    return file_path, None
+
+
+class ExportFile(io.RawIOBase):
+    """Unbuffered binary output file that counts the bytes written to it."""
+
+    def __init__(self, file_path, append=False):
+        super().__init__()
+        self.file = open(file_path, "ab" if append else "wb", buffering=0)
+        self.bytes_in = 0
+
+    @property
+    def bytes_out(self):
+        return self.bytes_in
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self.bytes_in
+
+    def write(self, data):
+        written = self.file.write(data)
+        self.bytes_in += written
+        return written
+
+    def sync(self):
+        """Make the data written so far durable on disk."""
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if not self.closed:
+            try:
+                self.file.close()
+            finally:
+                super().close()
+
+
+class CompressedExportFile(ExportFile):
+    """Output file whose data is compressed and written by a separate thread.
+
+    write() only queues the chunk, so rows are fetched and encoded while
+    the previous chunks are compressed. The queue holds at most
+    COMPRESSION_QUEUE_SIZE chunks, after which writers wait for the
+    compression thread to catch up.
+    """
+
+    def __init__(self, file_path, compression):
+        if compression == ".zst":
+            if zstandard is None:
+                raise ImportError(
+                    "zstd compression needs zstandard (pip install zstandard); "
+                    "use .gz instead."
+                )
+            self.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            # wbits 31 writes a gzip header and trailer.
+            self.compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        super().__init__(file_path)
+        self.compressed_bytes = 0
+        self.error = None
+        self.chunks = queue.Queue(COMPRESSION_QUEUE_SIZE)
+        self.thread = threading.Thread(
+            target=self._compress, name="export-compressor", daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def bytes_out(self):
+        return self.compressed_bytes
+
+    def write(self, data):
+        if self.error is not None:
+            raise self.error
+        chunk = bytes(data)
+        self.chunks.put(chunk)
+        self.bytes_in += len(chunk)
+        return len(chunk)
+
+    def _output(self, data):
+        if data:
+            self.file.write(data)
+            self.compressed_bytes += len(data)
+
+    def _compress(self):
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                break
+            if self.error is not None:
+                # Keep draining so writers never block on a dead thread.
+                continue
+            try:
+                self._output(self.compressor.compress(chunk))
+            except Exception as e:
+                self.error = e
+        if self.error is None:
+            try:
+                self._output(self.compressor.flush())
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        if self.closed:
+            return
+        self.chunks.put(None)
+        self.thread.join()
+        super().close()
+        if self.error is not None:
+            raise self.error
+
+
+def open_export_file(file_path, append=False):
+    """Open the raw output of an export, compressed when the path ends in .gz or .zst."""
+    _, compression = split_compression(file_path)
+    if compression is None:
+        return ExportFile(file_path, append)
+    if append:
+        raise ValueError("Compressed exports cannot be appended to.")
+    return CompressedExportFile(file_path, compression)
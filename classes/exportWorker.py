@@ -0,0 +1,448 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import pymysql
+import pymysql.cursors
+from PyQt5.QtCore import QThread, pyqtSignal
+from classes.connectionPool import get_pool
+from classes.exportWriters import writer_for_path
+from classes.rowStreamer import DEFAULT_BATCH_SIZE, kill_running_query, quote_identifier
+from classes.schemaCache import get_schema_cache
+
+logger = logging.getLogger()
+
+# Minimum number of seconds between two progress signals.
+PROGRESS_INTERVAL = 0.25
+DEFAULT_EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+# Seconds to wait for FLUSH TABLES WITH READ LOCK before giving up on a shared snapshot.
+LOCK_WAIT_TIMEOUT = 10
+
+
+def export_rows(
+    connection,
+    writer,
+    database,
+    table_name,
+    query,
+    args=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    on_rows=None,
+    is_stopped=None,
+):
+    """Stream the result of query into writer with an unbuffered cursor.
+
+    Returns (rows, complete). When the export was stopped before the end the
+    result set is left unread, so the caller must discard the connection
+    instead of returning it to the pool.
+    """
+    total_rows = 0
+    complete = False
+    writer.open()
+    try:
+        writer.prepare(connection, database, table_name)
+        cursor = connection.cursor(pymysql.cursors.SSCursor)
+        cursor.execute(query, args)
+        writer.begin(
+            [column[0] for column in cursor.description or []], cursor.description
+        )
+        while not (is_stopped and is_stopped()):
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                writer.end()
+                cursor.close()
+                complete = True
+                break
+            writer.write_rows(rows)
+            total_rows += len(rows)
+            if on_rows is not None:
+                on_rows(len(rows))
+    finally:
+        writer.close()
+    return total_rows, complete
+
+
+def describe_throughput(source, elapsed):
+    """MB/s of export data and, for compressed files, the compression ratio.
+
+    source is a writer or anything else with a bytes_written() method.
+    """
+    bytes_in, bytes_out = source.bytes_written()
+    megabytes = bytes_in / (1024**2)
+    text = f"{megabytes:,.1f} MB at {megabytes / elapsed if elapsed > 0 else 0:,.1f} MB/s"
+    if bytes_out and bytes_out != bytes_in:
+        text += f", {bytes_out / (1024**2):,.1f} MB on disk ({bytes_in / bytes_out:.1f}x)"
+    return text
+
+
+def remove_file(file_path):
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+class ExportWorker(QThread):
+    """Thread that streams a query from the server straight into an ExportWriter.
+
+    Rows are read with an unbuffered cursor in batches of batch_size and
+    written before the next batch is fetched, so memory use does not depend
+    on the size of the table and the GUI thread only receives progress.
+    """
+
+    progress = pyqtSignal(int, float)
+    export_finished = pyqtSignal(int, float)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self,
+        database,
+        table_name,
+        query,
+        args,
+        writer,
+        batch_size=DEFAULT_BATCH_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.database = database
+        self.table_name = table_name
+        self.query = query
+        self.args = args
+        self.writer = writer
+        self.batch_size = max(1, int(batch_size))
+        self._stopped = False
+        self._lock = threading.Lock()
+        self.connection_id = None
+        self._rows = 0
+        self._started = 0.0
+        self._last_progress = 0.0
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def stop(self):
+        """Stop the export, killing the query if it is still running, and remove the partial file."""
+        self._stopped = True
+        with self._lock:
+            connection_id = self.connection_id
+        kill_running_query(connection_id)
+
+    def _on_rows(self, count):
+        self._rows += count
+        now = time.perf_counter()
+        if now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(self._rows, self._rows / (now - self._started))
+
+    def run(self):
+        connection = None
+        complete = False
+        self._started = self._last_progress = time.perf_counter()
+        try:
+            connection = get_pool().acquire()
+            if self.database:
+                connection.select_db(self.database)
+            with self._lock:
+                self.connection_id = connection.thread_id()
+            total_rows, complete = export_rows(
+                connection,
+                self.writer,
+                self.database,
+                self.table_name,
+                self.query,
+                self.args,
+                self.batch_size,
+                self._on_rows,
+                lambda: self._stopped,
+            )
+        except Exception as e:
+            if self._stopped:
+                logger.info(f"Export of {self.table_name} stopped: {e}")
+            else:
+                logger.error(f"Export of {self.table_name} failed: {e}")
+                self.error_occurred.emit(str(e))
+        finally:
+            with self._lock:
+                self.connection_id = None
+            if connection is not None:
+                get_pool().release(connection, discard=not complete)
+
+        if not complete:
+            remove_file(self.writer.file_path)
+            return
+        elapsed = time.perf_counter() - self._started
+        rate = total_rows / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Exported {total_rows} rows of {self.table_name} to "
+            f"{self.writer.file_path} in {elapsed:.1f}s ({rate:,.0f} rows/s)."
+        )
+        self.export_finished.emit(total_rows, elapsed)
+
+
+def export_file_name(table_name, extension):
+    """File name for a table in a database export, safe on every platform."""
+    safe = "".join(
+        "_" if character in '<>:"/\\|?*' or ord(character) < 32 else character
+        for character in table_name
+    )
+    return safe + extension
+
+
+class DatabaseExportWorker(QThread):
+    """Thread that exports every table of a database in parallel.
+
+    Each of the worker threads owns a pooled connection. All of them start
+    their transaction WITH CONSISTENT SNAPSHOT while the coordinator briefly
+    holds FLUSH TABLES WITH READ LOCK, so every file reflects the same point
+    in time. Without the RELOAD privilege each worker gets its own snapshot.
+    Tables are handed out largest first to keep the workers evenly loaded.
+    """
+
+    progress = pyqtSignal(int, int, int, float)
+    table_finished = pyqtSignal(str, int)
+    export_finished = pyqtSignal(int, int, float)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self,
+        database,
+        directory,
+        extension,
+        workers=DEFAULT_EXPORT_WORKERS,
+        batch_size=DEFAULT_BATCH_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.database = database
+        self.directory = directory
+        self.extension = extension
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size))
+        self.snapshot_shared = False
+        self._stopped = False
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._rows = 0
+        # Bytes of the finished tables, and the writers of the running ones.
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._writers = set()
+        # Server thread ids of the connections the export is running queries on.
+        self._connection_ids = set()
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def stop(self):
+        """Stop every worker, killing the queries still running on their connections."""
+        self._cancelled = True
+        self._stopped = True
+        with self._lock:
+            connection_ids = list(self._connection_ids)
+        for connection_id in connection_ids:
+            kill_running_query(connection_id)
+
+    def _track_connection(self, connection):
+        with self._lock:
+            self._connection_ids.add(connection.thread_id())
+
+    def _close_lock_connection(self, connection):
+        with self._lock:
+            self._connection_ids.discard(connection.thread_id())
+        connection.close()
+
+    def bytes_written(self):
+        """Return (bytes before compression, bytes written to disk) over every table."""
+        with self._lock:
+            bytes_in, bytes_out = self._bytes_in, self._bytes_out
+            writers = list(self._writers)
+        for writer in writers:
+            written_in, written_out = writer.bytes_written()
+            bytes_in += written_in
+            bytes_out += written_out
+        return bytes_in, bytes_out
+
+    def _add_rows(self, count):
+        with self._lock:
+            self._rows += count
+
+    def run(self):
+        pool = get_pool()
+        started = time.perf_counter()
+        connections = []
+        broken = set()
+        tables_done = 0
+        try:
+            with pool.connection() as connection:
+                # The cached table list may be minutes old; a dump needs the current one.
+                get_schema_cache().invalidate(self.database)
+                tables = [
+                    info
+                    for info in get_schema_cache().table_infos(
+                        connection, self.database
+                    )
+                    if info.table_type != "VIEW"
+                ]
+            tables.sort(
+                key=lambda info: (info.data_length or 0) + (info.index_length or 0),
+                reverse=True,
+            )
+            # Leave one pooled connection for the rest of the application.
+            workers = max(1, min(self.workers, len(tables), pool.max_connections - 1))
+            for _ in range(workers):
+                connections.append(pool.acquire())
+                self._track_connection(connections[-1])
+            if not self._stopped:
+                self._start_snapshots(connections)
+            logger.info(
+                f"Exporting {len(tables)} tables of {self.database} with {workers} "
+                f"workers ({'shared' if self.snapshot_shared else 'per-worker'} snapshot)."
+            )
+
+            idle = queue.Queue()
+            for connection in connections:
+                idle.put(connection)
+            with ThreadPoolExecutor(workers, thread_name_prefix="export") as executor:
+                futures = {
+                    executor.submit(self._export_table, idle, broken, info): info
+                    for info in tables
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_EXCEPTION
+                    )
+                    for future in done:
+                        rows = future.result()
+                        if rows is not None:
+                            tables_done += 1
+                            self.table_finished.emit(futures[future].name, rows)
+                    with self._lock:
+                        rows = self._rows
+                    elapsed = time.perf_counter() - started
+                    self.progress.emit(
+                        tables_done,
+                        len(tables),
+                        rows,
+                        rows / elapsed if elapsed else 0.0,
+                    )
+        except Exception as e:
+            self._stopped = True
+            if self._cancelled:
+                logger.info(f"Export of database {self.database} cancelled: {e}")
+            else:
+                logger.error(f"Export of database {self.database} failed: {e}")
+                self.error_occurred.emit(str(e))
+            return
+        finally:
+            with self._lock:
+                self._connection_ids.clear()
+            # After a cancel the connections may still have a KILL on its way,
+            # so none of them goes back to the pool.
+            for connection in connections:
+                pool.release(connection, discard=connection in broken or self._cancelled)
+
+        if self._stopped:
+            logger.info(f"Export of database {self.database} cancelled.")
+            return
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Exported {tables_done} tables ({self._rows} rows) of {self.database} "
+            f"in {elapsed:.1f}s."
+        )
+        self.export_finished.emit(tables_done, self._rows, elapsed)
+
+    def _start_snapshots(self, connections):
+        """Open a consistent snapshot on every worker connection."""
+        lock_connection = None
+        try:
+            lock_connection = get_pool().open_connection()
+            self._track_connection(lock_connection)
+            with lock_connection.cursor() as cursor:
+                cursor.execute(f"SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}")
+                cursor.execute("FLUSH TABLES WITH READ LOCK")
+            self.snapshot_shared = True
+        except pymysql.MySQLError as e:
+            logger.warning(
+                f"Could not lock tables for a shared snapshot, "
+                f"each worker uses its own: {e}"
+            )
+            if lock_connection is not None:
+                self._close_lock_connection(lock_connection)
+                lock_connection = None
+
+        try:
+            for connection in connections:
+                connection.select_db(self.database)
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+                    )
+                    cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        finally:
+            if lock_connection is not None:
+                try:
+                    with lock_connection.cursor() as cursor:
+                        cursor.execute("UNLOCK TABLES")
+                finally:
+                    self._close_lock_connection(lock_connection)
+
+    def _export_table(self, idle, broken, info):
+        """Export one table on an idle snapshot connection; None when stopped."""
+        if self._stopped:
+            return None
+        connection = idle.get()
+        file_path = os.path.join(
+            self.directory, export_file_name(info.name, self.extension)
+        )
+        complete = False
+        writer = writer_for_path(file_path)
+        with self._lock:
+            self._writers.add(writer)
+        try:
+            rows, complete = export_rows(
+                connection,
+                writer,
+                self.database,
+                info.name,
+                f"SELECT * FROM {quote_identifier(info.name)}",
+                None,
+                self.batch_size,
+                self._add_rows,
+                lambda: self._stopped,
+            )
+        except Exception:
+            # One failed table fails the export, like mysqldump.
+            self._stopped = True
+            raise
+        finally:
+            with self._lock:
+                self._writers.discard(writer)
+                if complete:
+                    written_in, written_out = writer.bytes_written()
+                    self._bytes_in += written_in
+                    self._bytes_out += written_out
+            if not complete:
+                broken.add(connection)
+                remove_file(file_path)
+            idle.put(connection)
+        return rows if complete else None
@@ -0,0 +1,808 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import base64
+import csv
+import os
+import datetime
+import decimal
+import io
+import json
+import shutil
+import tempfile
+import zipfile
+from pymysql.constants import FIELD_TYPE
+from pymysql.converters import escape_item
+from classes.exportStreams import (
+    available_compressions,
+    open_export_file,
+    split_compression,
+)
+from classes.rowStreamer import quote_identifier
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Size of the userspace write buffer of export files.
+WRITE_BUFFER_SIZE = 1024 * 1024
+DEFAULT_ROWS_PER_STATEMENT = 1000
+# Upper bound of one INSERT, the same as mysqldump's default net_buffer_length.
+DEFAULT_MAX_STATEMENT_SIZE = 1024 * 1024
+# Rows collected before a Parquet row group or Arrow record batch is written.
+ROW_GROUP_SIZE = 64 * 1024
+# Rows of an Excel worksheet, including the header row.
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_CELL_LENGTH = 32767
+
+# MySQL field type -> kind of column in the columnar formats.
+COLUMN_KINDS = {
+    FIELD_TYPE.TINY: "int",
+    FIELD_TYPE.SHORT: "int",
+    FIELD_TYPE.INT24: "int",
+    FIELD_TYPE.LONG: "int",
+    FIELD_TYPE.LONGLONG: "int",
+    FIELD_TYPE.YEAR: "int",
+    FIELD_TYPE.FLOAT: "float",
+    FIELD_TYPE.DOUBLE: "float",
+    FIELD_TYPE.DECIMAL: "decimal",
+    FIELD_TYPE.NEWDECIMAL: "decimal",
+    FIELD_TYPE.DATE: "date",
+    FIELD_TYPE.NEWDATE: "date",
+    FIELD_TYPE.DATETIME: "datetime",
+    FIELD_TYPE.TIMESTAMP: "datetime",
+    FIELD_TYPE.TIME: "time",
+    FIELD_TYPE.BIT: "binary",
+    FIELD_TYPE.GEOMETRY: "binary",
+}
+
+
+def csv_value(value):
+    """Convert a MySQL value to its CSV text; NULL becomes an empty field."""
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    if isinstance(value, datetime.timedelta):
+        return _format_timedelta(value)
+    return value
+
+
+def json_value(value):
+    """Encode a MySQL value as a JSON fragment.
+
+    DECIMAL stays a number literal so no precision is lost, dates and times
+    use ISO 8601, TIME columns (timedelta) their MySQL text, and binary
+    values are base64 strings.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return '"' + value.isoformat() + '"'
+    if isinstance(value, datetime.timedelta):
+        return '"' + _format_timedelta(value) + '"'
+    if isinstance(value, (bytes, bytearray)):
+        return '"' + base64.b64encode(value).decode("ascii") + '"'
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _format_timedelta(value):
+    """Format a TIME value as MySQL does, e.g. -01:02:03.500000."""
+    sign = "-" if value < datetime.timedelta(0) else ""
+    value = abs(value)
+    hours, rest = divmod(value.days * 86400 + value.seconds, 3600)
+    text = f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+    if value.microseconds:
+        text += f".{value.microseconds:06d}"
+    return text
+
+
+class ExportWriter:
+    """Base class of the streaming export formats.
+
+    The ExportWorker calls open(), prepare(), begin() with the result
+    columns, write_rows() once per fetched batch, end(), and finally
+    close(), so a writer only ever holds a bounded number of rows. Output
+    goes through open_export_file(), so every format can be compressed by
+    adding .gz or .zst to the file name.
+    """
+
+    # Whether a partial file can be continued by opening it with append=True.
+    appendable = False
+    # Whether the packages the format needs are installed.
+    available = True
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.output = None
+        self.stream = None
+        self.file = None
+        self.columns = []
+        self.appending = False
+
+    def open_stream(self):
+        """Open the binary output stream of the file."""
+        self.output = open_export_file(self.file_path, self.appending)
+        self.stream = io.BufferedWriter(self.output, WRITE_BUFFER_SIZE)
+
+    def open(self, append=False):
+        """Open the file; with append, rows continue a partial export without a new header."""
+        self.appending = append
+        self.open_stream()
+        self.file = io.TextIOWrapper(self.stream, encoding="utf-8", newline="")
+
+    def flush(self):
+        """Write everything buffered so far to disk."""
+        if self.file is not None:
+            self.file.flush()
+        self.stream.flush()
+        self.output.sync()
+
+    def bytes_written(self):
+        """Return (bytes before compression, bytes written to disk) so far."""
+        if self.output is None:
+            return 0, 0
+        return self.output.bytes_in, self.output.bytes_out
+
+    def prepare(self, connection, database, table_name):
+        """Read anything the format needs from the server before the rows."""
+
+    def begin(self, columns, description=None):
+        self.columns = list(columns)
+        # The cursor description, for formats that store typed columns.
+        self.description = description or [(column, None) for column in self.columns]
+
+    def write_rows(self, rows):
+        raise NotImplementedError
+
+    def end(self):
+        pass
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+
+class CsvExportWriter(ExportWriter):
+    """Writes rows as CSV with a header line."""
+
+    appendable = True
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        self.writer = csv.writer(self.file)
+        if not self.appending:
+            self.writer.writerow(self.columns)
+
+    def write_rows(self, rows):
+        self.writer.writerows([csv_value(value) for value in row] for row in rows)
+
+
+class JsonLinesExportWriter(ExportWriter):
+    """Writes one JSON object per line."""
+
+    appendable = True
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        # The key of every column is encoded once, not once per row.
+        self.keys = [
+            json.dumps(str(column), ensure_ascii=False) + ": "
+            for column in self.columns
+        ]
+
+    def encode_row(self, row):
+        return (
+            "{"
+            + ", ".join(key + json_value(value) for key, value in zip(self.keys, row))
+            + "}"
+        )
+
+    def write_rows(self, rows):
+        self.file.write("".join(self.encode_row(row) + "\n" for row in rows))
+
+
+class JsonExportWriter(JsonLinesExportWriter):
+    """Writes a JSON array of row objects, one object per line."""
+
+    appendable = False
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        self.first_row = True
+        self.file.write("[")
+
+    def write_rows(self, rows):
+        if not rows:
+            return
+        separator = "\n" if self.first_row else ",\n"
+        self.first_row = False
+        self.file.write(separator + ",\n".join(self.encode_row(row) for row in rows))
+
+    def end(self):
+        self.file.write("\n]\n" if not self.first_row else "]\n")
+
+
+class SqlDumpExportWriter(ExportWriter):
+    """Writes a SQL dump: the CREATE TABLE statement and extended INSERTs.
+
+    Each INSERT carries up to rows_per_statement rows and is cut earlier if
+    it would grow past max_statement_size bytes or the server's
+    max_allowed_packet, so the dump can be loaded back without raising the
+    packet limit. Rows waiting for their statement are the only rows held.
+    Generated columns are left out of the INSERTs, as mysqldump does, since
+    MySQL rejects values for them.
+    """
+
+    appendable = True
+
+    def __init__(
+        self,
+        file_path,
+        rows_per_statement=DEFAULT_ROWS_PER_STATEMENT,
+        max_statement_size=DEFAULT_MAX_STATEMENT_SIZE,
+    ):
+        super().__init__(file_path)
+        self.rows_per_statement = max(1, int(rows_per_statement))
+        self.max_statement_size = max(1024, int(max_statement_size))
+        self.table_name = None
+        self.generated_columns = set()
+        # Positions of the result columns written to the INSERTs.
+        self.kept_positions = None
+        self.pending = []
+        self.pending_size = 0
+
+    def prepare(self, connection, database, table_name):
+        self.table_name = table_name
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s "
+                "AND EXTRA IN ('VIRTUAL GENERATED', 'STORED GENERATED')",
+                (database, table_name),
+            )
+            self.generated_columns = {column for column, in cursor.fetchall()}
+            cursor.execute(f"SHOW CREATE TABLE {quote_identifier(table_name)}")
+            row = cursor.fetchone()
+            is_view = cursor.description[1][0] == "Create View"
+            if is_view:
+                cursor.execute(f"SHOW COLUMNS FROM {quote_identifier(table_name)}")
+                view_columns = cursor.fetchall()
+            cursor.execute("SELECT @@max_allowed_packet")
+            max_allowed_packet = int(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+        # Leave room for the packet header and the statement terminator.
+        self.max_statement_size = min(
+            self.max_statement_size, max_allowed_packet - 1024
+        )
+        if self.appending:
+            return
+
+        table = quote_identifier(table_name)
+        self.file.write(
+            f"-- SQL dump of {quote_identifier(database)}.{table} written by gamma\n\n"
+            "/*!40101 SET NAMES utf8mb4 */;\n"
+            "SET @OLD_FOREIGN_KEY_CHECKS=@@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS=0;\n"
+            "SET @OLD_UNIQUE_CHECKS=@@UNIQUE_CHECKS, UNIQUE_CHECKS=0;\n\n"
+        )
+        if is_view:
+            # The rows of a view are dumped into a table of the same name,
+            # built from the column types of the view. Columns stay nullable
+            # because a filtered export may leave some of them out.
+            definition = ",\n".join(
+                f"  {quote_identifier(column[0])} {column[1]}" for column in view_columns
+            )
+            original = row[1].replace("\n", "\n-- ")
+            self.file.write(
+                f"-- {table} is a view, its definition was:\n-- {original}\n"
+                f"DROP VIEW IF EXISTS {table};\n"
+                f"DROP TABLE IF EXISTS {table};\n"
+                f"CREATE TABLE {table} (\n{definition}\n);\n\n"
+            )
+        else:
+            self.file.write(f"DROP TABLE IF EXISTS {table};\n{row[1]};\n\n")
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        kept_positions = [
+            position
+            for position, column in enumerate(self.columns)
+            if column not in self.generated_columns
+        ]
+        inserted = [self.columns[position] for position in kept_positions]
+        if len(inserted) < len(self.columns):
+            self.kept_positions = kept_positions
+        column_list = ", ".join(quote_identifier(column) for column in inserted)
+        self.insert_prefix = (
+            f"INSERT INTO {quote_identifier(self.table_name)} ({column_list}) VALUES\n"
+        )
+
+    def write_rows(self, rows):
+        prefix_size = len(self.insert_prefix)
+        for row in rows:
+            if self.kept_positions is not None:
+                row = [row[position] for position in self.kept_positions]
+            values = (
+                "(" + ",".join(escape_item(value, "utf8mb4") for value in row) + ")"
+            )
+            size = len(values.encode("utf-8")) + 2
+            if self.pending and (
+                len(self.pending) >= self.rows_per_statement
+                or prefix_size + self.pending_size + size > self.max_statement_size
+            ):
+                self.flush_statement()
+            self.pending.append(values)
+            self.pending_size += size
+
+    def flush_statement(self):
+        if not self.pending:
+            return
+        self.file.write(self.insert_prefix + ",\n".join(self.pending) + ";\n")
+        self.pending = []
+        self.pending_size = 0
+
+    def flush(self):
+        # A partial file must end on a complete statement.
+        self.flush_statement()
+        super().flush()
+
+    def end(self):
+        self.flush_statement()
+        self.file.write(
+            "\nSET UNIQUE_CHECKS=@OLD_UNIQUE_CHECKS;\n"
+            "SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS;\n"
+        )
+
+
+def excel_value(value):
+    """Convert a MySQL value to something openpyxl can store in a cell."""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)[:EXCEL_MAX_CELL_LENGTH]
+    if isinstance(value, (bytes, bytearray)):
+        return ("0x" + value.hex())[:EXCEL_MAX_CELL_LENGTH]
+    if isinstance(value, (set, frozenset)):
+        return ",".join(sorted(value))
+    return value
+
+
+def excel_cell(sheet, value):
+    """Return the cell value of a MySQL value, keeping text starting with = literal.
+
+    openpyxl stores such strings as formulas, which would change the data
+    and let table contents inject formulas into the workbook.
+    """
+    value = excel_value(value)
+    if isinstance(value, str) and value.startswith("="):
+        cell = WriteOnlyCell(sheet, value)
+        cell.data_type = "s"
+        return cell
+    return value
+
+
+class ExcelExportWriter(ExportWriter):
+    """Writes an .xlsx workbook with openpyxl in write-only mode.
+
+    Write-only worksheets stream their rows to temporary files, so memory
+    stays flat. When a sheet reaches Excel's limit of EXCEL_MAX_ROWS rows
+    the export continues on a new sheet with the header repeated.
+    """
+
+    available = openpyxl is not None
+
+    def __init__(self, file_path):
+        if openpyxl is None:
+            raise ImportError("Excel exports need openpyxl (pip install openpyxl).")
+        super().__init__(file_path)
+        self.workbook = None
+        self.sheet = None
+        self.sheet_rows = 0
+        self.sheet_count = 0
+        self.title = "Sheet"
+
+    def open(self):
+        self.workbook = openpyxl.Workbook(write_only=True)
+
+    def prepare(self, connection, database, table_name):
+        # Sheet titles are at most 31 characters and cannot contain []:*?/\
+        title = "".join("_" if c in "[]:*?/\\" else c for c in str(table_name))
+        self.title = title[:24] or "Sheet"
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        self.add_sheet()
+
+    def add_sheet(self):
+        self.sheet_count += 1
+        title = self.title
+        if self.sheet_count > 1:
+            title = f"{self.title} ({self.sheet_count})"
+        self.sheet = self.workbook.create_sheet(title)
+        self.sheet.append(
+            [excel_cell(self.sheet, str(column)) for column in self.columns]
+        )
+        self.sheet_rows = 1
+
+    def write_rows(self, rows):
+        for row in rows:
+            if self.sheet_rows >= EXCEL_MAX_ROWS:
+                self.add_sheet()
+            self.sheet.append([excel_cell(self.sheet, value) for value in row])
+            self.sheet_rows += 1
+
+    def end(self):
+        self.open_stream()
+        self.workbook.save(self.stream)
+
+    def close(self):
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+        super().close()
+
+
+class ColumnarExportWriter(ExportWriter):
+    """Base class of the formats that store the rows as typed columns.
+
+    The kind of every column comes from its MySQL field type. String
+    columns become binary when the server returns bytes for them (binary
+    collations, BLOBs), which is only known once the first rows arrive.
+    """
+
+    def open(self):
+        self.open_stream()
+
+    def begin(self, columns, description=None):
+        super().begin(columns, description)
+        self.kinds = [
+            COLUMN_KINDS.get(column[1], "string") for column in self.description
+        ]
+        self.kinds_resolved = False
+
+    def resolve_kinds(self, rows):
+        for index, kind in enumerate(self.kinds):
+            if kind != "string":
+                continue
+            for row in rows:
+                if row[index] is not None:
+                    if isinstance(row[index], (bytes, bytearray)):
+                        self.kinds[index] = "binary"
+                    break
+        self.kinds_resolved = True
+
+    def column_values(self, rows, index):
+        """Values of one column of a batch, converted to the column's kind."""
+        values = [row[index] for row in rows]
+        kind = self.kinds[index]
+        if kind == "string":
+            return [
+                (
+                    value.decode("utf-8", "replace")
+                    if isinstance(value, (bytes, bytearray))
+                    else value
+                )
+                for value in values
+            ]
+        if kind == "binary":
+            return [
+                value.encode("utf-8") if isinstance(value, str) else value
+                for value in values
+            ]
+        return values
+
+    def write_rows(self, rows):
+        if not self.kinds_resolved:
+            self.resolve_kinds(rows)
+        self.write_columns(
+            len(rows),
+            [self.column_values(rows, index) for index in range(len(self.columns))],
+        )
+
+    def write_columns(self, row_count, columns):
+        raise NotImplementedError
+
+
+class ArrowExportWriter(ColumnarExportWriter):
+    """Writes Parquet, or the Arrow IPC file format for .arrow / .feather, with pyarrow.
+
+    Batches are gathered into row groups of ROW_GROUP_SIZE rows, so the
+    files stay efficient to scan while memory stays bounded.
+    """
+
+    available = pyarrow is not None
+
+    def __init__(self, file_path):
+        if pyarrow is None:
+            raise ImportError(
+                "Parquet and Arrow exports need pyarrow (pip install pyarrow); "
+                "export to .npz instead."
+            )
+        super().__init__(file_path)
+        self.parquet = split_compression(file_path)[0].lower().endswith(".parquet")
+        self.schema = None
+        self.writer = None
+        self.pending = []
+        self.pending_rows = 0
+
+    def arrow_type(self, index):
+        kind = self.kinds[index]
+        if kind == "decimal":
+            length = self.description[index][3]
+            scale = self.description[index][5]
+            if length is not None and length <= 40:
+                return pyarrow.decimal128(38, scale or 0)
+            return pyarrow.decimal256(76, scale or 0)
+        return {
+            "int": pyarrow.int64(),
+            "float": pyarrow.float64(),
+            "date": pyarrow.date32(),
+            "datetime": pyarrow.timestamp("us"),
+            "time": pyarrow.duration("us"),
+            "binary": pyarrow.binary(),
+        }.get(kind, pyarrow.string())
+
+    def open_writer(self):
+        self.schema = pyarrow.schema(
+            [
+                pyarrow.field(str(column), self.arrow_type(index))
+                for index, column in enumerate(self.columns)
+            ]
+        )
+        if self.parquet:
+            self.writer = pyarrow.parquet.ParquetWriter(
+                self.stream, self.schema, compression="zstd"
+            )
+        else:
+            self.writer = pyarrow.ipc.new_file(
+                self.stream,
+                self.schema,
+                options=pyarrow.ipc.IpcWriteOptions(compression="zstd"),
+            )
+
+    def write_columns(self, row_count, columns):
+        if self.writer is None:
+            self.open_writer()
+        arrays = []
+        for index, values in enumerate(columns):
+            try:
+                arrays.append(pyarrow.array(values, type=self.schema.field(index).type))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError) as e:
+                raise ValueError(f"Cannot convert column {self.columns[index]}: {e}")
+        self.pending.append(pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.pending_rows += row_count
+        if self.pending_rows >= ROW_GROUP_SIZE:
+            self.flush_row_group()
+
+    def flush_row_group(self):
+        if self.pending:
+            self.writer.write_table(
+                pyarrow.Table.from_batches(self.pending, self.schema)
+            )
+        self.pending = []
+        self.pending_rows = 0
+
+    def end(self):
+        if self.writer is None:
+            self.kinds_resolved = True
+            self.open_writer()
+        self.flush_row_group()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        super().close()
+
+
+class _SpooledArray:
+    """A 1-D array appended to a temporary file and copied into a .npy member at the end."""
+
+    def __init__(self, dtype):
+        self.dtype = numpy.dtype(dtype)
+        self.file = tempfile.TemporaryFile()
+        self.length = 0
+
+    def append(self, values):
+        array = numpy.asarray(values, dtype=self.dtype)
+        self.file.write(array.tobytes())
+        self.length += len(array)
+
+    def write_member(self, archive, name):
+        with archive.open(name + ".npy", "w", force_zip64=True) as member:
+            numpy.lib.format.write_array_header_1_0(
+                member,
+                {
+                    "descr": numpy.lib.format.dtype_to_descr(self.dtype),
+                    "fortran_order": False,
+                    "shape": (self.length,),
+                },
+            )
+            self.file.seek(0)
+            shutil.copyfileobj(self.file, member, WRITE_BUFFER_SIZE)
+
+    def close(self):
+        self.file.close()
+
+
+class NpzExportWriter(ColumnarExportWriter):
+    """Writes a compressed NumPy .npz archive with typed arrays per column.
+
+    Every column has a "<column>.valid" mask that is False for NULL.
+    Numbers are int64 or float64 (DECIMAL too), dates and times are
+    datetime64 / timedelta64. Strings and binary values are stored as
+    "<column>.data" (uint8 bytes, UTF-8 for text) and "<column>.offsets",
+    where value i is data[offsets[i]:offsets[i + 1]]. The arrays are spooled
+    to temporary files and only compressed into the archive at the end, so
+    the table never has to fit in memory.
+    """
+
+    DTYPES = {
+        "int": "int64",
+        "float": "float64",
+        "decimal": "float64",
+        "date": "datetime64[D]",
+        "datetime": "datetime64[us]",
+        "time": "timedelta64[us]",
+    }
+
+    available = numpy is not None
+
+    def __init__(self, file_path):
+        if numpy is None:
+            raise ImportError("NumPy exports need numpy (pip install numpy).")
+        super().__init__(file_path)
+        self.arrays = {}
+        self.data_sizes = {}
+
+    def _array(self, name, dtype):
+        if name not in self.arrays:
+            self.arrays[name] = _SpooledArray(dtype)
+        return self.arrays[name]
+
+    def write_columns(self, row_count, columns):
+        for index, values in enumerate(columns):
+            name = str(self.columns[index])
+            kind = self.kinds[index]
+            self._array(name + ".valid", "bool").append(
+                [value is not None for value in values]
+            )
+            if kind in ("string", "binary"):
+                self.write_variable(name, kind, values)
+                continue
+            dtype = self.DTYPES[kind]
+            if kind == "int":
+                values = [0 if value is None else int(value) for value in values]
+            elif kind in ("float", "decimal"):
+                values = [
+                    numpy.nan if value is None else float(value) for value in values
+                ]
+            elif kind == "time":
+                values = [
+                    numpy.timedelta64("NaT") if value is None else value
+                    for value in values
+                ]
+            else:
+                values = [
+                    numpy.datetime64("NaT") if value is None else value
+                    for value in values
+                ]
+            try:
+                self._array(name, dtype).append(values)
+            except (OverflowError, ValueError, TypeError) as e:
+                raise ValueError(f"Cannot convert column {name}: {e}")
+
+    def write_variable(self, name, kind, values):
+        encoded = [
+            (
+                b""
+                if value is None
+                else value.encode("utf-8") if isinstance(value, str) else bytes(value)
+            )
+            for value in values
+        ]
+        offset = self.data_sizes.get(name)
+        if offset is None:
+            offset = 0
+            self._array(name + ".offsets", "int64").append([0])
+        ends = []
+        for value in encoded:
+            offset += len(value)
+            ends.append(offset)
+        self.data_sizes[name] = offset
+        self._array(name + ".offsets", "int64").append(ends)
+        self._array(name + ".data", "uint8").append(
+            numpy.frombuffer(b"".join(encoded), dtype="uint8")
+        )
+
+    def end(self):
+        with zipfile.ZipFile(
+            self.stream, "w", zipfile.ZIP_DEFLATED, allowZip64=True
+        ) as archive:
+            for name, array in self.arrays.items():
+                array.write_member(archive, name)
+
+    def close(self):
+        for array in self.arrays.values():
+            array.close()
+        self.arrays = {}
+        super().close()
+
+
+WRITERS_BY_EXTENSION = {
+    ".csv": CsvExportWriter,
+    ".json": JsonExportWriter,
+    ".jsonl": JsonLinesExportWriter,
+    ".sql": SqlDumpExportWriter,
+    ".xlsx": ExcelExportWriter,
+    ".parquet": ArrowExportWriter,
+    ".arrow": ArrowExportWriter,
+    ".feather": ArrowExportWriter,
+    ".npz": NpzExportWriter,
+}
+
+
+def export_format(file_path):
+    """Return the format extension of an export path, ignoring .gz / .zst."""
+    return os.path.splitext(split_compression(file_path)[0])[1].lower()
+
+
+def export_extensions():
+    """Every usable export extension, including the compressed variants of the text formats.
+
+    Formats and compressions whose optional packages are missing are left out.
+    """
+    extensions = [
+        extension
+        for extension, writer in WRITERS_BY_EXTENSION.items()
+        if writer.available
+    ]
+    for extension in (".csv", ".jsonl", ".sql"):
+        extensions.extend(extension + suffix for suffix in available_compressions())
+    return extensions
+
+
+def writer_for_path(file_path):
+    """Return a writer for the file, chosen by its extension."""
+    extension = export_format(file_path)
+    if extension not in WRITERS_BY_EXTENSION:
+        raise ValueError(f"Unsupported export format: {extension or file_path}")
+    return WRITERS_BY_EXTENSION[extension](file_path)
@@ -0,0 +1,191 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import time
+import psutil
+import pymysql
+
+logger = logging.getLogger()
+
+MYSQLD_PROCESS_NAMES = ("mysqld", "mysqld.exe")
+# Seconds between attempts to find a mysqld that is not running yet.
+RESOLVE_RETRY_INTERVAL = 30
+
+
+def find_mysqld_process():
+    """Return the running mysqld as a psutil.Process, or None."""
+    for process in psutil.process_iter(attrs=["name"]):
+        if (process.info["name"] or "").lower() in MYSQLD_PROCESS_NAMES:
+            return process
+    return None
+
+
+class CpuSample:
+    """CPU usage over the time since the previous sample, in percent."""
+
+    def __init__(self, total, per_core):
+        self.total = total
+        self.per_core = per_core
+
+
+class CpuSampler:
+    """Measures host CPU usage without blocking.
+
+    psutil.cpu_percent(interval=None) compares against the times saved by
+    the previous call, so the sampler only primes that baseline once and
+    every later sample() returns immediately with the usage over the time
+    since the last tick. The total is the mean of the per-core values, so
+    both describe the same window.
+    """
+
+    def __init__(self):
+        self.primed = False
+
+    def sample(self):
+        """Return a CpuSample, or None on the first call, which only primes the baseline."""
+        per_core = psutil.cpu_percent(None, percpu=True)
+        if not self.primed:
+            self.primed = True
+            return None
+        total = sum(per_core) / len(per_core) if per_core else 0.0
+        logger.debug(f"Fetched CPU usage: {total:.1f}%, per core: {per_core}")
+        return CpuSample(total, per_core)
+
+
+class ProcessSample:
+    """Resource usage of mysqld; a value is None when the OS did not allow reading it."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        # Share of the whole host CPU since the previous sample.
+        self.cpu = None
+        self.rss = None
+        self.threads = None
+        # File descriptors on POSIX, handles on Windows.
+        self.open_files = None
+        self.read_bytes = None
+        self.write_bytes = None
+        # Bytes per second since the previous sample.
+        self.read_rate = None
+        self.write_rate = None
+
+
+class MysqldProcessMonitor:
+    """Samples the resources used by the mysqld process of the connected server.
+
+    The PID is resolved once, from the file named by @@pid_file when the
+    server runs on this machine, or else by looking for a mysqld process,
+    and is only looked up again after that process exits. CPU and I/O
+    rates are measured between consecutive samples, so the first sample
+    after resolving has none.
+    """
+
+    def __init__(self, collector):
+        self.collector = collector
+        self.cpu_count = psutil.cpu_count() or 1
+        self.process = None
+        self._resolved_at = None
+        self._previous_io = None
+
+    def _process_from_pid_file(self):
+        try:
+            pid_file = self.collector.query("SELECT @@pid_file")[0][0]
+        except pymysql.MySQLError as e:
+            logger.debug(f"Could not read @@pid_file: {e}")
+            return None
+        try:
+            with open(pid_file, encoding="ascii") as file:
+                process = psutil.Process(int(file.read().strip()))
+        except (OSError, ValueError, psutil.Error):
+            # The server is remote, or its data directory is not readable.
+            return None
+        if process.name().lower() not in MYSQLD_PROCESS_NAMES:
+            return None
+        return process
+
+    def resolve(self):
+        """Find the mysqld process, at most every RESOLVE_RETRY_INTERVAL seconds."""
+        if self.process is not None:
+            return self.process
+        now = time.monotonic()
+        if (
+            self._resolved_at is not None
+            and now - self._resolved_at < RESOLVE_RETRY_INTERVAL
+        ):
+            return None
+        self._resolved_at = now
+        process = self._process_from_pid_file() or find_mysqld_process()
+        if process is None:
+            logger.debug("No mysqld process found on this machine.")
+            return None
+        logger.info(f"Monitoring mysqld process {process.pid}.")
+        try:
+            process.cpu_percent(None)
+        except psutil.Error:
+            return None
+        self.process = process
+        self._previous_io = None
+        return process
+
+    def sample(self):
+        """Return a ProcessSample, or None when mysqld is not running on this machine."""
+        just_resolved = self.process is None
+        process = self.resolve()
+        if process is None:
+            return None
+        sample = ProcessSample(process.pid)
+        try:
+            with process.oneshot():
+                if not process.is_running():
+                    raise psutil.NoSuchProcess(process.pid)
+                if not just_resolved:
+                    # Percent of one core; divided by the core count for the host share.
+                    sample.cpu = self._read(
+                        lambda: process.cpu_percent(None) / self.cpu_count
+                    )
+                sample.rss = self._read(lambda: process.memory_info().rss)
+                sample.threads = self._read(process.num_threads)
+                if hasattr(process, "num_handles"):
+                    sample.open_files = self._read(process.num_handles)
+                else:
+                    sample.open_files = self._read(process.num_fds)
+                if hasattr(process, "io_counters"):
+                    io = self._read(process.io_counters)
+                    if io is not None:
+                        self._io_rates(sample, io)
+        except psutil.NoSuchProcess:
+            logger.info(f"mysqld process {process.pid} exited.")
+            self.process = None
+            self._resolved_at = None
+            return None
+        return sample
+
+    def _read(self, read):
+        try:
+            return read()
+        except psutil.AccessDenied:
+            return None
+
+    def _io_rates(self, sample, io):
+        now = time.monotonic()
+        sample.read_bytes = io.read_bytes
+        sample.write_bytes = io.write_bytes
+        if self._previous_io is not None:
+            taken_at, read_bytes, write_bytes = self._previous_io
+            elapsed = now - taken_at
+            if elapsed > 0:
+                sample.read_rate = max(0, io.read_bytes - read_bytes) / elapsed
+                sample.write_rate = max(0, io.write_bytes - write_bytes) / elapsed
+        self._previous_io = (now, io.read_bytes, io.write_bytes)
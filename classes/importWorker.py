@@ -0,0 +1,269 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import csv
+import logging
+import threading
+import time
+import pymysql
+from PyQt5.QtCore import QThread, pyqtSignal
+from classes.connectionPool import get_pool
+from classes.rowStreamer import kill_running_query, quote_identifier
+
+logger = logging.getLogger()
+
+DEFAULT_INSERT_BATCH = 1000
+DEFAULT_ROWS_PER_TRANSACTION = 50000
+# Minimum number of seconds between two progress signals.
+PROGRESS_INTERVAL = 0.25
+# Errors meaning LOAD DATA LOCAL is disabled on the server or the client.
+LOCAL_INFILE_DISABLED_ERRORS = (1148, 2068, 3948)
+
+LOAD_DATA = "LOAD DATA LOCAL INFILE"
+INSERT_BATCHES = "batched INSERT"
+
+
+def read_csv_preview(file_path, delimiter=",", rows=20):
+    """Return the first rows of a CSV file for the column mapping."""
+    preview = []
+    with open(file_path, newline="", encoding="utf-8-sig") as file:
+        for row in csv.reader(file, delimiter=delimiter):
+            preview.append(row)
+            if len(preview) >= rows:
+                break
+    return preview
+
+
+def detect_line_terminator(file_path):
+    with open(file_path, "rb") as file:
+        sample = file.read(64 * 1024)
+    return "\r\n" if b"\r\n" in sample else "\n"
+
+
+class ImportWorker(QThread):
+    """Thread that loads a CSV file into a table.
+
+    mapping has one entry per file column: the table column it goes to, or
+    None to skip it. The file is sent with LOAD DATA LOCAL INFILE, which
+    the server parses and inserts in one pass. When the server or client
+    does not allow local files, the file is read here instead and inserted
+    with executemany() in multi-row batches, committing every
+    rows_per_transaction rows so a failure only loses the open chunk.
+    """
+
+    progress = pyqtSignal(int, float)
+    import_finished = pyqtSignal(int, float, str)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self,
+        database,
+        table_name,
+        file_path,
+        mapping,
+        delimiter=",",
+        has_header=True,
+        empty_as_null=True,
+        use_load_data=True,
+        batch_size=DEFAULT_INSERT_BATCH,
+        rows_per_transaction=DEFAULT_ROWS_PER_TRANSACTION,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.database = database
+        self.table_name = table_name
+        self.file_path = file_path
+        self.mapping = list(mapping)
+        self.delimiter = delimiter
+        self.has_header = has_header
+        self.empty_as_null = empty_as_null
+        self.use_load_data = use_load_data
+        self.batch_size = max(1, int(batch_size))
+        self.rows_per_transaction = max(self.batch_size, int(rows_per_transaction))
+        self.warnings = 0
+        self._stopped = False
+        self._lock = threading.Lock()
+        self._connection_id = None
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def stop(self):
+        """Stop the import; rows of the open transaction are rolled back."""
+        self._stopped = True
+        with self._lock:
+            connection_id = self._connection_id
+        kill_running_query(connection_id)
+
+    def run(self):
+        started = time.perf_counter()
+        method = LOAD_DATA
+        try:
+            rows = None
+            if self.use_load_data:
+                rows = self._load_data()
+            if rows is None:
+                method = INSERT_BATCHES
+                rows = self._insert_batches(started)
+        except Exception as e:
+            if self._stopped:
+                logger.info(f"Import into {self.table_name} cancelled.")
+            else:
+                logger.error(f"Import into {self.table_name} failed: {e}")
+                self.error_occurred.emit(str(e))
+            return
+
+        elapsed = time.perf_counter() - started
+        if self._stopped:
+            logger.info(f"Import into {self.table_name} cancelled after {rows} rows.")
+            return
+        logger.info(
+            f"Imported {rows} rows into {self.database}.{self.table_name} with "
+            f"{method} in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)."
+        )
+        self.import_finished.emit(rows, elapsed, method)
+
+    def _load_data_statement(self):
+        variables = []
+        assignments = []
+        for index, column in enumerate(self.mapping):
+            variable = f"@c{index}"
+            variables.append(variable)
+            if column is None:
+                continue
+            value = f"NULLIF({variable}, '')" if self.empty_as_null else variable
+            assignments.append(f"{quote_identifier(column)} = {value}")
+
+        # ESCAPED BY '' keeps backslashes literal, as CSV files expect.
+        sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {quote_identifier(self.table_name)} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY %s OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            "LINES TERMINATED BY %s "
+        )
+        if self.has_header:
+            sql += "IGNORE 1 LINES "
+        sql += f"({', '.join(variables)}) SET {', '.join(assignments)}"
+        args = (self.file_path, self.delimiter, detect_line_terminator(self.file_path))
+        return sql, args
+
+    def _load_data(self):
+        """Send the file with LOAD DATA LOCAL INFILE; None when local files are disabled."""
+        sql, args = self._load_data_statement()
+        try:
+            connection = get_pool().open_connection(local_infile=True, autocommit=True)
+        except pymysql.MySQLError as e:
+            logger.warning(f"Cannot open a connection with local_infile: {e}")
+            return None
+        try:
+            connection.select_db(self.database)
+            with self._lock:
+                self._connection_id = connection.thread_id()
+            with connection.cursor() as cursor:
+                try:
+                    rows = cursor.execute(sql, args)
+                except pymysql.MySQLError as e:
+                    if e.args and e.args[0] in LOCAL_INFILE_DISABLED_ERRORS:
+                        logger.warning(
+                            f"LOAD DATA LOCAL INFILE is not allowed ({e}), "
+                            "falling back to batched inserts."
+                        )
+                        return None
+                    raise
+                # Rows the server truncated or converted are only reported as warnings.
+                cursor.execute("SHOW COUNT(*) WARNINGS")
+                self.warnings = cursor.fetchone()[0]
+            self.progress.emit(rows, 0.0)
+            return rows
+        finally:
+            with self._lock:
+                self._connection_id = None
+            connection.close()
+
+    def _insert_batches(self, started):
+        targets = [
+            (index, column) for index, column in enumerate(self.mapping) if column
+        ]
+        columns = ", ".join(quote_identifier(column) for _, column in targets)
+        placeholders = ", ".join(["%s"] * len(targets))
+        sql = (
+            f"INSERT INTO {quote_identifier(self.table_name)} ({columns}) "
+            f"VALUES ({placeholders})"
+        )
+
+        committed = 0
+        pending = 0
+        last_progress = started
+        with get_pool().connection() as connection, open(
+            self.file_path, newline="", encoding="utf-8-sig"
+        ) as file:
+            connection.select_db(self.database)
+            with self._lock:
+                self._connection_id = connection.thread_id()
+            reader = csv.reader(file, delimiter=self.delimiter)
+            if self.has_header:
+                next(reader, None)
+            cursor = connection.cursor()
+            try:
+                connection.begin()
+                batch = []
+                for record in reader:
+                    if self._stopped:
+                        break
+                    if not record:
+                        continue
+                    batch.append(
+                        tuple(self._value(record, index) for index, _ in targets)
+                    )
+                    if len(batch) < self.batch_size:
+                        continue
+                    # pymysql turns executemany() of an INSERT into multi-row statements.
+                    cursor.executemany(sql, batch)
+                    pending += len(batch)
+                    batch = []
+                    if pending >= self.rows_per_transaction:
+                        connection.commit()
+                        committed += pending
+                        pending = 0
+                        connection.begin()
+                    now = time.perf_counter()
+                    if now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        done = committed + pending
+                        self.progress.emit(done, done / (now - started))
+
+                if self._stopped:
+                    connection.rollback()
+                    return committed
+                if batch:
+                    cursor.executemany(sql, batch)
+                    pending += len(batch)
+                connection.commit()
+                committed += pending
+            except Exception:
+                connection.rollback()
+                logger.error(f"Import stopped after {committed} committed rows.")
+                raise
+            finally:
+                cursor.close()
+                with self._lock:
+                    self._connection_id = None
+        return committed
+
+    def _value(self, record, index):
+        value = record[index] if index < len(record) else ""
+        if value == "" and self.empty_as_null:
+            return None
+        return value
@@ -0,0 +1,168 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import threading
+import time
+import pymysql
+from classes.connectionPool import get_pool
+
+logger = logging.getLogger()
+
+STATUS_QUERY = "SHOW GLOBAL STATUS"
+# Cumulative counters reported as per-second rates.
+RATE_COUNTERS = (
+    "Queries",
+    "Questions",
+    "Bytes_sent",
+    "Bytes_received",
+    "Innodb_buffer_pool_read_requests",
+    "Innodb_buffer_pool_reads",
+)
+RATE_PREFIXES = ("Com_", "Innodb_rows_")
+# Point-in-time values kept in the history as they are.
+GAUGES = ("Threads_connected", "Threads_running", "Open_tables")
+
+
+def status_number(value):
+    """Return a status value as int or float, or None when it is not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+def is_rate_counter(name):
+    return name in RATE_COUNTERS or name.startswith(RATE_PREFIXES)
+
+
+def counter_rates(previous, current):
+    """Per-second rates of the rate counters between two snapshots.
+
+    Counters that went backwards, after a server restart or FLUSH STATUS,
+    are left out rather than reported as negative.
+    """
+    elapsed = current.taken_at - previous.taken_at
+    if elapsed <= 0:
+        return {}
+    rates = {}
+    for name, value in current.values.items():
+        if not is_rate_counter(name):
+            continue
+        before = status_number(previous.values.get(name))
+        after = status_number(value)
+        if before is None or after is None or after < before:
+            continue
+        rates[name] = (after - before) / elapsed
+    return rates
+
+
+def buffer_pool_hit_ratio(rates):
+    """Percent of InnoDB page reads served from the buffer pool, or None when idle."""
+    requests = rates.get("Innodb_buffer_pool_read_requests")
+    if not requests:
+        return None
+    disk_reads = rates.get("Innodb_buffer_pool_reads", 0)
+    return max(0.0, 100.0 * (1 - disk_reads / requests))
+
+
+class StatusSnapshot:
+    """Every global status counter read in one SHOW GLOBAL STATUS round trip."""
+
+    def __init__(self, values, taken_at, query_time):
+        # Variable_name -> value as text, exactly as the server returned it.
+        self.values = values
+        # time.monotonic() when the result arrived, for computing rates.
+        self.taken_at = taken_at
+        self.query_time = query_time
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+    def number(self, name, default=None):
+        value = status_number(self.values.get(name))
+        return default if value is None else value
+
+
+class StatusCollector:
+    """Reads server status counters over one persistent connection.
+
+    The connection is opened outside the pool on first use and kept for
+    the collector's lifetime, so sampling costs one query per refresh
+    instead of a handshake per counter and never takes a pooled connection
+    away from the windows. A connection that went away is reopened on the
+    next read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection = None
+        self.queries = 0
+
+    def _connect(self):
+        if self._connection is not None and self._connection.open:
+            return self._connection
+        self._connection = get_pool().open_connection()
+        logger.debug("Opened the metrics collector connection.")
+        return self._connection
+
+    def query(self, sql, args=None):
+        """Run a query on the collector connection and return all rows."""
+        with self._lock:
+            connection = self._connect()
+            try:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(sql, args)
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+            except (pymysql.OperationalError, pymysql.InterfaceError):
+                self._close()
+                raise
+            self.queries += 1
+            return rows
+
+    def snapshot(self):
+        """Return a StatusSnapshot of every global status counter."""
+        started = time.perf_counter()
+        rows = self.query(STATUS_QUERY)
+        taken_at = time.monotonic()
+        snapshot = StatusSnapshot(
+            {name: value for name, value in rows},
+            taken_at,
+            time.perf_counter() - started,
+        )
+        logger.debug(
+            f"Fetched {len(rows)} status counters in {snapshot.query_time * 1000:.1f} ms."
+        )
+        return snapshot
+
+    def _close(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def close(self):
+        with self._lock:
+            self._close()
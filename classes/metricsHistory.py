@@ -0,0 +1,123 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import math
+import threading
+from array import array
+
+DEFAULT_HISTORY_SIZE = 600
+
+
+class RingBuffer:
+    """Fixed-size buffer of floats that overwrites its oldest value once full.
+
+    The values live in one preallocated array('d'), so appending never
+    allocates and a full history of n samples costs 8n bytes.
+    """
+
+    def __init__(self, capacity=DEFAULT_HISTORY_SIZE):
+        self.capacity = max(1, int(capacity))
+        self._data = array("d", [math.nan]) * self.capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        index = (self._start + self._count) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+        self._data[index] = value
+
+    def last(self, default=math.nan):
+        if not self._count:
+            return default
+        return self._data[(self._start + self._count - 1) % self.capacity]
+
+    def values(self):
+        """Return the values oldest first, as a new array."""
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._data[self._start : end]
+        return self._data[self._start :] + self._data[: end - self.capacity]
+
+    def clear(self):
+        self._start = 0
+        self._count = 0
+
+
+class MetricsHistory:
+    """Named series of samples that share one timeline.
+
+    Each record() appends a timestamp and one value to every series; a
+    series without a value in that sample gets NaN, so index i of every
+    series belongs to the same sample. It is written by the sampler thread
+    and read by the GUI, hence the lock.
+    """
+
+    def __init__(self, capacity=DEFAULT_HISTORY_SIZE):
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._times = RingBuffer(self.capacity)
+        self._series = {}
+
+    def record(self, timestamp, values):
+        """Append one sample: a timestamp and {series name: value}."""
+        with self._lock:
+            for name in values.keys() - self._series.keys():
+                series = RingBuffer(self.capacity)
+                for _ in range(len(self._times)):
+                    series.append(math.nan)
+                self._series[name] = series
+            self._times.append(timestamp)
+            for name, series in self._series.items():
+                value = values.get(name)
+                series.append(math.nan if value is None else float(value))
+
+    def names(self):
+        with self._lock:
+            return list(self._series)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._times)
+
+    def times(self):
+        with self._lock:
+            return self._times.values()
+
+    def last_time(self):
+        """Timestamp of the newest sample, or None while empty."""
+        with self._lock:
+            return self._times.last(None)
+
+    def series(self, name):
+        """Return the values of a series oldest first, or an empty array."""
+        with self._lock:
+            series = self._series.get(name)
+            return series.values() if series is not None else array("d")
+
+    def last(self, name, default=None):
+        with self._lock:
+            series = self._series.get(name)
+            value = series.last() if series is not None else math.nan
+        return default if math.isnan(value) else value
+
+    def clear(self):
+        with self._lock:
+            self._times.clear()
+            self._series.clear()
@@ -0,0 +1,194 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from PyQt5.QtCore import QStandardPaths
+
+logger = logging.getLogger()
+
+APP_DATA_DIRECTORY = "gamma"
+METRICS_DATABASE = "metrics.db"
+# Seconds each resolution is kept for.
+RAW_RETENTION = 6 * 3600
+MINUTE_RETENTION = 7 * 86400
+HOUR_RETENTION = 365 * 86400
+# Old rows are evicted at most this often, in seconds.
+EVICT_INTERVAL = 60
+
+# Rollup table -> (bucket width in seconds, retention in seconds).
+ROLLUPS = {
+    "rollup_1m": (60, MINUTE_RETENTION),
+    "rollup_1h": (3600, HOUR_RETENTION),
+}
+
+
+def metrics_database_path():
+    """Path of the metrics database in the per-user data directory, created if missing.
+
+    The directory comes from QStandardPaths, e.g. ~/.local/share/gamma on
+    Linux or %LOCALAPPDATA%\\gamma on Windows, and falls back to ~/.gamma.
+    """
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation)
+    if base:
+        directory = os.path.join(base, APP_DATA_DIRECTORY)
+    else:
+        directory = os.path.join(os.path.expanduser("~"), "." + APP_DATA_DIRECTORY)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, METRICS_DATABASE)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS samples (
+    series_id INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (series_id, ts)
+) WITHOUT ROWID;
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    series_id INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    minimum REAL NOT NULL,
+    maximum REAL NOT NULL,
+    PRIMARY KEY (series_id, bucket)
+) WITHOUT ROWID;
+""" for table in ROLLUPS
+)
+
+
+class MetricsStore:
+    """Time series of metric samples kept in a local SQLite database.
+
+    Raw samples are kept for RAW_RETENTION seconds. Every sample is also
+    folded into 1-minute and 1-hour min/avg/max buckets as it is recorded,
+    which are kept for MINUTE_RETENTION and HOUR_RETENTION, so the file
+    stays bounded however long the collector runs. query() reads from the
+    finest resolution that still covers the requested range.
+    """
+
+    def __init__(self, path=METRICS_DATABASE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._series_ids = dict(
+            (name, series_id)
+            for series_id, name in self._connection.execute(
+                "SELECT id, name FROM series"
+            )
+        )
+        self._evicted_at = 0.0
+
+    def _series_id(self, name):
+        series_id = self._series_ids.get(name)
+        if series_id is None:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO series (name) VALUES (?)", (name,)
+            )
+            series_id = self._connection.execute(
+                "SELECT id FROM series WHERE name = ?", (name,)
+            ).fetchone()[0]
+            self._series_ids[name] = series_id
+        return series_id
+
+    def record(self, timestamp, values):
+        """Store one sample, {series name: value}, taken at a Unix timestamp."""
+        with self._lock, self._connection:
+            rows = [
+                (self._series_id(name), float(value))
+                for name, value in values.items()
+                if value is not None and not math.isnan(value)
+            ]
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO samples (series_id, ts, value) VALUES (?, ?, ?)",
+                [(series_id, timestamp, value) for series_id, value in rows],
+            )
+            for table, (width, _) in ROLLUPS.items():
+                bucket = int(timestamp // width * width)
+                self._connection.executemany(
+                    f"INSERT INTO {table} "
+                    "(series_id, bucket, count, total, minimum, maximum) "
+                    "VALUES (?, ?, 1, ?, ?, ?) "
+                    "ON CONFLICT (series_id, bucket) DO UPDATE SET "
+                    "count = count + 1, total = total + excluded.total, "
+                    "minimum = MIN(minimum, excluded.minimum), "
+                    "maximum = MAX(maximum, excluded.maximum)",
+                    [
+                        (series_id, bucket, value, value, value)
+                        for series_id, value in rows
+                    ],
+                )
+            if time.monotonic() - self._evicted_at >= EVICT_INTERVAL:
+                self._evict(timestamp)
+
+    def _evict(self, now):
+        self._evicted_at = time.monotonic()
+        deleted = self._connection.execute(
+            "DELETE FROM samples WHERE ts < ?", (now - RAW_RETENTION,)
+        ).rowcount
+        for table, (_, retention) in ROLLUPS.items():
+            deleted += self._connection.execute(
+                f"DELETE FROM {table} WHERE bucket < ?", (now - retention,)
+            ).rowcount
+        if deleted:
+            logger.debug(f"Evicted {deleted} expired metric rows from {self.path}.")
+
+    def query(self, name, start, end=None):
+        """Return [(timestamp, minimum, average, maximum), ...] of a series between two Unix times.
+
+        Raw samples have the same value for all three.
+        """
+        end = time.time() if end is None else end
+        age = time.time() - start
+        with self._lock:
+            series_id = self._series_ids.get(name)
+            if series_id is None:
+                return []
+            if age <= RAW_RETENTION:
+                sql = (
+                    "SELECT ts, value, value, value FROM samples "
+                    "WHERE series_id = ? AND ts BETWEEN ? AND ? ORDER BY ts"
+                )
+            else:
+                table = "rollup_1m" if age <= MINUTE_RETENTION else "rollup_1h"
+                width = ROLLUPS[table][0]
+                start = start // width * width
+                sql = (
+                    f"SELECT bucket, minimum, total / count, maximum FROM {table} "
+                    "WHERE series_id = ? AND bucket BETWEEN ? AND ? ORDER BY bucket"
+                )
+            return self._connection.execute(sql, (series_id, start, end)).fetchall()
+
+    def series_names(self):
+        """Names of every stored series, sorted."""
+        with self._lock:
+            return sorted(self._series_ids)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
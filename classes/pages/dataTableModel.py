@@ -0,0 +1,225 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import re
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QColor
+
+MAX_DISPLAY_LENGTH = 200
+
+
+def format_value(value):
+    """Format a single MySQL value for display in a cell."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (bytes, bytearray)):
+        text = "0x" + bytes(value[: MAX_DISPLAY_LENGTH // 2]).hex()
+    else:
+        text = str(value)
+    if len(text) > MAX_DISPLAY_LENGTH:
+        return text[:MAX_DISPLAY_LENGTH] + "..."
+    return text
+
+
+class RowStoreModel(QAbstractTableModel):
+    """Read-only table model over a plain list of row tuples.
+
+    No per-cell objects are created; the view asks for the cells it is about
+    to paint and only those values are formatted, so the cost of a repaint
+    depends on the viewport and not on the number of rows held.
+
+    Rows can also be loaded lazily: while more_available is set, the view's
+    fetchMore() calls fetch_more_callback, which should deliver the next
+    batch through append_rows().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = []
+        self.rows = []
+        self.more_available = False
+        self.fetch_more_callback = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            return format_value(self.rows[index.row()][index.column()])
+        if role == Qt.ForegroundRole:
+            if self.rows[index.row()][index.column()] is None:
+                return QColor("#888")
+        return QVariant()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.more_available and self.fetch_more_callback is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        # Ask for one batch at a time; append_rows() re-enables fetching.
+        self.more_available = False
+        self.fetch_more_callback()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            if section < len(self.columns):
+                return self.columns[section]
+            return QVariant()
+        return str(section + 1)
+
+    def set_columns(self, columns):
+        """Replace the columns and drop all rows."""
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.rows = []
+        self.more_available = False
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """Append a batch of row tuples to the end of the store."""
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def set_rows(self, rows):
+        """Replace all rows, keeping the current columns."""
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.more_available = False
+        self.endResetModel()
+
+    def clear(self):
+        """Drop all columns and rows."""
+        self.set_columns([])
+
+
+NUMBER_PATTERN = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+INCREASE_COLOR = QColor("#81c784")
+DECREASE_COLOR = QColor("#e57373")
+CHANGED_COLOR = QColor("#ffd54f")
+
+
+def leading_number(text):
+    """The number a metric value starts with, or None."""
+    match = NUMBER_PATTERN.match(text)
+    return float(match.group(1)) if match else None
+
+
+class MetricsTableModel(QAbstractTableModel):
+    """Two-column (metric, value) model that is updated in place by metric name.
+
+    update() compares the new values with the shown ones and emits
+    dataChanged only for the values that differ, so a refresh where little
+    changed repaints little and no cells are rebuilt. Values that changed
+    in the latest update are colored by direction: green when the leading
+    number went up, red when it went down, and amber otherwise.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.values = {}
+        self.rows_by_name = {}
+        # metric name -> +1, -1 or 0 for the values changed by the last update.
+        self.changes = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 2
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        name = self.names[index.row()]
+        if role == Qt.DisplayRole:
+            return name if index.column() == 0 else self.values[name]
+        if role == Qt.ForegroundRole:
+            if index.column() == 1 and name in self.changes:
+                direction = self.changes[name]
+                if direction > 0:
+                    return INCREASE_COLOR
+                if direction < 0:
+                    return DECREASE_COLOR
+                return CHANGED_COLOR
+            return QColor("white")
+        return QVariant()
+
+    def _value_changed(self, row):
+        index = self.index(row, 1)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def update(self, metrics):
+        """Show {metric: value}, touching only the rows whose value changed."""
+        changes = {}
+        for name, value in metrics.items():
+            text = str(value)
+            old = self.values.get(name)
+            if old == text:
+                continue
+            if old is not None:
+                before, after = leading_number(old), leading_number(text)
+                if before is None or after is None or before == after:
+                    changes[name] = 0
+                else:
+                    changes[name] = 1 if after > before else -1
+            self.values[name] = text
+            if name not in self.rows_by_name:
+                row = len(self.names)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.names.append(name)
+                self.rows_by_name[name] = row
+                self.endInsertRows()
+
+        removed = [name for name in self.names if name not in metrics]
+        if removed:
+            self.beginResetModel()
+            self.names = [name for name in self.names if name in metrics]
+            self.rows_by_name = {name: row for row, name in enumerate(self.names)}
+            for name in removed:
+                del self.values[name]
+            self.changes = {}
+            self.endResetModel()
+
+        # Rows highlighted by the previous update lose their color.
+        previous, self.changes = self.changes, changes
+        for name in previous.keys() | changes.keys():
+            row = self.rows_by_name.get(name)
+            if row is not None:
+                self._value_changed(row)
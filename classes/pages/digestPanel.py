@@ -0,0 +1,191 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import pymysql
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from classes.pages.dataTableModel import RowStoreModel
+from classes.statementDigests import PICOSECONDS_PER_MS, SORT_KEYS, DigestTracker
+
+logger = logging.getLogger()
+
+# Seconds between automatic refreshes while the panel is shown.
+DIGEST_REFRESH_INTERVAL = 10
+SINCE_REFRESH = "Since last refresh"
+SINCE_START = "Since server start"
+DIGEST_HEADERS = [
+    "Schema",
+    "Statement",
+    "Calls",
+    "Δ Calls",
+    "Latency (ms)",
+    "Δ Latency (ms)",
+    "Avg (ms)",
+    "Rows examined",
+    "Δ Rows examined",
+    "Rows sent",
+    "Δ Rows sent",
+]
+
+
+class DigestFetcherThread(QThread):
+    """Refreshes a DigestTracker on the collector connection."""
+
+    refreshed = pyqtSignal(int)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, collector, tracker, parent=None):
+        super().__init__(parent)
+        self.collector = collector
+        self.tracker = tracker
+
+    def run(self):
+        try:
+            self.refreshed.emit(self.tracker.refresh(self.collector))
+        except pymysql.MySQLError as e:
+            logger.error(f"Failed to fetch statement digests: {e}")
+            self.error_occurred.emit(str(e))
+
+
+class DigestPanel(QWidget):
+    """Top statements from performance_schema, in total or since the previous refresh."""
+
+    def __init__(self, collector, parent=None):
+        super().__init__(parent)
+        self.tracker = DigestTracker()
+        self.fetcher_thread = DigestFetcherThread(collector, self.tracker)
+        self.fetcher_thread.refreshed.connect(self.on_refreshed)
+        self.fetcher_thread.error_occurred.connect(self.on_error)
+        self.fetcher_thread.finished.connect(self.update_table)
+
+        self.sort_combobox = QComboBox(self)
+        self.sort_combobox.addItems(list(SORT_KEYS))
+        self.sort_combobox.currentIndexChanged.connect(self.update_table)
+        self.mode_combobox = QComboBox(self)
+        self.mode_combobox.addItems([SINCE_REFRESH, SINCE_START])
+        self.mode_combobox.currentIndexChanged.connect(self.update_table)
+        self.refresh_button = QPushButton("Refresh", self)
+        self.refresh_button.clicked.connect(self.refresh)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Top by", self))
+        controls.addWidget(self.sort_combobox)
+        controls.addWidget(self.mode_combobox)
+        controls.addStretch()
+        controls.addWidget(self.refresh_button)
+
+        self.status_label = QLabel("", self)
+        self.digest_model = RowStoreModel(self)
+        self.digest_model.set_columns(DIGEST_HEADERS)
+        self.digest_table = QTableView(self)
+        self.digest_table.setModel(self.digest_model)
+        self.digest_table.setAlternatingRowColors(True)
+        self.digest_table.setWordWrap(False)
+        self.digest_table.verticalHeader().setVisible(False)
+        self.digest_table.setColumnWidth(1, 320)
+        self.digest_table.setStyleSheet("""
+            QTableView {
+                background-color: #333;
+                alternate-background-color: #444;
+                color: white;
+                border: none;
+                gridline-color: #444;
+            }
+            QHeaderView::section {
+                background-color: #333;
+                color: white;
+                padding: 4px;
+                font-weight: bold;
+                border: none;
+            }
+        """)
+
+        layout = QVBoxLayout()
+        layout.addLayout(controls)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.digest_table)
+        self.setLayout(layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(DIGEST_REFRESH_INTERVAL * 1000)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        if not self.fetcher_thread.isRunning():
+            self.fetcher_thread.start()
+
+    def stop(self):
+        """Stop refreshing and wait for a running refresh."""
+        self.refresh_timer.stop()
+        self.fetcher_thread.wait()
+
+    def on_refreshed(self, changed):
+        if not self.tracker.digests:
+            self.status_label.setText(
+                "No statement digests. performance_schema may be disabled on this server."
+            )
+        elif self.tracker.refreshes == 1:
+            self.status_label.setText(
+                f"{len(self.tracker.digests):,} statement digests; "
+                "changes show from the next refresh."
+            )
+        else:
+            self.status_label.setText(
+                f"{len(self.tracker.digests):,} statement digests, "
+                f"{changed:,} ran since the previous refresh."
+            )
+
+    def on_error(self, message):
+        self.status_label.setText(f"Could not read statement digests: {message}")
+
+    def update_table(self):
+        if self.fetcher_thread.isRunning():
+            # Redrawn once the running refresh finishes.
+            return
+        counter = SORT_KEYS[self.sort_combobox.currentText()]
+        since_refresh = self.mode_combobox.currentText() == SINCE_REFRESH
+        self.digest_model.set_rows(
+            (
+                stats.schema,
+                " ".join(stats.text.split()),
+                stats.calls,
+                stats.delta["calls"],
+                f"{stats.latency_ms:,.1f}",
+                f"{stats.delta['latency'] / PICOSECONDS_PER_MS:,.1f}",
+                f"{stats.average_latency_ms:,.2f}",
+                stats.rows_examined,
+                stats.delta["rows_examined"],
+                stats.rows_sent,
+                stats.delta["rows_sent"],
+            )
+            for stats in self.tracker.top(counter, since_refresh)
+        )
@@ -0,0 +1,143 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+from classes.pages.dataTableModel import RowStoreModel
+
+logger = logging.getLogger()
+
+# Range name -> seconds back from now.
+HISTORY_RANGES = {
+    "Last hour": 3600,
+    "Last 6 hours": 6 * 3600,
+    "Last 24 hours": 86400,
+    "Last 7 days": 7 * 86400,
+    "Last 30 days": 30 * 86400,
+}
+HISTORY_HEADERS = ["Time", "Minimum", "Average", "Maximum"]
+
+
+class HistoryPanel(QWidget):
+    """Stored samples of one metric over a time range, from the MetricsStore.
+
+    Recent ranges show the raw samples, longer ones the 1-minute or 1-hour
+    min/avg/max rollups, so a week back is still a few thousand rows.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+
+        self.series_combobox = QComboBox(self)
+        self.series_combobox.currentIndexChanged.connect(self.update_table)
+        self.range_combobox = QComboBox(self)
+        self.range_combobox.addItems(list(HISTORY_RANGES))
+        self.range_combobox.currentIndexChanged.connect(self.update_table)
+        self.refresh_button = QPushButton("Refresh", self)
+        self.refresh_button.clicked.connect(self.update_table)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Metric", self))
+        controls.addWidget(self.series_combobox)
+        controls.addWidget(self.range_combobox)
+        controls.addStretch()
+        controls.addWidget(self.refresh_button)
+
+        self.status_label = QLabel("", self)
+        self.history_model = RowStoreModel(self)
+        self.history_model.set_columns(HISTORY_HEADERS)
+        self.history_table = QTableView(self)
+        self.history_table.setModel(self.history_model)
+        self.history_table.setAlternatingRowColors(True)
+        self.history_table.verticalHeader().setVisible(False)
+        self.history_table.setColumnWidth(0, 180)
+        self.history_table.setStyleSheet("""
+            QTableView {
+                background-color: #333;
+                alternate-background-color: #444;
+                color: white;
+                border: none;
+                gridline-color: #444;
+            }
+            QHeaderView::section {
+                background-color: #333;
+                color: white;
+                padding: 4px;
+                font-weight: bold;
+                border: none;
+            }
+        """)
+
+        layout = QVBoxLayout()
+        layout.addLayout(controls)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.history_table)
+        self.setLayout(layout)
+
+        if self.store is None:
+            self.status_label.setText("The metrics store could not be opened.")
+            self.series_combobox.setEnabled(False)
+            self.range_combobox.setEnabled(False)
+            self.refresh_button.setEnabled(False)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_series()
+
+    def update_series(self):
+        """Refill the metric list with the series stored so far."""
+        if self.store is None:
+            return
+        current = self.series_combobox.currentText()
+        self.series_combobox.blockSignals(True)
+        self.series_combobox.clear()
+        self.series_combobox.addItems(self.store.series_names())
+        if current:
+            self.series_combobox.setCurrentText(current)
+        self.series_combobox.blockSignals(False)
+        self.update_table()
+
+    def update_table(self):
+        name = self.series_combobox.currentText()
+        if self.store is None or not name:
+            return
+        start = time.time() - HISTORY_RANGES[self.range_combobox.currentText()]
+        try:
+            rows = self.store.query(name, start)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read the history of {name}: {e}")
+            self.status_label.setText(f"Could not read the history of {name}: {e}")
+            return
+        self.history_model.set_rows(
+            (
+                datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+                f"{minimum:,.2f}",
+                f"{average:,.2f}",
+                f"{maximum:,.2f}",
+            )
+            for timestamp, minimum, average, maximum in rows
+        )
+        self.status_label.setText(f"{len(rows):,} points of {name}.")
@@ -0,0 +1,325 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+from PyQt5.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QPushButton,
+    QLabel,
+    QLineEdit,
+    QComboBox,
+    QCheckBox,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QFileDialog,
+    QMessageBox,
+    QProgressDialog,
+    QDesktopWidget,
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QIcon
+from classes.importWorker import (
+    DEFAULT_INSERT_BATCH,
+    DEFAULT_ROWS_PER_TRANSACTION,
+    ImportWorker,
+    read_csv_preview,
+)
+from classes.rowStreamer import stop_in_background
+
+logger = logging.getLogger()
+
+DELIMITERS = {"Comma (,)": ",", "Semicolon (;)": ";", "Tab": "\t", "Pipe (|)": "|"}
+SKIP_COLUMN = "(skip)"
+
+
+class ImportWizard(QDialog):
+    """Dialog that maps the columns of a CSV file to a table and imports it."""
+
+    def __init__(self, mysql_manager, database, tables, table_name=None, parent=None):
+        super().__init__(parent)
+        self.mysql_manager = mysql_manager
+        self.database = database
+        self.table_columns = []
+        self.preview = []
+        self.worker = None
+        self.setWindowTitle(f"Import Data into {database}")
+        self.setWindowIcon(QIcon("assets/gamma.ico"))
+        self.setGeometry(0, 0, 800, 600)
+        self.center_window()
+        self.setStyleSheet("background-color: #111; color: #fff;")
+
+        layout = QVBoxLayout()
+        title = QLabel("Import CSV")
+        title.setFont(QFont("Arial", 16))
+        layout.addWidget(title)
+
+        form = QFormLayout()
+        file_layout = QHBoxLayout()
+        self.file_input = QLineEdit(self)
+        self.file_input.setPlaceholderText("CSV file to import...")
+        self.file_input.editingFinished.connect(self.load_preview)
+        browse_button = QPushButton("Browse...", self)
+        browse_button.clicked.connect(self.choose_file)
+        file_layout.addWidget(self.file_input)
+        file_layout.addWidget(browse_button)
+        form.addRow("File:", file_layout)
+
+        self.delimiter_combobox = QComboBox(self)
+        self.delimiter_combobox.addItems(list(DELIMITERS))
+        self.delimiter_combobox.currentTextChanged.connect(self.load_preview)
+        form.addRow("Delimiter:", self.delimiter_combobox)
+
+        self.header_checkbox = QCheckBox("First line contains column names", self)
+        self.header_checkbox.setChecked(True)
+        self.header_checkbox.stateChanged.connect(self.update_mapping)
+        form.addRow("", self.header_checkbox)
+
+        self.empty_null_checkbox = QCheckBox("Import empty values as NULL", self)
+        self.empty_null_checkbox.setChecked(True)
+        form.addRow("", self.empty_null_checkbox)
+
+        self.table_combobox = QComboBox(self)
+        self.table_combobox.addItems(tables)
+        if table_name:
+            self.table_combobox.setCurrentText(table_name)
+        self.table_combobox.currentTextChanged.connect(self.load_table_columns)
+        form.addRow("Table:", self.table_combobox)
+
+        self.load_data_checkbox = QCheckBox(
+            "Use LOAD DATA LOCAL INFILE (falls back to batched INSERTs)", self
+        )
+        self.load_data_checkbox.setChecked(True)
+        form.addRow("", self.load_data_checkbox)
+
+        self.transaction_size_input = QSpinBox(self)
+        self.transaction_size_input.setRange(DEFAULT_INSERT_BATCH, 10000000)
+        self.transaction_size_input.setSingleStep(DEFAULT_INSERT_BATCH)
+        self.transaction_size_input.setValue(DEFAULT_ROWS_PER_TRANSACTION)
+        self.transaction_size_input.setSuffix(" rows")
+        self.transaction_size_input.setToolTip(
+            "Rows committed per transaction when importing with INSERT statements."
+        )
+        form.addRow("Commit every:", self.transaction_size_input)
+        layout.addLayout(form)
+
+        self.mapping_table = QTableWidget(self)
+        self.mapping_table.setColumnCount(3)
+        self.mapping_table.setHorizontalHeaderLabels(
+            ["File Column", "Sample", "Table Column"]
+        )
+        self.mapping_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.mapping_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.mapping_table.setStyleSheet("""
+            QTableWidget {
+                background-color: #222;
+                color: #fff;
+                border: 1px solid #555;
+            }
+            QHeaderView::section {
+                background-color: #333;
+                color: #fff;
+            }
+        """)
+        layout.addWidget(self.mapping_table)
+
+        self.import_button = QPushButton("Import", self)
+        self.import_button.setStyleSheet("""
+            QPushButton {
+                background-color: #333;
+                color: #fff;
+                border: 1px solid #555;
+                border-radius: 5px;
+                padding: 9px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #444;
+                border-color: #777;
+            }
+            QPushButton:disabled {
+                color: #666;
+            }
+        """)
+        self.import_button.setEnabled(False)
+        self.import_button.clicked.connect(self.start_import)
+        layout.addWidget(self.import_button)
+        self.setLayout(layout)
+
+        self.load_table_columns(self.table_combobox.currentText())
+
+    def choose_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Data",
+            "",
+            "CSV Files (*.csv *.tsv *.txt);;All Files (*)",
+        )
+        if file_path:
+            self.file_input.setText(file_path)
+            if file_path.lower().endswith(".tsv"):
+                self.delimiter_combobox.setCurrentText("Tab")
+            self.load_preview()
+
+    @property
+    def delimiter(self):
+        return DELIMITERS[self.delimiter_combobox.currentText()]
+
+    def load_preview(self):
+        """Read the first lines of the file to offer its columns for mapping."""
+        file_path = self.file_input.text().strip()
+        if not file_path:
+            return
+        try:
+            self.preview = read_csv_preview(file_path, self.delimiter)
+        except (OSError, UnicodeDecodeError) as e:
+            self.preview = []
+            logger.error(f"Failed to read {file_path}: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to read the file:\n{e}")
+        self.update_mapping()
+
+    def load_table_columns(self, table_name):
+        """Describe the target table in the background."""
+        if not table_name:
+            return
+        self.mysql_manager.get_table_description(
+            table_name, on_result=self.set_table_columns, database=self.database
+        )
+
+    def set_table_columns(self, description):
+        self.table_columns = [row[0] for row in description]
+        self.update_mapping()
+
+    def update_mapping(self):
+        """Fill the mapping table, matching file columns to table columns by name or position."""
+        has_header = self.header_checkbox.isChecked()
+        width = max((len(row) for row in self.preview), default=0)
+        names = list(self.preview[0]) if has_header and self.preview else []
+        names += [f"Column {index + 1}" for index in range(len(names), width)]
+        sample_row = (
+            self.preview[1 if has_header else 0]
+            if len(self.preview) > int(has_header)
+            else []
+        )
+        lookup = {column.lower(): column for column in self.table_columns}
+
+        self.mapping_table.setRowCount(width)
+        for index, name in enumerate(names):
+            self.mapping_table.setItem(index, 0, QTableWidgetItem(name))
+            sample = sample_row[index] if index < len(sample_row) else ""
+            self.mapping_table.setItem(index, 1, QTableWidgetItem(sample))
+
+            combobox = QComboBox(self)
+            combobox.addItems([SKIP_COLUMN] + self.table_columns)
+            if has_header and name.strip().lower() in lookup:
+                combobox.setCurrentText(lookup[name.strip().lower()])
+            elif not has_header and index < len(self.table_columns):
+                combobox.setCurrentText(self.table_columns[index])
+            self.mapping_table.setCellWidget(index, 2, combobox)
+        self.import_button.setEnabled(bool(width and self.table_columns))
+
+    def mapping(self):
+        """Table column of every file column, None for skipped ones."""
+        mapping = []
+        for index in range(self.mapping_table.rowCount()):
+            column = self.mapping_table.cellWidget(index, 2).currentText()
+            mapping.append(None if column == SKIP_COLUMN else column)
+        return mapping
+
+    def start_import(self):
+        mapping = self.mapping()
+        targets = [column for column in mapping if column]
+        if not targets:
+            QMessageBox.warning(self, "Import", "Map at least one column.")
+            return
+        if len(targets) != len(set(targets)):
+            QMessageBox.warning(
+                self, "Import", "Each table column can only be mapped once."
+            )
+            return
+
+        table_name = self.table_combobox.currentText()
+        worker = ImportWorker(
+            self.database,
+            table_name,
+            self.file_input.text().strip(),
+            mapping,
+            delimiter=self.delimiter,
+            has_header=self.header_checkbox.isChecked(),
+            empty_as_null=self.empty_null_checkbox.isChecked(),
+            use_load_data=self.load_data_checkbox.isChecked(),
+            rows_per_transaction=self.transaction_size_input.value(),
+        )
+        dialog = QProgressDialog(
+            f"Importing into {table_name}...", "Cancel", 0, 0, self
+        )
+        dialog.setWindowTitle("Import Data")
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(worker.stop)
+
+        def on_progress(rows, rate):
+            dialog.setLabelText(f"Imported {rows:,} rows ({rate:,.0f} rows/s)...")
+
+        def on_finished(rows, elapsed, method):
+            dialog.close()
+            rate = rows / elapsed if elapsed > 0 else 0.0
+            message = (
+                f"Imported {rows:,} rows into {table_name} in {elapsed:.1f}s "
+                f"({rate:,.0f} rows/s) using {method}."
+            )
+            if worker.warnings:
+                message += f"\nThe server reported {worker.warnings:,} warnings."
+            QMessageBox.information(self, "Import Successful", message)
+
+        def on_error(message):
+            dialog.close()
+            QMessageBox.critical(
+                self, "Import Failed", f"Failed to import data:\n{message}"
+            )
+
+        def on_done():
+            dialog.close()
+            self.import_button.setEnabled(True)
+            if self.worker is worker:
+                self.worker = None
+
+        worker.progress.connect(on_progress)
+        worker.import_finished.connect(on_finished)
+        worker.error_occurred.connect(on_error)
+        worker.finished.connect(on_done)
+        self.worker = worker
+        self.import_button.setEnabled(False)
+        worker.start()
+        dialog.show()
+
+    def closeEvent(self, event):
+        """Cancel a running import when the dialog is closed."""
+        if self.worker is not None:
+            stop_in_background(self.worker)
+            self.worker = None
+        event.accept()
+
+    def center_window(self):
+        """Center the window on the screen."""
+        qr = self.frameGeometry()
+        cp = QDesktopWidget().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
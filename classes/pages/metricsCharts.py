@@ -0,0 +1,188 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import math
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+from PyQt5.QtCore import QPointF, QRect, Qt
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+
+BACKGROUND_COLOR = QColor("#333")
+GRID_COLOR = QColor("#444")
+TEXT_COLOR = QColor("white")
+# Horizontal pixels between two samples.
+POINT_SPACING = 3
+# Headroom left above the largest value of an auto-scaled chart.
+SCALE_HEADROOM = 1.25
+
+
+def core_colors(count):
+    """Distinct line colors for count series, spread around the hue circle."""
+    return [
+        QColor.fromHsv(int(360 * i / max(1, count)), 160, 230) for i in range(count)
+    ]
+
+
+class SparklineWidget(QWidget):
+    """Line chart of one or more MetricsHistory series.
+
+    The lines are drawn into a pixmap the size of the widget. For every new
+    sample append_latest() scrolls that pixmap left by POINT_SPACING pixels
+    and draws only the new segments at the right edge, so a tick costs the
+    same however much history there is. The whole chart is redrawn from
+    the ring buffers only when the widget is resized or an auto-scaled
+    chart outgrows its scale.
+    """
+
+    def __init__(
+        self,
+        history,
+        title,
+        series_names,
+        colors=None,
+        maximum=None,
+        unit="",
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.history = history
+        self.title = title
+        self.series_names = list(series_names)
+        self.colors = list(colors or core_colors(len(self.series_names)))
+        # A fixed maximum, e.g. 100 for percentages; None scales to the data.
+        self.fixed_maximum = maximum
+        self.maximum = maximum or 1.0
+        self.unit = unit
+        self.pixmap = None
+        self.last_time = None
+        self.last_values = {}
+        self.setMinimumSize(200, 70)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setFixedHeight(90)
+
+    def y_for(self, value):
+        height = self.pixmap.height() - 4
+        ratio = min(max(value / self.maximum, 0.0), 1.0)
+        return 2 + height * (1 - ratio)
+
+    def _draw_grid(self, painter, left, right):
+        painter.setPen(QPen(GRID_COLOR, 1, Qt.DotLine))
+        for fraction in (0.25, 0.5, 0.75):
+            y = int(self.pixmap.height() * fraction)
+            painter.drawLine(left, y, right, y)
+
+    def redraw(self):
+        """Draw every visible sample again from the history."""
+        self.pixmap = QPixmap(self.size())
+        self.pixmap.fill(BACKGROUND_COLOR)
+        visible = self.pixmap.width() // POINT_SPACING + 1
+        series = {
+            name: self.history.series(name)[-visible:] for name in self.series_names
+        }
+        if self.fixed_maximum is None:
+            peak = max(
+                (
+                    value
+                    for values in series.values()
+                    for value in values
+                    if not math.isnan(value)
+                ),
+                default=0.0,
+            )
+            self.maximum = max(1.0, peak * SCALE_HEADROOM)
+
+        painter = QPainter(self.pixmap)
+        self._draw_grid(painter, 0, self.pixmap.width())
+        painter.setRenderHint(QPainter.Antialiasing)
+        right = self.pixmap.width() - 1
+        for name, color in zip(self.series_names, self.colors):
+            values = series[name]
+            painter.setPen(QPen(color, 1.5))
+            previous = None
+            for index, value in enumerate(values):
+                x = right - (len(values) - 1 - index) * POINT_SPACING
+                point = None if math.isnan(value) else QPointF(x, self.y_for(value))
+                if previous is not None and point is not None:
+                    painter.drawLine(previous, point)
+                previous = point
+            self.last_values[name] = values[-1] if len(values) else math.nan
+        painter.end()
+        self.last_time = self.history.last_time()
+        self.update()
+
+    def append_latest(self):
+        """Draw the newest sample of the history, if it has not been drawn yet."""
+        timestamp = self.history.last_time()
+        if timestamp is None or timestamp == self.last_time:
+            return
+        if self.pixmap is None or self.pixmap.size() != self.size():
+            self.redraw()
+            return
+        self.last_time = timestamp
+
+        latest = {name: self.history.last(name, math.nan) for name in self.series_names}
+        if self.fixed_maximum is None and any(
+            value > self.maximum for value in latest.values() if not math.isnan(value)
+        ):
+            self.redraw()
+            return
+
+        width = self.pixmap.width()
+        self.pixmap.scroll(-POINT_SPACING, 0, self.pixmap.rect())
+        painter = QPainter(self.pixmap)
+        strip = QRect(width - POINT_SPACING, 0, POINT_SPACING, self.pixmap.height())
+        painter.fillRect(strip, BACKGROUND_COLOR)
+        self._draw_grid(painter, strip.left(), strip.right())
+        painter.setRenderHint(QPainter.Antialiasing)
+        right = width - 1
+        for name, color in zip(self.series_names, self.colors):
+            previous = self.last_values.get(name, math.nan)
+            value = latest[name]
+            if not math.isnan(previous) and not math.isnan(value):
+                painter.setPen(QPen(color, 1.5))
+                painter.drawLine(
+                    QPointF(right - POINT_SPACING, self.y_for(previous)),
+                    QPointF(right, self.y_for(value)),
+                )
+            self.last_values[name] = value
+        painter.end()
+        self.update()
+
+    def current_text(self):
+        values = [
+            value
+            for value in (
+                self.last_values.get(name, math.nan) for name in self.series_names
+            )
+            if not math.isnan(value)
+        ]
+        if not values:
+            return ""
+        if len(values) > 1:
+            return f"avg {sum(values) / len(values):,.1f}{self.unit}"
+        return f"{values[0]:,.1f}{self.unit}"
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.redraw()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.pixmap is not None:
+            painter.drawPixmap(0, 0, self.pixmap)
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(QFont("Arial", 9, QFont.Bold))
+        margin = self.rect().adjusted(6, 4, -6, -4)
+        painter.drawText(margin, Qt.AlignLeft | Qt.AlignTop, self.title)
+        painter.drawText(margin, Qt.AlignRight | Qt.AlignTop, self.current_text())
+        painter.end()
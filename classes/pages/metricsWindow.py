@@ -1,328 +1,583 @@
-# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
-#
-# This file is part of gamma.
-#
-# This file may be used only with explicit permission from AlmightyNan.
-# Redistribution, modification, or commercial use without prior written
-# consent is strictly prohibited.
-#
-# Proper credit must be given to AlmightyNan, and it must be displayed
-# visibly without shortening or obscuring the text.
-#
-# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
-# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
-
-import os
-import logging
-import psutil
-import platform
-import socket
-import pymysql
-from PyQt5.QtWidgets import (
-    QApplication,
-    QDialog,
-    QVBoxLayout,
-    QTableWidget,
-    QFrame,
-    QTableWidgetItem,
-    QDesktopWidget,
-    QLabel,
-)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QIcon
-
-logger = logging.getLogger()
-
-
-class MetricsFetcherThread(QThread):
-    """Thread for fetching performance metrics without blocking the main UI thread."""
-
-    metrics_fetched = pyqtSignal(dict)
-
-    def run(self):
-        metrics = {}
-
-        metrics["Server Uptime"] = self.get_server_uptime()
-        metrics["Active Connections"] = self.get_threads_connected()
-        metrics["Slow Queries"] = self.get_slow_queries()
-        metrics["Queries Per Second (QPS)"] = self.get_queries_per_second()
-        metrics["Open Tables"] = self.get_open_tables()
-
-        metrics["CPU Usage"] = f"{self.get_cpu_usage()}%"
-        metrics["CPU Core Usage"] = self.get_cpu_core_usage()
-        metrics["Architecture"] = self.get_architecture()
-        metrics["Operating System"] = self.get_os()
-        metrics["Hostname"] = self.get_hostname()
-        metrics["System Uptime"] = self.get_system_uptime()
-        metrics["Memory Usage"] = self.get_memory_usage()
-        metrics["Disk I/O"] = self.get_disk_io()
-        metrics["Network Traffic"] = self.get_network_traffic()
-
-        self.metrics_fetched.emit(metrics)
-
-    def get_server_uptime(self):
-        try:
-            connection = pymysql.connect(
-                host="localhost", user="root", password="", database="mysql"
-            )
-            cursor = connection.cursor()
-            cursor.execute("SHOW STATUS WHERE `Variable_name` = 'Uptime';")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-
-            uptime = int(result[1]) if result else 0
-            logger.debug(f"Fetched server uptime: {uptime} seconds.")
-            return f"{uptime} seconds"
-        except pymysql.MySQLError as e:
-            logger.error(f"Failed to fetch server uptime: {e}")
-            return "SQL console must be opened to view this metric."
-
-    def get_threads_connected(self):
-        """Get the number of threads connected to MySQL."""
-        try:
-            connection = pymysql.connect(
-                host="localhost", user="root", password="", database="mysql"
-            )
-            cursor = connection.cursor()
-            cursor.execute("SHOW STATUS WHERE `Variable_name` = 'Threads_connected';")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-
-            logger.debug(f"Fetched threads connected: {result[1] if result else 'N/A'}")
-            return result[1] if result else "N/A"
-        except pymysql.MySQLError as e:
-            logger.error(f"Failed to fetch threads connected: {e}")
-            return "SQL console must be opened to view this metric."
-
-    def get_slow_queries(self):
-        """Get the number of slow queries."""
-        try:
-            connection = pymysql.connect(
-                host="localhost", user="root", password="", database="mysql"
-            )
-            cursor = connection.cursor()
-            cursor.execute("SHOW STATUS WHERE `Variable_name` = 'Slow_queries';")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-
-            logger.debug(
-                f"Fetched slow queries count: {result[1] if result else 'N/A'}"
-            )
-            return result[1] if result else "N/A"
-        except pymysql.MySQLError as e:
-            logger.error(f"Failed to fetch slow queries count: {e}")
-            return "SQL console must be opened to view this metric."
-
-    def get_queries_per_second(self):
-        """Get queries per second (QPS)."""
-        try:
-            connection = pymysql.connect(
-                host="localhost", user="root", password="", database="mysql"
-            )
-            cursor = connection.cursor()
-            cursor.execute("SHOW STATUS WHERE `Variable_name` = 'Queries';")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-
-            total_queries = int(result[1]) if result else 0
-            qps = total_queries / 60
-            logger.debug(f"Fetched queries per second: {qps:.2f} QPS")
-            return f"{qps:.2f} QPS"
-        except pymysql.MySQLError as e:
-            logger.error(f"Failed to fetch queries per second: {e}")
-            return "SQL console must be opened to view this metric."
-
-    def get_open_tables(self):
-        """Get the number of open tables in MySQL."""
-        try:
-            connection = pymysql.connect(
-                host="localhost", user="root", password="", database="mysql"
-            )
-            cursor = connection.cursor()
-            cursor.execute("SHOW STATUS WHERE `Variable_name` = 'Open_tables';")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-
-            logger.debug(f"Fetched open tables count: {result[1] if result else 'N/A'}")
-            return result[1] if result else "N/A"
-        except pymysql.MySQLError as e:
-            logger.error(f"Failed to fetch open tables count: {e}")
-            return "SQL console must be opened to view this metric."
-
-    def get_cpu_usage(self):
-        """Get the CPU usage of the server."""
-        cpu_usage = psutil.cpu_percent(interval=1)
-        logger.debug(f"Fetched CPU usage: {cpu_usage}%")
-        return cpu_usage
-
-    def get_cpu_core_usage(self):
-        """Get CPU usage per core."""
-        core_usage = [f"{x}%" for x in psutil.cpu_percent(interval=1, percpu=True)]
-        logger.debug(f"Fetched CPU core usage: {core_usage}")
-        return core_usage
-
-    def get_architecture(self):
-        """Get system architecture."""
-        architecture = platform.architecture()[0]
-        logger.debug(f"Fetched system architecture: {architecture}")
-        return architecture
-
-    def get_os(self):
-        """Get the operating system."""
-        os_info = platform.system()
-        logger.debug(f"Fetched operating system: {os_info}")
-        return os_info
-
-    def get_hostname(self):
-        """Get the hostname of the machine."""
-        hostname = socket.gethostname()
-        logger.debug(f"Fetched hostname: {hostname}")
-        return hostname
-
-    def get_system_uptime(self):
-        """Get the system uptime."""
-        boot_time = psutil.boot_time()
-        system_uptime = self.format_uptime(boot_time)
-        logger.debug(f"Fetched system uptime: {system_uptime}")
-        return system_uptime
-
-    def format_uptime(self, timestamp):
-        """Convert timestamp to a human-readable format."""
-        from datetime import datetime
-
-        current_time = datetime.now()
-        uptime = current_time - datetime.fromtimestamp(timestamp)
-        return str(uptime).split(".")[0]
-
-    def get_memory_usage(self):
-        """Get the system memory usage."""
-        memory = psutil.virtual_memory()
-        logger.debug(f"Fetched memory usage: {memory.percent}%")
-        return f"{memory.percent}%"
-
-    def get_disk_io(self):
-        """Get the disk I/O stats."""
-        disk_io = psutil.disk_io_counters()
-        logger.debug(
-            f"Fetched disk I/O: Read: {disk_io.read_bytes / (1024**2):.2f} MB, Write: {disk_io.write_bytes / (1024**2):.2f} MB"
-        )
-        return f"Read: {disk_io.read_bytes / (1024**2):.2f} MB, Write: {disk_io.write_bytes / (1024**2):.2f} MB"
-
-    def get_network_traffic(self):
-        """Get the network traffic (sent and received bytes)."""
-        net_io = psutil.net_io_counters()
-        logger.debug(
-            f"Fetched network traffic: Sent: {net_io.bytes_sent / (1024**2):.2f} MB, Received: {net_io.bytes_recv / (1024**2):.2f} MB"
-        )
-        return f"Sent: {net_io.bytes_sent / (1024**2):.2f} MB, Received: {net_io.bytes_recv / (1024**2):.2f} MB"
-
-
-class MetricsWindow(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Performance Metrics")
-        self.setWindowIcon(QIcon("assets/gamma.ico"))
-        self.setGeometry(400, 200, 800, 600)
-        self.center_window()
-        self.apply_theme()
-        self.header_label = QLabel("Performance Metrics")
-        self.header_label.setAlignment(Qt.AlignCenter)
-        self.header_label.setFont(QFont("Arial", 18, QFont.Bold))
-
-        self.metrics_table = QTableWidget(self)
-        self.metrics_table.setColumnCount(2)
-        self.metrics_table.setHorizontalHeaderLabels(["Metric", "Value"])
-        self.metrics_table.setRowCount(0)
-        self.metrics_table.setStyleSheet(
-            """
-            QTableWidget {
-                background-color: #333;
-                color: white;
-                border: none;
-                gridline-color: #444;
-                font-size: 14px;
-            }
-            QTableWidget::item {
-                border-bottom: 1px solid #444;
-            }
-            QHeaderView::section {
-                background-color: #333; /* Match table background */
-                color: white; /* Text color for headers */
-                padding: 4px;
-                font-weight: bold;
-                border: none; /* Remove header border */
-            }
-            QTableWidget::item:alternate {
-                background-color: #444; /* Slightly lighter background for alternating rows */
-            }
-        """
-        )
-
-        self.metrics_table.setAlternatingRowColors(True)
-        self.metrics_table.verticalHeader().setVisible(False)
-        self.metrics_table.horizontalHeader().setVisible(False)
-
-        layout = QVBoxLayout()
-        layout.addWidget(self.header_label)
-        layout.addWidget(self.metrics_table)
-        self.setLayout(layout)
-
-        self.metrics_table.horizontalHeader().setStretchLastSection(True)
-        self.metrics_table.setColumnWidth(0, 300)
-        self.metrics_table.setColumnWidth(1, 450)
-        self.metrics_table.setSelectionMode(QTableWidget.NoSelection)
-        self.metrics_table.setFrameStyle(QFrame.NoFrame)
-
-        self.fetcher_thread = MetricsFetcherThread()
-        self.fetcher_thread.metrics_fetched.connect(self.update_metrics_table)
-        self.fetcher_thread.start()
-
-    def apply_theme(self):
-        """Apply the dark theme to the window."""
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #222;
-                border: 1px solid #444;
-                border-radius: 10px;
-            }
-        """
-        )
-        self.setFont(QFont("Arial", 12))
-
-    def center_window(self):
-        """Center the window on the screen."""
-        screen_geometry = QDesktopWidget().availableGeometry()
-        window_geometry = self.geometry()
-        x = (screen_geometry.width() - window_geometry.width()) // 2
-        y = (screen_geometry.height() - window_geometry.height()) // 2
-        self.move(x, y)
-
-    def update_metrics_table(self, metrics):
-        """Update the table with the fetched metrics."""
-        self.metrics_table.setRowCount(0)
-
-        for row, (metric, value) in enumerate(metrics.items()):
-            self.metrics_table.insertRow(row)
-            metric_item = QTableWidgetItem(metric)
-            value_item = QTableWidgetItem(str(value))
-
-            metric_item.setForeground(QColor("white"))
-            value_item.setForeground(QColor("white"))
-            metric_item.setFlags(Qt.ItemIsEnabled)
-            value_item.setFlags(Qt.ItemIsEnabled)
-
-            self.metrics_table.setItem(row, 0, metric_item)
-            self.metrics_table.setItem(row, 1, value_item)
-
-
-if __name__ == "__main__":
-    app = QApplication([])
-    window = MetricsWindow()
-    window.show()
-    app.exec_()
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import os
+import logging
+import threading
+import time
+import psutil
+import platform
+import socket
+import sqlite3
+import pymysql
+from PyQt5.QtWidgets import (
+    QApplication,
+    QDialog,
+    QVBoxLayout,
+    QTableView,
+    QFrame,
+    QDesktopWidget,
+    QLabel,
+    QWidget,
+    QHBoxLayout,
+    QSpinBox,
+    QGridLayout,
+    QTabWidget,
+)
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QIcon
+from classes.connectionPool import get_pool
+from classes.metricsCollector import (
+    GAUGES,
+    StatusCollector,
+    buffer_pool_hit_ratio,
+    counter_rates,
+)
+from classes.metricsHistory import MetricsHistory
+from classes.hostMetrics import CpuSampler, MysqldProcessMonitor
+from classes.metricsStore import MetricsStore, metrics_database_path
+from classes.pages.metricsCharts import SparklineWidget
+from classes.pages.dataTableModel import MetricsTableModel
+from classes.pages.digestPanel import DigestPanel
+from classes.pages.historyPanel import HistoryPanel
+
+logger = logging.getLogger()
+
+
+SERVER_METRIC_UNAVAILABLE = "SQL console must be opened to view this metric."
+MYSQLD_UNAVAILABLE = "mysqld is not running on this machine."
+PROCESS_ACCESS_DENIED = "Not permitted to read the mysqld process."
+DEFAULT_SAMPLE_INTERVAL = 2
+# Statement counters listed in the table, busiest first.
+TOP_STATEMENT_COUNT = 5
+
+
+class MetricsFetcherThread(QThread):
+    """Samples performance metrics every interval seconds off the main UI thread.
+
+    Every server metric is read from a single SHOW GLOBAL STATUS result
+    taken on the collector's persistent connection. Cumulative counters are
+    turned into per-second rates against the previous sample and, with the
+    gauges, appended to the ring buffers of the history and to the store.
+    """
+
+    metrics_fetched = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        collector,
+        history,
+        store=None,
+        interval=DEFAULT_SAMPLE_INTERVAL,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.collector = collector
+        self.history = history
+        self.store = store
+        self.interval = interval
+        self.previous_status = None
+        # Set while the server cannot be sampled, so only the first failure is a warning.
+        self.server_unreachable = False
+        self.cpu_sampler = CpuSampler()
+        self.process_monitor = MysqldProcessMonitor(collector)
+        self._stop_event = threading.Event()
+
+    def set_interval(self, seconds):
+        self.interval = max(1, seconds)
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self.sample()
+            self._stop_event.wait(max(0, self.interval - (time.monotonic() - started)))
+
+    def sample(self):
+        metrics = {}
+
+        try:
+            status = self.collector.snapshot()
+        except pymysql.MySQLError as e:
+            if self.server_unreachable:
+                logger.debug(f"Server status still unavailable for metrics: {e}")
+            else:
+                logger.warning(f"Failed to fetch server status for metrics: {e}")
+                self.server_unreachable = True
+            status = None
+        else:
+            if self.server_unreachable:
+                logger.info("Server status is available for metrics again.")
+                self.server_unreachable = False
+        rates = None
+        if status is not None:
+            if self.previous_status is not None:
+                rates = counter_rates(self.previous_status, status)
+            self.previous_status = status
+        cpu = self.cpu_sampler.sample()
+        mysqld = self.process_monitor.sample()
+
+        samples = dict(rates or {})
+        if rates:
+            samples["buffer_pool_hit_ratio"] = buffer_pool_hit_ratio(rates)
+        if status is not None:
+            for gauge in GAUGES:
+                samples[gauge] = status.number(gauge)
+        if cpu is not None:
+            samples["cpu"] = cpu.total
+            for core, usage in enumerate(cpu.per_core):
+                samples[f"cpu_core_{core}"] = usage
+        if mysqld is not None:
+            samples["mysqld_cpu"] = mysqld.cpu
+            samples["mysqld_rss"] = mysqld.rss
+            samples["mysqld_read_rate"] = mysqld.read_rate
+            samples["mysqld_write_rate"] = mysqld.write_rate
+        if samples:
+            timestamp = time.time()
+            self.history.record(timestamp, samples)
+            if self.store is not None:
+                try:
+                    self.store.record(timestamp, samples)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to store metrics: {e}")
+
+        metrics["Server Uptime"] = self.get_server_uptime(status)
+        metrics["Active Connections"] = self.get_threads_connected(status)
+        metrics["Slow Queries"] = self.get_slow_queries(status)
+        metrics["Queries Per Second (QPS)"] = self.get_queries_per_second(status, rates)
+        metrics["Statements"] = self.get_statement_rates(status, rates)
+        metrics["Network Throughput"] = self.get_byte_rates(status, rates)
+        metrics["InnoDB Row Operations"] = self.get_innodb_row_rates(status, rates)
+        metrics["Open Tables"] = self.get_open_tables(status)
+        metrics["Connection Pool"] = self.get_pool_stats()
+
+        metrics["CPU Usage"] = self.get_cpu_usage(cpu)
+        metrics["CPU Core Usage"] = self.get_cpu_core_usage(cpu)
+        metrics["MySQL Server CPU"] = self.get_mysqld_cpu_usage(mysqld)
+        metrics["MySQL Server Memory"] = self.get_mysqld_memory(mysqld)
+        metrics["MySQL Server Threads"] = self.get_mysqld_threads(mysqld)
+        metrics["MySQL Server Open Files"] = self.get_mysqld_open_files(mysqld)
+        metrics["MySQL Server Disk I/O"] = self.get_mysqld_disk_io(mysqld)
+        metrics["Architecture"] = self.get_architecture()
+        metrics["Operating System"] = self.get_os()
+        metrics["Hostname"] = self.get_hostname()
+        metrics["System Uptime"] = self.get_system_uptime()
+        metrics["Memory Usage"] = self.get_memory_usage()
+        metrics["Disk I/O"] = self.get_disk_io()
+        metrics["Network Traffic"] = self.get_network_traffic()
+
+        self.metrics_fetched.emit(metrics)
+
+    def get_server_uptime(self, status):
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        uptime = status.number("Uptime", 0)
+        logger.debug(f"Fetched server uptime: {uptime} seconds.")
+        return f"{uptime} seconds"
+
+    def get_threads_connected(self, status):
+        """Get the number of threads connected to MySQL."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        threads_connected = status.get("Threads_connected", "N/A")
+        logger.debug(f"Fetched threads connected: {threads_connected}")
+        return threads_connected
+
+    def get_slow_queries(self, status):
+        """Get the number of slow queries."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        slow_queries = status.get("Slow_queries", "N/A")
+        logger.debug(f"Fetched slow queries count: {slow_queries}")
+        return slow_queries
+
+    def get_queries_per_second(self, status, rates):
+        """Get queries per second (QPS) since the previous sample."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        if rates is None or "Queries" not in rates:
+            return "Measuring..."
+        qps = rates["Queries"]
+        logger.debug(f"Fetched queries per second: {qps:.2f} QPS")
+        return f"{qps:.2f} QPS"
+
+    def get_statement_rates(self, status, rates):
+        """Get the busiest statement types per second, from the Com_* counters."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        if rates is None:
+            return "Measuring..."
+        busiest = sorted(
+            (
+                (rate, name[len("Com_") :])
+                for name, rate in rates.items()
+                if name.startswith("Com_") and rate > 0
+            ),
+            reverse=True,
+        )[:TOP_STATEMENT_COUNT]
+        if not busiest:
+            return "Idle"
+        return ", ".join(f"{name} {rate:.1f}/s" for rate, name in busiest)
+
+    def get_byte_rates(self, status, rates):
+        """Get the bytes per second sent to and received from clients."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        if rates is None:
+            return "Measuring..."
+        return (
+            f"Sent: {rates.get('Bytes_sent', 0) / 1024:.1f} KB/s, "
+            f"Received: {rates.get('Bytes_received', 0) / 1024:.1f} KB/s"
+        )
+
+    def get_innodb_row_rates(self, status, rates):
+        """Get the InnoDB rows read, inserted, updated, and deleted per second."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        if rates is None:
+            return "Measuring..."
+        return ", ".join(
+            f"{operation} {rates.get('Innodb_rows_' + operation, 0):.1f}/s"
+            for operation in ("read", "inserted", "updated", "deleted")
+        )
+
+    def get_open_tables(self, status):
+        """Get the number of open tables in MySQL."""
+        if status is None:
+            return SERVER_METRIC_UNAVAILABLE
+        open_tables = status.get("Open_tables", "N/A")
+        logger.debug(f"Fetched open tables count: {open_tables}")
+        return open_tables
+
+    def get_pool_stats(self):
+        """Get the shared connection pool statistics."""
+        stats = get_pool().stats()
+        pool_stats = (
+            f"{stats['in_use']}/{stats['open']} in use (max {stats['max_connections']}), "
+            f"{stats['checkouts']} checkouts, {stats['waits']} waits, "
+            f"avg connect {stats['avg_connect_ms']:.1f} ms"
+        )
+        logger.debug(f"Fetched connection pool stats: {stats}")
+        return pool_stats
+
+    def get_cpu_usage(self, cpu):
+        """Get the CPU usage of the server since the previous sample."""
+        if cpu is None:
+            return "Measuring..."
+        return f"{cpu.total:.1f}%"
+
+    def get_cpu_core_usage(self, cpu):
+        """Get CPU usage per core since the previous sample."""
+        if cpu is None:
+            return "Measuring..."
+        return [f"{usage}%" for usage in cpu.per_core]
+
+    def get_mysqld_cpu_usage(self, mysqld):
+        """Get the share of the host CPU used by mysqld."""
+        if mysqld is None:
+            return MYSQLD_UNAVAILABLE
+        if mysqld.cpu is None:
+            return "Measuring..."
+        return f"{mysqld.cpu:.1f}% (PID {mysqld.pid})"
+
+    def get_mysqld_memory(self, mysqld):
+        """Get the resident memory of mysqld."""
+        if mysqld is None:
+            return MYSQLD_UNAVAILABLE
+        if mysqld.rss is None:
+            return PROCESS_ACCESS_DENIED
+        return f"{mysqld.rss / (1024**2):.1f} MB resident"
+
+    def get_mysqld_threads(self, mysqld):
+        """Get the number of OS threads of mysqld."""
+        if mysqld is None:
+            return MYSQLD_UNAVAILABLE
+        if mysqld.threads is None:
+            return PROCESS_ACCESS_DENIED
+        return mysqld.threads
+
+    def get_mysqld_open_files(self, mysqld):
+        """Get the number of files (handles on Windows) mysqld has open."""
+        if mysqld is None:
+            return MYSQLD_UNAVAILABLE
+        if mysqld.open_files is None:
+            return PROCESS_ACCESS_DENIED
+        return mysqld.open_files
+
+    def get_mysqld_disk_io(self, mysqld):
+        """Get the bytes mysqld read and wrote, in total and per second."""
+        if mysqld is None:
+            return MYSQLD_UNAVAILABLE
+        if mysqld.read_bytes is None:
+            return PROCESS_ACCESS_DENIED
+        text = (
+            f"Read: {mysqld.read_bytes / (1024**2):.2f} MB, "
+            f"Write: {mysqld.write_bytes / (1024**2):.2f} MB"
+        )
+        if mysqld.read_rate is not None:
+            text += (
+                f" ({mysqld.read_rate / 1024:.1f} KB/s read, "
+                f"{mysqld.write_rate / 1024:.1f} KB/s written)"
+            )
+        return text
+
+    def get_architecture(self):
+        """Get system architecture."""
+        architecture = platform.architecture()[0]
+        logger.debug(f"Fetched system architecture: {architecture}")
+        return architecture
+
+    def get_os(self):
+        """Get the operating system."""
+        os_info = platform.system()
+        logger.debug(f"Fetched operating system: {os_info}")
+        return os_info
+
+    def get_hostname(self):
+        """Get the hostname of the machine."""
+        hostname = socket.gethostname()
+        logger.debug(f"Fetched hostname: {hostname}")
+        return hostname
+
+    def get_system_uptime(self):
+        """Get the system uptime."""
+        boot_time = psutil.boot_time()
+        system_uptime = self.format_uptime(boot_time)
+        logger.debug(f"Fetched system uptime: {system_uptime}")
+        return system_uptime
+
+    def format_uptime(self, timestamp):
+        """Convert timestamp to a human-readable format."""
+        from datetime import datetime
+
+        current_time = datetime.now()
+        uptime = current_time - datetime.fromtimestamp(timestamp)
+        return str(uptime).split(".")[0]
+
+    def get_memory_usage(self):
+        """Get the system memory usage."""
+        memory = psutil.virtual_memory()
+        logger.debug(f"Fetched memory usage: {memory.percent}%")
+        return f"{memory.percent}%"
+
+    def get_disk_io(self):
+        """Get the disk I/O stats."""
+        disk_io = psutil.disk_io_counters()
+        logger.debug(
+            f"Fetched disk I/O: Read: {disk_io.read_bytes / (1024**2):.2f} MB, Write: {disk_io.write_bytes / (1024**2):.2f} MB"
+        )
+        return f"Read: {disk_io.read_bytes / (1024**2):.2f} MB, Write: {disk_io.write_bytes / (1024**2):.2f} MB"
+
+    def get_network_traffic(self):
+        """Get the network traffic (sent and received bytes)."""
+        net_io = psutil.net_io_counters()
+        logger.debug(
+            f"Fetched network traffic: Sent: {net_io.bytes_sent / (1024**2):.2f} MB, Received: {net_io.bytes_recv / (1024**2):.2f} MB"
+        )
+        return f"Sent: {net_io.bytes_sent / (1024**2):.2f} MB, Received: {net_io.bytes_recv / (1024**2):.2f} MB"
+
+
+class MetricsWindow(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Performance Metrics")
+        self.setWindowIcon(QIcon("assets/gamma.ico"))
+        self.setGeometry(400, 200, 800, 800)
+        self.center_window()
+        self.apply_theme()
+        self.collector = StatusCollector()
+        self.history = MetricsHistory()
+        try:
+            self.store = MetricsStore(metrics_database_path())
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to open the metrics store: {e}")
+            self.store = None
+        self.header_label = QLabel("Performance Metrics")
+        self.header_label.setAlignment(Qt.AlignCenter)
+        self.header_label.setFont(QFont("Arial", 18, QFont.Bold))
+
+        self.metrics_model = MetricsTableModel(self)
+        self.metrics_table = QTableView(self)
+        self.metrics_table.setModel(self.metrics_model)
+        self.metrics_table.setStyleSheet(
+            """
+            QTableView {
+                background-color: #333;
+                color: white;
+                border: none;
+                gridline-color: #444;
+                font-size: 14px;
+            }
+            QTableView::item {
+                border-bottom: 1px solid #444;
+            }
+            QHeaderView::section {
+                background-color: #333; /* Match table background */
+                color: white; /* Text color for headers */
+                padding: 4px;
+                font-weight: bold;
+                border: none; /* Remove header border */
+            }
+            QTableView::item:alternate {
+                background-color: #444; /* Slightly lighter background for alternating rows */
+            }
+        """
+        )
+
+        self.metrics_table.setAlternatingRowColors(True)
+        self.metrics_table.verticalHeader().setVisible(False)
+        self.metrics_table.horizontalHeader().setVisible(False)
+
+        self.interval_label = QLabel("Refresh every", self)
+        self.interval_input = QSpinBox(self)
+        self.interval_input.setRange(1, 60)
+        self.interval_input.setValue(DEFAULT_SAMPLE_INTERVAL)
+        self.interval_input.setSuffix(" s")
+        self.interval_input.valueChanged.connect(self.on_interval_changed)
+        interval_layout = QHBoxLayout()
+        interval_layout.addStretch()
+        interval_layout.addWidget(self.interval_label)
+        interval_layout.addWidget(self.interval_input)
+
+        core_count = psutil.cpu_count() or 1
+        self.charts = [
+            SparklineWidget(self.history, "CPU", ["cpu"], [QColor("#4caf50")], 100, "%"),
+            SparklineWidget(
+                self.history,
+                f"CPU per core ({core_count})",
+                [f"cpu_core_{core}" for core in range(core_count)],
+                maximum=100,
+                unit="%",
+            ),
+            SparklineWidget(self.history, "Queries/s", ["Queries"], [QColor("#2196f3")]),
+            SparklineWidget(
+                self.history, "Connections", ["Threads_connected"], [QColor("#ff9800")]
+            ),
+            SparklineWidget(
+                self.history,
+                "Buffer pool hit ratio",
+                ["buffer_pool_hit_ratio"],
+                [QColor("#ab47bc")],
+                100,
+                "%",
+            ),
+        ]
+        charts_layout = QGridLayout()
+        for index, chart in enumerate(self.charts):
+            charts_layout.addWidget(chart, index // 2, index % 2)
+
+        overview = QWidget(self)
+        overview_layout = QVBoxLayout()
+        overview_layout.setContentsMargins(0, 0, 0, 0)
+        overview_layout.addLayout(charts_layout)
+        overview_layout.addWidget(self.metrics_table)
+        overview.setLayout(overview_layout)
+        self.digest_panel = DigestPanel(self.collector, self)
+        self.tabs = QTabWidget(self)
+        self.tabs.addTab(overview, "Overview")
+        self.tabs.addTab(self.digest_panel, "Top Statements")
+        self.history_panel = HistoryPanel(self.store, self)
+        self.tabs.addTab(self.history_panel, "History")
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.header_label)
+        layout.addLayout(interval_layout)
+        layout.addWidget(self.tabs)
+        self.setLayout(layout)
+
+        self.metrics_table.horizontalHeader().setStretchLastSection(True)
+        self.metrics_table.setColumnWidth(0, 300)
+        self.metrics_table.setColumnWidth(1, 450)
+        self.metrics_table.setSelectionMode(QTableView.NoSelection)
+        self.metrics_table.setFrameStyle(QFrame.NoFrame)
+
+        self.fetcher_thread = MetricsFetcherThread(
+            self.collector, self.history, self.store
+        )
+        self.fetcher_thread.metrics_fetched.connect(self.update_metrics_table)
+        self.fetcher_thread.metrics_fetched.connect(self.update_charts)
+        self.fetcher_thread.start()
+        # Emitted however the dialog is closed, including with Escape.
+        self.finished.connect(self.stop_collector)
+
+    def apply_theme(self):
+        """Apply the dark theme to the window."""
+        self.setStyleSheet(
+            """
+            QDialog {
+                background-color: #222;
+                border: 1px solid #444;
+                border-radius: 10px;
+            }
+            QLabel {
+                color: white;
+            }
+            QSpinBox, QComboBox, QPushButton {
+                background-color: #333;
+                color: white;
+                border: 1px solid #444;
+                padding: 2px;
+            }
+            QTabWidget::pane {
+                border: none;
+            }
+            QTabBar::tab {
+                background-color: #333;
+                color: white;
+                padding: 6px 14px;
+            }
+            QTabBar::tab:selected {
+                background-color: #444;
+            }
+        """
+        )
+        self.setFont(QFont("Arial", 12))
+
+    def center_window(self):
+        """Center the window on the screen."""
+        screen_geometry = QDesktopWidget().availableGeometry()
+        window_geometry = self.geometry()
+        x = (screen_geometry.width() - window_geometry.width()) // 2
+        y = (screen_geometry.height() - window_geometry.height()) // 2
+        self.move(x, y)
+
+    def on_interval_changed(self, seconds):
+        self.fetcher_thread.set_interval(seconds)
+
+    def stop_collector(self):
+        """Stop sampling and close the collector connection."""
+        self.fetcher_thread.stop()
+        self.fetcher_thread.wait()
+        self.digest_panel.stop()
+        self.collector.close()
+        if self.store is not None:
+            self.store.close()
+
+    def update_charts(self, metrics):
+        """Draw the newest sample on every chart."""
+        for chart in self.charts:
+            chart.append_latest()
+
+    def update_metrics_table(self, metrics):
+        """Update the table with the fetched metrics."""
+        self.metrics_model.update(metrics)
+
+
+if __name__ == "__main__":
+    app = QApplication([])
+    window = MetricsWindow()
+    window.show()
+    app.exec_()
@@ -1,368 +1,949 @@
-# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
-#
-# This file is part of gamma.
-#
-# This file may be used only with explicit permission from AlmightyNan.
-# Redistribution, modification, or commercial use without prior written
-# consent is strictly prohibited.
-#
-# Proper credit must be given to AlmightyNan, and it must be displayed
-# visibly without shortening or obscuring the text.
-#
-# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
-# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
-
-import csv
-import json
-from PyQt5.QtWidgets import (
-    QDialog,
-    QVBoxLayout,
-    QPushButton,
-    QDesktopWidget,
-    QMessageBox,
-    QLabel,
-    QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
-    QSplitter,
-    QWidget,
-    QFrame,
-    QComboBox,
-    QLineEdit,
-    QFileDialog,
-)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QIcon
-import logging
-
-
-logger = logging.getLogger()
-
-
-class TableDetailsWindow(QDialog):
-    def __init__(
-        self,
-        table_name,
-        table_description,
-        table_data,
-        available_tables,
-        mysql_manager,
-        parent=None,
-    ):
-        super().__init__(parent)
-        self.mysql_manager = mysql_manager
-        self.table_name = table_name
-        self.table_data = table_data
-        self.setWindowTitle(f"Details of {table_name}")
-        self.setWindowIcon(QIcon("assets/gamma.ico"))
-        self.setGeometry(0, 0, 1000, 800)
-        self.center_window()
-        self.setWindowFlags(self.windowFlags() | Qt.WindowMaximizeButtonHint)
-        logger.info(f"TableDetailsWindow initialized for table: {table_name}")
-
-        self.setStyleSheet("background-color: #111; color: #fff;")
-
-        splitter = QSplitter(self)
-        splitter.setOrientation(Qt.Horizontal)
-
-        description_layout = QVBoxLayout()
-        description_label = QLabel("Table Description")
-        description_label.setFont(QFont("Arial", 16))
-        description_label.setStyleSheet("color: #fff;")
-
-        self.description_table = QTableWidget(self)
-        self.description_table.setRowCount(len(table_description))
-        self.description_table.setColumnCount(4)
-        self.description_table.setHorizontalHeaderLabels(
-            ["Field", "Type", "Null", "Key"]
-        )
-
-        for row, desc in enumerate(table_description):
-            for col, value in enumerate(desc):
-                item = QTableWidgetItem(str(value))
-                self.description_table.setItem(row, col, item)
-
-        self.description_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.description_table.setShowGrid(True)
-        self.description_table.setFrameShape(QFrame.Box)
-        self.description_table.setStyleSheet(
-            """
-            QTableWidget {
-                background-color: #222;
-                color: #fff;
-                border: 1px solid #555;
-            }
-            QTableWidget::item {
-                border: 1px solid #444;
-            }
-            QHeaderView::section {
-                background-color: #333;
-                color: #fff;
-            }
-        """
-        )
-
-        description_layout.addWidget(description_label)
-        description_layout.addWidget(self.description_table)
-
-        description_widget = QWidget(self)
-        description_widget.setLayout(description_layout)
-
-        data_layout = QVBoxLayout()
-        data_label = QLabel("Table Data")
-        data_label.setFont(QFont("Arial", 16))
-        data_label.setStyleSheet("color: #fff;")
-
-        self.data_table = QTableWidget(self)
-        self.data_table.setRowCount(len(table_data))
-        self.data_table.setColumnCount(len(table_data[0]) if table_data else 0)
-
-        for row, data in enumerate(table_data):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(str(value))
-                self.data_table.setItem(row, col, item)
-
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.data_table.setShowGrid(True)
-        self.data_table.setFrameShape(QFrame.Box)
-        self.data_table.setStyleSheet(
-            """
-            QTableWidget {
-                background-color: #222;
-                color: #fff;
-                border: 1px solid #555;
-            }
-            QTableWidget::item {
-                border: 1px solid #444;
-            }
-            QHeaderView::section {
-                background-color: #333;
-                color: #fff;
-            }
-        """
-        )
-
-        data_layout.addWidget(data_label)
-        data_layout.addWidget(self.data_table)
-
-        data_widget = QWidget(self)
-        data_widget.setLayout(data_layout)
-
-        splitter.addWidget(description_widget)
-        splitter.addWidget(data_widget)
-        splitter.setSizes([400, 600])
-
-        controls_layout = QHBoxLayout()
-        self.table_combobox = QComboBox(self)
-        self.table_combobox.addItems(available_tables)
-        self.table_combobox.currentTextChanged.connect(self.update_table)
-        self.table_combobox.setStyleSheet(
-            """
-            QComboBox {
-                background-color: #222;
-                color: #fff;
-                border: 1px solid #555;
-                padding: 5px;
-            }
-            QComboBox:hover {
-                border-color: #777;
-            }
-            QComboBox:editable {
-                background-color: #444;
-            }
-        """
-        )
-
-        self.search_bar = QLineEdit(self)
-        self.search_bar.setPlaceholderText("Search table...")
-        self.search_bar.textChanged.connect(self.filter_tables)
-        self.search_bar.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: #222;
-                color: #fff;
-                border: 1px solid #555;
-                padding: 5px;
-            }
-            QLineEdit:focus {
-                border-color: #777;
-            }
-        """
-        )
-
-        controls_layout.addWidget(self.search_bar)
-        controls_layout.addWidget(self.table_combobox)
-
-        main_layout = QVBoxLayout()
-        main_layout.addWidget(splitter)
-        main_layout.addLayout(controls_layout)
-        self.setLayout(main_layout)
-
-        export_button = QPushButton("Export Data", self)
-        export_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #333;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 5px;
-                padding: 9px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #444;
-                border-color: #777;
-            }
-            QPushButton:pressed {
-                background-color: #555;
-            }
-        """
-        )
-        export_button.clicked.connect(self.export_data)
-        main_layout.addWidget(export_button)
-
-        self.available_tables = available_tables
-
-    def export_data(self):
-        """Exports table data to a selected file format."""
-        logger.info("Export data process started.")
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Data",
-            "",
-            "CSV Files (*.csv);;JSON Files (*.json);;Excel Files (*.xlsx);;Text Files (*.txt);;HTML Files (*.html);;SQL Files (*.sql)",
-        )
-        if not file_path:
-            logger.warning("Export cancelled by user.")
-            return
-
-        try:
-            if file_path.endswith(".csv"):
-                self.export_to_csv(file_path)
-            elif file_path.endswith(".json"):
-                self.export_to_json(file_path)
-            elif file_path.endswith(".xlsx"):
-                self.export_to_excel(file_path)
-            elif file_path.endswith(".txt"):
-                self.export_to_text(file_path)
-            elif file_path.endswith(".html"):
-                self.export_to_html(file_path)
-            elif file_path.endswith(".sql"):
-                self.export_to_sql(file_path)
-            else:
-                logger.error("Unsupported file format selected.")
-                QMessageBox.warning(self, "Error", "Unsupported file format.")
-        except Exception as e:
-            logger.error(f"Error during export: {e}")
-            QMessageBox.critical(
-                self, "Export Failed", f"An error occurred while exporting: {e}"
-            )
-
-    def export_to_csv(self, file_path):
-        """Exports table data to a CSV file."""
-        logger.info(f"Exporting data to CSV: {file_path}")
-        if not self.table_data:
-            logger.warning("No data available for CSV export.")
-            QMessageBox.warning(self, "Export Failed", "No data available for export.")
-            return
-
-        try:
-            with open(file_path, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-
-                headers = []
-                for col in range(self.data_table.columnCount()):
-                    header_item = self.data_table.horizontalHeaderItem(col)
-                    header_text = (
-                        header_item.text() if header_item else f"Column {col+1}"
-                    )
-                    headers.append(header_text)
-                writer.writerow(headers)
-
-                for row in self.table_data:
-                    writer.writerow([str(item) for item in row])
-
-            QMessageBox.information(
-                self, "Export Successful", f"Data exported to {file_path} successfully."
-            )
-            logger.info(f"CSV export successful: {file_path}")
-        except Exception as e:
-            logger.error(f"Error during CSV export: {e}")
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"An error occurred while exporting data: {str(e)}",
-            )
-
-    def export_to_json(self, file_path):
-        """Exports table data to a JSON file."""
-        logger.info(f"Exporting data to JSON: {file_path}")
-        if not self.table_data:
-            logger.warning("No data available for JSON export.")
-            QMessageBox.warning(self, "Export Failed", "No data available for export.")
-            return
-
-        try:
-            headers = []
-            for col in range(self.data_table.columnCount()):
-                header_item = self.data_table.horizontalHeaderItem(col)
-                header_text = header_item.text() if header_item else f"Column {col+1}"
-                headers.append(header_text)
-
-            json_data = [dict(zip(headers, row)) for row in self.table_data]
-
-            with open(file_path, mode="w", encoding="utf-8") as file:
-                json.dump(json_data, file, indent=4)
-
-            QMessageBox.information(
-                self, "Export Successful", f"Data exported to {file_path} successfully."
-            )
-            logger.info(f"JSON export successful: {file_path}")
-        except Exception as e:
-            logger.error(f"Error during JSON export: {e}")
-            QMessageBox.critical(
-                self, "Export Failed", f"An error occurred while exporting: {str(e)}"
-            )
-
-    def update_table(self):
-        """Updates the description and data based on selected table."""
-        selected_table = self.table_combobox.currentText()
-        logger.info(f"Updating table to {selected_table or '[No Table Selected]'}")
-        if selected_table:
-            table_description = self.mysql_manager.get_table_description(selected_table)
-            table_data = self.mysql_manager.get_table_data(selected_table)
-
-            self.update_description(table_description)
-            self.update_data(table_data)
-
-    def update_description(self, table_description):
-        """Update the table description in the left pane."""
-        logger.info("Updating table description.")
-        self.description_table.setRowCount(len(table_description))
-        for row, desc in enumerate(table_description):
-            for col, value in enumerate(desc):
-                self.description_table.setItem(row, col, QTableWidgetItem(str(value)))
-
-    def update_data(self, table_data):
-        """Update the table data in the right pane."""
-        logger.info("Updating table data.")
-        self.data_table.setRowCount(len(table_data))
-        for row, data in enumerate(table_data):
-            for col, value in enumerate(data):
-                self.data_table.setItem(row, col, QTableWidgetItem(str(value)))
-
-    def filter_tables(self):
-        """Filters available tables based on user input in the search bar."""
-        search_text = self.search_bar.text().lower()
-        filtered_tables = [
-            table for table in self.available_tables if search_text in table.lower()
-        ]
-        self.table_combobox.clear()
-        self.table_combobox.addItems(filtered_tables)
-
-    def center_window(self):
-        """Center the window on the screen."""
-        qr = self.frameGeometry()
-        cp = QDesktopWidget().availableGeometry().center()
-        qr.moveCenter(cp)
-        self.move(qr.topLeft())
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+from PyQt5.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QPushButton,
+    QDesktopWidget,
+    QMessageBox,
+    QLabel,
+    QHBoxLayout,
+    QTableWidget,
+    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
+    QSplitter,
+    QWidget,
+    QFrame,
+    QComboBox,
+    QLineEdit,
+    QFileDialog,
+    QCheckBox,
+    QSpinBox,
+    QProgressDialog,
+    QInputDialog,
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QIcon
+import logging
+import os
+import time
+from classes.rowStreamer import DEFAULT_BATCH_SIZE, quote_identifier, stop_in_background
+from classes.exportWorker import ExportWorker, describe_throughput, remove_file
+from classes.exportWriters import (
+    CsvExportWriter,
+    ExcelExportWriter,
+    JsonExportWriter,
+    JsonLinesExportWriter,
+    SqlDumpExportWriter,
+    DEFAULT_ROWS_PER_STATEMENT,
+    export_extensions,
+    export_format,
+    writer_for_path,
+)
+from classes.pages.dataTableModel import RowStoreModel
+from classes.tablePager import DEFAULT_PAGE_SIZE, TablePager
+from classes.queryExecutor import CANCELLED_MESSAGE
+from classes.resumableExport import ResumableExportWorker, can_resume, checkpoint_path
+from classes.tableFilter import OPERATORS, TableFilter
+
+
+logger = logging.getLogger()
+
+# Rows kept in the data pane when browsing without pagination; past this
+# the stream stops and the user is pointed at pagination.
+MAX_STREAMED_ROWS = 100000
+
+# Save dialog entries, one per export format.
+EXPORT_FILE_TYPES = (
+    ("CSV Files", ".csv"),
+    ("JSON Files", ".json"),
+    ("JSON Lines Files", ".jsonl"),
+    ("Excel Files", ".xlsx"),
+    ("SQL Files", ".sql"),
+    ("Parquet Files", ".parquet"),
+    ("Arrow IPC Files", ".arrow"),
+    ("NumPy Archives", ".npz"),
+)
+
+
+def export_file_filter():
+    """Save dialog filter listing only the formats whose packages are installed."""
+    available = export_extensions()
+    filters = [
+        f"{label} (*{extension})"
+        for label, extension in EXPORT_FILE_TYPES
+        if extension in available
+    ]
+    compressed = [extension for extension in available if extension.count(".") > 1]
+    filters.append(f"Compressed Files ({' '.join('*' + e for e in compressed)})")
+    return ";;".join(filters)
+
+
+class TableDetailsWindow(QDialog):
+    def __init__(
+        self,
+        table_name,
+        table_description,
+        available_tables,
+        mysql_manager,
+        parent=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        table_info=None,
+    ):
+        super().__init__(parent)
+        self.mysql_manager = mysql_manager
+        self.database = mysql_manager.current_database
+        self.table_name = table_name
+        self.table_description = table_description
+        self.table_info = table_info
+        self.batch_size = batch_size
+        self.streamer = None
+        self.pager = None
+        self.page_request = 0
+        self.table_filter = TableFilter()
+        self.export_worker = None
+        self.setWindowTitle(f"Details of {table_name}")
+        self.setWindowIcon(QIcon("assets/gamma.ico"))
+        self.setGeometry(0, 0, 1000, 800)
+        self.center_window()
+        self.setWindowFlags(self.windowFlags() | Qt.WindowMaximizeButtonHint)
+        logger.info(f"TableDetailsWindow initialized for table: {table_name}")
+
+        self.setStyleSheet("background-color: #111; color: #fff;")
+
+        splitter = QSplitter(self)
+        splitter.setOrientation(Qt.Horizontal)
+
+        description_layout = QVBoxLayout()
+        description_label = QLabel("Table Description")
+        description_label.setFont(QFont("Arial", 16))
+        description_label.setStyleSheet("color: #fff;")
+
+        self.description_table = QTableWidget(self)
+        self.description_table.setRowCount(len(table_description))
+        self.description_table.setColumnCount(4)
+        self.description_table.setHorizontalHeaderLabels(
+            ["Field", "Type", "Null", "Key"]
+        )
+
+        for row, desc in enumerate(table_description):
+            for col, value in enumerate(desc):
+                item = QTableWidgetItem(str(value))
+                self.description_table.setItem(row, col, item)
+
+        self.description_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.description_table.setShowGrid(True)
+        self.description_table.setFrameShape(QFrame.Box)
+        self.description_table.setStyleSheet(
+            """
+            QTableWidget {
+                background-color: #222;
+                color: #fff;
+                border: 1px solid #555;
+            }
+            QTableWidget::item {
+                border: 1px solid #444;
+            }
+            QHeaderView::section {
+                background-color: #333;
+                color: #fff;
+            }
+        """
+        )
+
+        self.table_info_label = QLabel("")
+        self.table_info_label.setStyleSheet("color: #aaa;")
+        self.table_info_label.setWordWrap(True)
+
+        description_layout.addWidget(description_label)
+        description_layout.addWidget(self.description_table)
+        description_layout.addWidget(self.table_info_label)
+
+        description_widget = QWidget(self)
+        description_widget.setLayout(description_layout)
+
+        data_layout = QVBoxLayout()
+        data_label = QLabel("Table Data")
+        data_label.setFont(QFont("Arial", 16))
+        data_label.setStyleSheet("color: #fff;")
+
+        self.data_status_label = QLabel("Loading rows...")
+        self.data_status_label.setStyleSheet("color: #aaa;")
+
+        self.data_model = RowStoreModel(self)
+        self.data_model.fetch_more_callback = self.fetch_more_rows
+        self.data_table = QTableView(self)
+        self.data_table.setModel(self.data_model)
+        self.data_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.data_table.setShowGrid(True)
+        self.data_table.setFrameShape(QFrame.Box)
+        self.data_table.setWordWrap(False)
+        # Fixed row heights let the view map scroll positions to rows without
+        # measuring every row, which keeps scrolling smooth on huge tables.
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(24)
+        self.data_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.Interactive
+        )
+        # Sorting runs on the server, so the header only drives the ORDER BY.
+        self.data_table.horizontalHeader().setSortIndicatorShown(False)
+        self.data_table.horizontalHeader().setSectionsClickable(True)
+        self.data_table.horizontalHeader().sectionClicked.connect(
+            self.on_header_clicked
+        )
+        self.data_table.setStyleSheet(
+            """
+            QTableView {
+                background-color: #222;
+                color: #fff;
+                border: 1px solid #555;
+            }
+            QTableView::item {
+                border: 1px solid #444;
+            }
+            QHeaderView::section {
+                background-color: #333;
+                color: #fff;
+            }
+        """
+        )
+
+        filter_layout = QHBoxLayout()
+        self.filter_column_combobox = QComboBox(self)
+        self.filter_operator_combobox = QComboBox(self)
+        self.filter_operator_combobox.addItems(list(OPERATORS))
+        self.filter_operator_combobox.currentTextChanged.connect(
+            self.on_filter_operator_changed
+        )
+        self.filter_value_input = QLineEdit(self)
+        self.filter_value_input.setPlaceholderText("Value (comma separated for 'in')")
+        self.filter_value_input.returnPressed.connect(self.add_filter)
+        add_filter_button = QPushButton("Add Filter", self)
+        add_filter_button.clicked.connect(self.add_filter)
+        clear_filters_button = QPushButton("Clear Filters", self)
+        clear_filters_button.clicked.connect(self.clear_filters)
+        self.row_limit_input = QSpinBox(self)
+        self.row_limit_input.setRange(0, 100000000)
+        self.row_limit_input.setSpecialValueText("All rows")
+        self.row_limit_input.setPrefix("Max ")
+        self.row_limit_input.setToolTip(
+            "Stop after this many rows when loading without pagination."
+        )
+        self.row_limit_input.editingFinished.connect(self.on_row_limit_changed)
+        for widget in (
+            self.filter_column_combobox,
+            self.filter_operator_combobox,
+            self.filter_value_input,
+            self.row_limit_input,
+        ):
+            widget.setStyleSheet(
+                "background-color: #222; color: #fff; border: 1px solid #555; padding: 4px;"
+            )
+        for button in (add_filter_button, clear_filters_button):
+            button.setStyleSheet(
+                """
+                QPushButton {
+                    background-color: #333;
+                    color: #fff;
+                    border: 1px solid #555;
+                    border-radius: 3px;
+                    padding: 4px 10px;
+                }
+                QPushButton:hover {
+                    background-color: #444;
+                }
+            """
+            )
+        filter_layout.addWidget(self.filter_column_combobox)
+        filter_layout.addWidget(self.filter_operator_combobox)
+        filter_layout.addWidget(self.filter_value_input, 1)
+        filter_layout.addWidget(add_filter_button)
+        filter_layout.addWidget(clear_filters_button)
+        filter_layout.addWidget(self.row_limit_input)
+
+        self.filter_label = QLabel("")
+        self.filter_label.setStyleSheet("color: #aaa;")
+        self.filter_label.setWordWrap(True)
+
+        paging_layout = QHBoxLayout()
+        self.paginate_checkbox = QCheckBox("Paginate", self)
+        self.paginate_checkbox.setToolTip(
+            "Browse one page at a time instead of loading every row."
+        )
+        self.paginate_checkbox.stateChanged.connect(self.reload_data)
+        self.page_size_input = QSpinBox(self)
+        self.page_size_input.setRange(10, 100000)
+        self.page_size_input.setValue(DEFAULT_PAGE_SIZE)
+        self.page_size_input.setSuffix(" rows")
+        self.page_size_input.editingFinished.connect(self.on_page_size_changed)
+        self.first_page_button = QPushButton("<<", self)
+        self.first_page_button.clicked.connect(self.load_first_page)
+        self.previous_page_button = QPushButton("<", self)
+        self.previous_page_button.clicked.connect(self.load_previous_page)
+        self.next_page_button = QPushButton(">", self)
+        self.next_page_button.clicked.connect(self.load_next_page)
+        self.last_page_button = QPushButton(">>", self)
+        self.last_page_button.clicked.connect(self.load_last_page)
+        self.page_label = QLabel("")
+        self.page_label.setStyleSheet("color: #aaa;")
+
+        paging_layout.addWidget(self.paginate_checkbox)
+        paging_layout.addWidget(self.page_size_input)
+        for button in (
+            self.first_page_button,
+            self.previous_page_button,
+            self.next_page_button,
+            self.last_page_button,
+        ):
+            button.setStyleSheet(
+                """
+                QPushButton {
+                    background-color: #333;
+                    color: #fff;
+                    border: 1px solid #555;
+                    border-radius: 3px;
+                    padding: 4px 10px;
+                }
+                QPushButton:hover {
+                    background-color: #444;
+                }
+                QPushButton:disabled {
+                    color: #666;
+                }
+            """
+            )
+            paging_layout.addWidget(button)
+        paging_layout.addWidget(self.page_label)
+        paging_layout.addStretch()
+
+        data_layout.addWidget(data_label)
+        data_layout.addLayout(filter_layout)
+        data_layout.addWidget(self.filter_label)
+        data_layout.addWidget(self.data_table)
+        data_layout.addLayout(paging_layout)
+        data_layout.addWidget(self.data_status_label)
+
+        data_widget = QWidget(self)
+        data_widget.setLayout(data_layout)
+
+        splitter.addWidget(description_widget)
+        splitter.addWidget(data_widget)
+        splitter.setSizes([400, 600])
+
+        controls_layout = QHBoxLayout()
+        self.table_combobox = QComboBox(self)
+        self.table_combobox.addItems(available_tables)
+        self.table_combobox.currentTextChanged.connect(self.update_table)
+        self.table_combobox.setStyleSheet(
+            """
+            QComboBox {
+                background-color: #222;
+                color: #fff;
+                border: 1px solid #555;
+                padding: 5px;
+            }
+            QComboBox:hover {
+                border-color: #777;
+            }
+            QComboBox:editable {
+                background-color: #444;
+            }
+        """
+        )
+
+        self.search_bar = QLineEdit(self)
+        self.search_bar.setPlaceholderText("Search table...")
+        self.search_bar.textChanged.connect(self.filter_tables)
+        self.search_bar.setStyleSheet(
+            """
+            QLineEdit {
+                background-color: #222;
+                color: #fff;
+                border: 1px solid #555;
+                padding: 5px;
+            }
+            QLineEdit:focus {
+                border-color: #777;
+            }
+        """
+        )
+
+        controls_layout.addWidget(self.search_bar)
+        controls_layout.addWidget(self.table_combobox)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(splitter)
+        main_layout.addLayout(controls_layout)
+        self.setLayout(main_layout)
+
+        export_button = QPushButton("Export Data", self)
+        export_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #333;
+                color: #fff;
+                border: 1px solid #555;
+                border-radius: 5px;
+                padding: 9px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #444;
+                border-color: #777;
+            }
+            QPushButton:pressed {
+                background-color: #555;
+            }
+        """
+        )
+        export_button.clicked.connect(self.export_data)
+        main_layout.addWidget(export_button)
+
+        self.available_tables = available_tables
+        self.update_table_info()
+        self.update_filter_columns()
+        self.reload_data()
+
+    def reload_data(self):
+        """Load the table data in the selected browse mode."""
+        paginate = self.paginate_checkbox.isChecked()
+        self.page_size_input.setEnabled(paginate)
+        self.row_limit_input.setEnabled(not paginate)
+        self.update_filter_label()
+        if paginate:
+            self.stop_streaming()
+            self.pager = TablePager(
+                self.database,
+                self.table_name,
+                self.table_description,
+                self.page_size_input.value(),
+                self.table_info.primary_key if self.table_info else None,
+                self.table_filter,
+            )
+            self.data_model.set_columns(self.pager.columns)
+            self.load_first_page()
+        else:
+            self.pager = None
+            self.update_paging_controls()
+            self.start_streaming(self.table_name)
+
+    def update_filter_columns(self):
+        """Offer the columns of the current table in the filter bar."""
+        self.filter_column_combobox.clear()
+        self.filter_column_combobox.addItems([row[0] for row in self.table_description])
+
+    def on_filter_operator_changed(self, operator):
+        self.filter_value_input.setEnabled(OPERATORS.get(operator, True))
+
+    def add_filter(self):
+        """Add the condition from the filter bar and reload the rows from the server."""
+        column = self.filter_column_combobox.currentText()
+        operator = self.filter_operator_combobox.currentText()
+        value = self.filter_value_input.text()
+        if not column:
+            return
+        if OPERATORS[operator] and value == "":
+            QMessageBox.warning(self, "Filter", "Enter a value to filter on.")
+            return
+        self.table_filter.add(column, operator, value if OPERATORS[operator] else None)
+        self.filter_value_input.clear()
+        logger.info(f"Added filter on {self.table_name}: {self.table_filter.filters[-1]}")
+        self.reload_data()
+
+    def clear_filters(self):
+        """Remove every filter and the sort order."""
+        if self.table_filter.filters or self.table_filter.sort_column is not None:
+            self.table_filter.clear()
+            self.table_filter.set_sort(None)
+            self.data_table.horizontalHeader().setSortIndicatorShown(False)
+            self.reload_data()
+
+    def on_row_limit_changed(self):
+        limit = self.row_limit_input.value() or None
+        if limit != self.table_filter.limit:
+            self.table_filter.limit = limit
+            if self.pager is None:
+                self.reload_data()
+
+    def on_header_clicked(self, section):
+        """Cycle the server side sort of a column: ascending, descending, off."""
+        columns = self.data_model.columns
+        if section >= len(columns):
+            return
+        column = columns[section]
+        header = self.data_table.horizontalHeader()
+        if self.table_filter.sort_column != column:
+            self.table_filter.set_sort(column)
+        elif not self.table_filter.sort_descending:
+            self.table_filter.set_sort(column, descending=True)
+        else:
+            self.table_filter.set_sort(None)
+
+        if self.table_filter.sort_column is None:
+            header.setSortIndicatorShown(False)
+        else:
+            header.setSortIndicatorShown(True)
+            header.setSortIndicator(
+                section,
+                Qt.DescendingOrder
+                if self.table_filter.sort_descending
+                else Qt.AscendingOrder,
+            )
+        self.reload_data()
+
+    def update_filter_label(self):
+        description = self.table_filter.describe()
+        self.filter_label.setText(f"Filter: {description}" if description else "")
+
+    def on_page_size_changed(self):
+        """Restart paging from the first page with the new page size."""
+        if self.pager is not None and self.pager.page_size != self.page_size_input.value():
+            self.reload_data()
+
+    def load_first_page(self):
+        if self.pager is not None:
+            self.load_page(self.pager.first_page_query())
+
+    def load_previous_page(self):
+        if self.pager is not None:
+            self.load_page(self.pager.previous_page_query())
+
+    def load_next_page(self):
+        if self.pager is not None:
+            self.load_page(self.pager.next_page_query())
+
+    def load_last_page(self):
+        """Jump to the last page; without a key the rows have to be counted first."""
+        if self.pager is None:
+            return
+        if self.pager.uses_keyset:
+            self.load_page(self.pager.last_page_query())
+            return
+
+        pager = self.pager
+        sql, args = pager.count_query()
+        self.run_page_query(
+            sql,
+            args,
+            lambda rows: self.load_page(pager.last_page_query(rows[0][0])),
+        )
+
+    def run_page_query(self, sql, args, on_result):
+        """Run a paging query in the background; results of superseded requests are dropped."""
+        self.page_request += 1
+        request = self.page_request
+        pager = self.pager
+        self.set_paging_enabled(False)
+
+        def handle_result(rows):
+            if request == self.page_request and pager is self.pager:
+                on_result(rows)
+
+        def handle_error(message):
+            if request != self.page_request or pager is not self.pager:
+                return
+            self.update_paging_controls()
+            if message == CANCELLED_MESSAGE:
+                return
+            logger.error(f"Failed to load page of {self.table_name}: {message}")
+            QMessageBox.critical(self, "Error", f"Failed to load table data:\n{message}")
+
+        self.mysql_manager.execute_query(
+            sql, args, on_result=handle_result, on_error=handle_error
+        )
+
+    def load_page(self, page_query):
+        """Fetch one page and show it in the data pane."""
+        sql, args, direction = page_query
+        self.run_page_query(
+            sql, args, lambda rows: self.show_page(rows, direction)
+        )
+
+    def show_page(self, rows, direction):
+        """Show a fetched page in the data pane."""
+        rows = self.pager.page_loaded(rows, direction)
+        if (
+            direction == TablePager.PREVIOUS
+            and self.pager.uses_keyset
+            and 0 < len(rows) < self.pager.page_size
+        ):
+            # Hit the start of the key range: show a full first page instead.
+            self.load_first_page()
+            return
+        if rows or direction in (TablePager.FIRST, TablePager.LAST):
+            self.data_model.set_rows(rows)
+            self.data_table.scrollToTop()
+        self.update_paging_controls()
+
+    def set_paging_enabled(self, enabled):
+        for button in (
+            self.first_page_button,
+            self.previous_page_button,
+            self.next_page_button,
+            self.last_page_button,
+        ):
+            button.setEnabled(enabled)
+
+    def update_paging_controls(self):
+        """Enable the paging buttons that make sense for the current page."""
+        pager = self.pager
+        self.first_page_button.setEnabled(pager is not None and not pager.at_start)
+        self.previous_page_button.setEnabled(pager is not None and not pager.at_start)
+        self.next_page_button.setEnabled(pager is not None and not pager.at_end)
+        self.last_page_button.setEnabled(pager is not None and not pager.at_end)
+        if pager is None:
+            self.page_label.setText("")
+            return
+
+        self.page_label.setText(pager.describe_position())
+        if pager.uses_keyset:
+            mode = f"by index order ({', '.join(pager.order_columns)})"
+        elif pager.key_columns:
+            mode = "with LIMIT/OFFSET (sort column allows NULL)"
+        else:
+            mode = "with LIMIT/OFFSET (no primary key)"
+        self.data_status_label.setText(
+            f"{self.data_model.rowCount()} rows on this page, browsing {mode}."
+        )
+
+    def start_streaming(self, table_name):
+        """Stream the rows of the table into the data pane in the background."""
+        self.stop_streaming()
+        self.data_model.clear()
+        self.data_status_label.setText("Loading rows...")
+
+        self.streamer = self.mysql_manager.stream_table_data(
+            table_name, self.batch_size, self.database, self.table_filter
+        )
+        self.streamer.columns_ready.connect(self.set_data_columns)
+        self.streamer.rows_fetched.connect(self.append_rows)
+        self.streamer.streaming_finished.connect(self.on_streaming_finished)
+        self.streamer.error_occurred.connect(self.on_streaming_error)
+        self.streamer.start()
+        logger.info(f"Streaming rows of {table_name} in batches of {self.batch_size}.")
+
+    def stop_streaming(self):
+        """Stop the running row stream, if any, without waiting for it."""
+        if self.streamer is not None:
+            stop_in_background(self.streamer)
+            self.streamer = None
+            self.data_model.more_available = False
+
+    def set_data_columns(self, columns):
+        """Set the data pane headers from the streamed result columns."""
+        self.data_model.set_columns(columns)
+
+    def append_rows(self, rows):
+        """Append a batch of streamed rows to the data pane.
+
+        The next batch is only read once the view scrolls near the end and
+        asks for it through fetchMore(), so the rows held grow with what the
+        user browses, up to MAX_STREAMED_ROWS.
+        """
+        if self.sender() is not self.streamer:
+            return
+
+        self.data_model.append_rows(rows)
+        row_count = self.data_model.rowCount()
+        if row_count >= MAX_STREAMED_ROWS:
+            self.stop_streaming()
+            self.data_status_label.setText(
+                f"Showing the first {row_count} rows; turn on Paginate to browse the rest."
+            )
+            return
+        self.data_model.more_available = True
+        self.data_status_label.setText(f"{row_count} rows loaded, scroll for more.")
+
+    def fetch_more_rows(self):
+        """Let the stream read the next batch when the view scrolls near the end."""
+        if self.streamer is not None:
+            self.streamer.batch_consumed()
+
+    def on_streaming_finished(self, total_rows):
+        """Show the final row count once the stream has ended."""
+        if self.sender() is self.streamer:
+            self.data_model.more_available = False
+            self.data_status_label.setText(f"{total_rows} rows loaded.")
+
+    def on_streaming_error(self, message):
+        """Report a failed row stream."""
+        if self.sender() is self.streamer:
+            self.data_status_label.setText("Failed to load rows.")
+            QMessageBox.critical(self, "Error", f"Failed to load table data:\n{message}")
+
+    def closeEvent(self, event):
+        """Stop streaming rows and any running export when the window is closed."""
+        self.stop_streaming()
+        if self.export_worker is not None:
+            stop_in_background(self.export_worker)
+            self.export_worker = None
+        event.accept()
+
+    def export_data(self):
+        """Exports table data to a selected file format."""
+        logger.info("Export data process started.")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Data",
+            "",
+            export_file_filter(),
+        )
+        if not file_path:
+            logger.warning("Export cancelled by user.")
+            return
+
+        # A .gz or .zst suffix compresses the file; the name before it picks the format.
+        file_format = export_format(file_path)
+        try:
+            if file_format == ".csv":
+                self.export_to_csv(file_path)
+            elif file_format == ".json":
+                self.export_to_json(file_path)
+            elif file_format == ".jsonl":
+                self.export_to_jsonl(file_path)
+            elif file_format == ".xlsx":
+                self.export_to_excel(file_path)
+            elif file_format == ".sql":
+                self.export_to_sql(file_path)
+            elif file_format in (".parquet", ".arrow", ".feather", ".npz"):
+                self.export_to_columnar(file_path)
+            else:
+                logger.error("Unsupported file format selected.")
+                QMessageBox.warning(self, "Error", "Unsupported file format.")
+        except Exception as e:
+            logger.error(f"Error during export: {e}")
+            QMessageBox.critical(
+                self, "Export Failed", f"An error occurred while exporting: {e}"
+            )
+
+    def export_to_csv(self, file_path):
+        """Exports table data to a CSV file."""
+        logger.info(f"Exporting data to CSV: {file_path}")
+        self.start_export(CsvExportWriter(file_path))
+
+    def start_export(self, writer):
+        """Stream the filtered rows of the table into writer on a worker thread."""
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.warning(self, "Export", "An export is already running.")
+            return
+
+        worker = self.resumable_export_worker(writer)
+        if worker is False:
+            return
+        if worker is None:
+            query, args = self.table_filter.select(
+                f"{quote_identifier(self.database)}.{quote_identifier(self.table_name)}"
+            )
+            worker = ExportWorker(
+                self.database, self.table_name, query, args, writer, self.batch_size
+            )
+        estimate = self.table_info.row_estimate if self.table_info else None
+        if self.table_filter.filters:
+            estimate = None
+        elif self.table_filter.limit and estimate:
+            estimate = min(estimate, self.table_filter.limit)
+
+        dialog = QProgressDialog(f"Exporting {self.table_name}...", "Cancel", 0, 0, self)
+        dialog.setWindowTitle("Export Data")
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        if estimate:
+            dialog.setMaximum(estimate)
+        dialog.canceled.connect(worker.stop)
+
+        started = time.perf_counter()
+
+        def on_progress(rows, rate):
+            if estimate:
+                dialog.setValue(min(rows, estimate))
+            throughput = describe_throughput(writer, time.perf_counter() - started)
+            dialog.setLabelText(
+                f"Exported {rows:,} rows ({rate:,.0f} rows/s)\n{throughput}"
+            )
+
+        def on_finished(rows, elapsed):
+            dialog.close()
+            rate = rows / elapsed if elapsed > 0 else 0.0
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"Exported {rows:,} rows to {writer.file_path} "
+                f"in {elapsed:.1f}s ({rate:,.0f} rows/s).\n"
+                f"{describe_throughput(writer, elapsed)}",
+            )
+
+        def on_error(message):
+            dialog.close()
+            QMessageBox.critical(
+                self, "Export Failed", f"An error occurred while exporting: {message}"
+            )
+
+        def on_done():
+            if worker.stopped:
+                dialog.close()
+                logger.info(f"Export of {self.table_name} cancelled.")
+                if isinstance(worker, ResumableExportWorker):
+                    QMessageBox.information(
+                        self,
+                        "Export Paused",
+                        f"The export to {writer.file_path} was stopped. Export to "
+                        "the same file again to continue where it left off.",
+                    )
+            if self.export_worker is worker:
+                self.export_worker = None
+
+        worker.progress.connect(on_progress)
+        worker.export_finished.connect(on_finished)
+        worker.error_occurred.connect(on_error)
+        worker.finished.connect(on_done)
+        self.export_worker = worker
+        worker.start()
+        dialog.show()
+
+    def resumable_export_worker(self, writer):
+        """Return a ResumableExportWorker for the export when it can be chunked by key.
+
+        Returns None when the export has to run in one pass, and False when
+        the user cancelled the resume prompt.
+        """
+        if self.table_filter.limit or not self.table_description:
+            return None
+        pager = TablePager(
+            self.database,
+            self.table_name,
+            self.table_description,
+            key_columns=self.table_info.primary_key if self.table_info else None,
+            table_filter=self.table_filter,
+        )
+        if not can_resume(writer, pager):
+            return None
+
+        worker = ResumableExportWorker(pager, writer)
+        checkpoint = worker.load_checkpoint()
+        if checkpoint is not None and os.path.exists(writer.file_path):
+            answer = QMessageBox.question(
+                self,
+                "Resume Export",
+                f"{writer.file_path} is an unfinished export of {self.table_name} "
+                f"with {checkpoint['rows']:,} rows written.\n"
+                "Resume it? Choose No to start over.",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+            )
+            if answer == QMessageBox.Cancel:
+                return False
+            worker.resume = answer == QMessageBox.Yes
+        if not worker.resume:
+            remove_file(checkpoint_path(writer.file_path))
+        return worker
+
+    def export_to_json(self, file_path):
+        """Exports table data to a JSON file."""
+        logger.info(f"Exporting data to JSON: {file_path}")
+        self.start_export(JsonExportWriter(file_path))
+
+    def export_to_jsonl(self, file_path):
+        """Exports table data to a JSON Lines file."""
+        logger.info(f"Exporting data to JSON Lines: {file_path}")
+        self.start_export(JsonLinesExportWriter(file_path))
+
+    def export_to_sql(self, file_path):
+        """Exports the table as a SQL dump with multi-row INSERT statements."""
+        rows_per_statement, ok = QInputDialog.getInt(
+            self,
+            "SQL Export",
+            "Rows per INSERT statement:",
+            DEFAULT_ROWS_PER_STATEMENT,
+            1,
+            100000,
+        )
+        if not ok:
+            logger.warning("Export cancelled by user.")
+            return
+        logger.info(f"Exporting data to SQL: {file_path}")
+        self.start_export(SqlDumpExportWriter(file_path, rows_per_statement))
+
+    def export_to_excel(self, file_path):
+        """Exports table data to an Excel workbook, split into sheets of at most 1,048,576 rows."""
+        logger.info(f"Exporting data to Excel: {file_path}")
+        self.start_export(ExcelExportWriter(file_path))
+
+    def export_to_columnar(self, file_path):
+        """Exports table data as typed columns (Parquet, Arrow IPC, or NumPy .npz)."""
+        logger.info(f"Exporting data to columnar file: {file_path}")
+        self.start_export(writer_for_path(file_path))
+
+    def update_table(self):
+        """Updates the description and data based on selected table."""
+        selected_table = self.table_combobox.currentText()
+        logger.info(f"Updating table to {selected_table or '[No Table Selected]'}")
+        if selected_table:
+            self.mysql_manager.get_table_info(
+                selected_table,
+                on_result=self.on_table_described,
+                database=self.database,
+            )
+
+    def on_table_described(self, table_info):
+        """Switch the window to a table once its metadata has arrived."""
+        if table_info.name != self.table_combobox.currentText():
+            return
+        self.table_name = table_info.name
+        self.table_info = table_info
+        self.table_description = table_info.describe_rows()
+        self.table_filter = TableFilter()
+        self.table_filter.limit = self.row_limit_input.value() or None
+        self.data_table.horizontalHeader().setSortIndicatorShown(False)
+        self.update_description(self.table_description)
+        self.update_table_info()
+        self.update_filter_columns()
+        self.reload_data()
+
+    def update_table_info(self):
+        """Show the indexes and size estimate of the table below its description."""
+        if self.table_info is None:
+            self.table_info_label.setText("")
+            return
+        lines = [self.table_info.summary()]
+        indexes = self.table_info.index_summary()
+        if indexes:
+            lines.append("Indexes: " + "; ".join(indexes))
+        self.table_info_label.setText("\n".join(line for line in lines if line))
+
+    def update_description(self, table_description):
+        """Update the table description in the left pane."""
+        logger.info("Updating table description.")
+        self.description_table.setRowCount(len(table_description))
+        for row, desc in enumerate(table_description):
+            for col, value in enumerate(desc):
+                self.description_table.setItem(row, col, QTableWidgetItem(str(value)))
+
+    def filter_tables(self):
+        """Filters available tables based on user input in the search bar."""
+        search_text = self.search_bar.text().lower()
+        filtered_tables = [
+            table for table in self.available_tables if search_text in table.lower()
+        ]
+        self.table_combobox.clear()
+        self.table_combobox.addItems(filtered_tables)
+
+    def center_window(self):
+        """Center the window on the screen."""
+        qr = self.frameGeometry()
+        cp = QDesktopWidget().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
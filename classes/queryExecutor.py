@@ -0,0 +1,190 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import itertools
+import logging
+import queue
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+from classes.connectionPool import get_pool
+from classes.rowStreamer import stop_in_background
+
+logger = logging.getLogger()
+
+CANCELLED_MESSAGE = "Query cancelled."
+
+
+class QueryJob:
+    """A unit of work for the QueryExecutor: a SQL statement or a callable."""
+
+    def __init__(self, job_id, description, query=None, args=None, func=None, database=None):
+        self.job_id = job_id
+        self.description = description
+        self.query = query
+        self.args = args
+        self.func = func
+        self.database = database
+
+    def run(self, connection):
+        if self.database:
+            connection.select_db(self.database)
+        if self.func is not None:
+            return self.func(connection)
+        cursor = connection.cursor()
+        try:
+            cursor.execute(self.query, self.args)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+class QueryExecutor(QThread):
+    """Runs MySQL work off the GUI thread, one job at a time, on a pooled connection.
+
+    Jobs are queued with submit() or submit_call() and their callbacks are
+    invoked on the GUI thread once the result is posted back through the
+    signals. cancel() kills the running statement with KILL QUERY from a side
+    connection and drops the jobs still waiting in the queue.
+    """
+
+    query_started = pyqtSignal(int, str)
+    query_finished = pyqtSignal(int, object)
+    query_failed = pyqtSignal(int, str)
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = queue.Queue()
+        self._job_ids = itertools.count(1)
+        self._callbacks = {}
+        self._lock = threading.Lock()
+        # Held while a KILL is sent, so the job cannot hand its connection
+        # to the next job until the KILL has reached the server.
+        self._kill_lock = threading.Lock()
+        self._current_job = None
+        self._cancelled_jobs = set()
+        self._stopping = False
+        self.connection_id = None
+
+        self.query_finished.connect(self._dispatch_result)
+        self.query_failed.connect(self._dispatch_error)
+
+    def submit(self, query, args=None, on_result=None, on_error=None, database=None):
+        """Queue a SQL statement; on_result receives the fetched rows."""
+        job_id = next(self._job_ids)
+        job = QueryJob(job_id, query, query=query, args=args, database=database)
+        return self._enqueue(job, on_result, on_error)
+
+    def submit_call(self, func, description, on_result=None, on_error=None, database=None):
+        """Queue func(connection); on_result receives its return value."""
+        job_id = next(self._job_ids)
+        job = QueryJob(job_id, description, func=func, database=database)
+        return self._enqueue(job, on_result, on_error)
+
+    def _enqueue(self, job, on_result, on_error):
+        self._callbacks[job.job_id] = (on_result, on_error)
+        self._jobs.put(job)
+        return job.job_id
+
+    def pending_count(self):
+        """Number of jobs waiting behind the running one."""
+        return self._jobs.qsize()
+
+    def cancel(self):
+        """Kill the running statement and drop every queued job."""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                self.query_failed.emit(job.job_id, CANCELLED_MESSAGE)
+
+        with self._lock:
+            job = self._current_job
+            connection_id = self.connection_id
+            if job is not None:
+                self._cancelled_jobs.add(job.job_id)
+        if job is not None and connection_id is not None:
+            # The side connection is opened on a plain thread so the GUI
+            # never waits on the KILL round trip.
+            threading.Thread(
+                target=self._kill_query, args=(job, connection_id), daemon=True
+            ).start()
+
+    def _kill_query(self, job, connection_id):
+        with self._kill_lock:
+            with self._lock:
+                if self._current_job is not job or self.connection_id != connection_id:
+                    return
+            get_pool().kill_query(connection_id)
+
+    def stop(self):
+        """Cancel outstanding work and let the thread exit."""
+        self._stopping = True
+        self.cancel()
+        self._jobs.put(None)
+
+    def shutdown(self):
+        """Stop the thread without waiting for it on the GUI thread."""
+        stop_in_background(self)
+
+    def _run_job(self, job):
+        with get_pool().connection() as connection:
+            with self._lock:
+                self.connection_id = connection.thread_id()
+            try:
+                return job.run(connection)
+            finally:
+                with self._kill_lock, self._lock:
+                    self.connection_id = None
+
+    def run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None or self._stopping:
+                break
+
+            with self._lock:
+                self._current_job = job
+            self.busy_changed.emit(True)
+            self.query_started.emit(job.job_id, job.description)
+            try:
+                result = self._run_job(job)
+                self.query_finished.emit(job.job_id, result)
+            except Exception as e:
+                with self._lock:
+                    cancelled = job.job_id in self._cancelled_jobs
+                if cancelled:
+                    logger.info(f"Query cancelled: {job.description}")
+                    self.query_failed.emit(job.job_id, CANCELLED_MESSAGE)
+                else:
+                    logger.error(f"Query failed: {job.description}: {e}")
+                    self.query_failed.emit(job.job_id, str(e))
+            finally:
+                with self._lock:
+                    self._current_job = None
+                    self._cancelled_jobs.discard(job.job_id)
+                if self._jobs.empty():
+                    self.busy_changed.emit(False)
+
+    def _dispatch_result(self, job_id, result):
+        on_result, _ = self._callbacks.pop(job_id, (None, None))
+        if on_result is not None:
+            on_result(result)
+
+    def _dispatch_error(self, job_id, message):
+        _, on_error = self._callbacks.pop(job_id, (None, None))
+        if on_error is not None:
+            on_error(message)
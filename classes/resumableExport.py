@@ -0,0 +1,299 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import base64
+import datetime
+import decimal
+import json
+import logging
+import os
+import time
+import pymysql
+from PyQt5.QtCore import QThread, pyqtSignal
+from classes.connectionPool import get_pool
+from classes.exportStreams import split_compression
+from classes.exportWorker import PROGRESS_INTERVAL, remove_file
+
+logger = logging.getLogger()
+
+DEFAULT_CHUNK_SIZE = 10000
+MAX_RETRIES = 5
+# Seconds before the first reconnect attempt, doubled after every failure.
+RETRY_DELAY = 1.0
+CHECKPOINT_VERSION = 1
+# Client errors meaning the connection is gone: can't connect, server has gone
+# away, lost connection during query, and lost connection to the server.
+CONNECTION_LOST_ERRORS = (2003, 2006, 2013, 2055)
+
+
+def checkpoint_path(file_path):
+    """Path of the sidecar file recording the progress of an export."""
+    return file_path + ".checkpoint"
+
+
+def encode_key_value(value):
+    """Encode one primary key value for the JSON checkpoint."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, decimal.Decimal):
+        return {"decimal": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"seconds": value.total_seconds()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": base64.b64encode(value).decode("ascii")}
+    return {"text": str(value)}
+
+
+def decode_key_value(value):
+    if not isinstance(value, dict):
+        return value
+    kind, text = next(iter(value.items()))
+    if kind == "decimal":
+        return decimal.Decimal(text)
+    if kind == "datetime":
+        return datetime.datetime.fromisoformat(text)
+    if kind == "date":
+        return datetime.date.fromisoformat(text)
+    if kind == "seconds":
+        return datetime.timedelta(seconds=text)
+    if kind == "bytes":
+        return base64.b64decode(text)
+    return text
+
+
+def is_connection_lost(error):
+    if isinstance(error, pymysql.InterfaceError):
+        return True
+    return bool(error.args) and error.args[0] in CONNECTION_LOST_ERRORS
+
+
+def can_resume(writer, pager):
+    """Whether an export can be written in key ranges with checkpoints."""
+    return (
+        writer.appendable
+        and pager.uses_keyset
+        and split_compression(writer.file_path)[1] is None
+    )
+
+
+class ResumableExportWorker(QThread):
+    """Exports a table in primary key ranges, recording a checkpoint after each one.
+
+    Every range is a keyset query for the next chunk_size rows after the
+    last exported key, read completely before it is written. After the
+    rows are synced to disk, the sidecar checkpoint records the last key,
+    the row count, and the file size. A lost connection is retried with
+    backoff from the last checkpoint. An export that was stopped or died
+    can be started again with resume=True: the file is cut back to the
+    checkpointed size and the rows after the last key are appended.
+    """
+
+    progress = pyqtSignal(int, float)
+    export_finished = pyqtSignal(int, float)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self,
+        pager,
+        writer,
+        resume=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.pager = pager
+        self.pager.page_size = max(1, int(chunk_size))
+        self.writer = writer
+        self.resume = resume
+        self.database = pager.database
+        self.table_name = pager.table_name
+        self.checkpoint_file = checkpoint_path(writer.file_path)
+        # The pooled connection in use, released however the export ends.
+        self.connection = None
+        # Rows covered by the latest checkpoint.
+        self.total_rows = 0
+        self._stopped = False
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def stop(self):
+        """Stop after the current range; the checkpoint is kept for a later resume."""
+        self._stopped = True
+
+    def signature(self):
+        """What must match for a checkpoint to be continued."""
+        where, args = self.pager.table_filter.where_clause()
+        return {
+            "version": CHECKPOINT_VERSION,
+            "database": self.database,
+            "table": self.table_name,
+            "order": self.pager.order_columns,
+            "descending": self.pager.descending,
+            "where": where,
+            "args": [str(arg) for arg in args],
+            "format": type(self.writer).__name__,
+        }
+
+    def load_checkpoint(self):
+        """Return the saved checkpoint of this export, or None if there is no usable one."""
+        try:
+            with open(self.checkpoint_file, encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get("signature") != self.signature():
+            return None
+        return checkpoint
+
+    def save_checkpoint(self, rows, file_size):
+        checkpoint = {
+            "signature": self.signature(),
+            "last_key": [encode_key_value(value) for value in self.pager.last_key],
+            "rows": rows,
+            "file_size": file_size,
+        }
+        temporary = self.checkpoint_file + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+        # Replaced atomically, so a crash leaves the old or the new checkpoint.
+        os.replace(temporary, self.checkpoint_file)
+
+    def run(self):
+        started = time.perf_counter()
+        self.total_rows = 0
+        checkpoint = self.load_checkpoint() if self.resume else None
+        try:
+            if checkpoint is not None:
+                with open(self.writer.file_path, "r+b") as file:
+                    file.truncate(checkpoint["file_size"])
+                self.pager.last_key = tuple(
+                    decode_key_value(value) for value in checkpoint["last_key"]
+                )
+                self.total_rows = checkpoint["rows"]
+                logger.info(
+                    f"Resuming export of {self.table_name} after {self.total_rows} rows."
+                )
+            self._export(checkpoint is not None, started)
+        except Exception as e:
+            logger.error(f"Export of {self.table_name} failed: {e}")
+            if os.path.exists(self.checkpoint_file):
+                self.error_occurred.emit(
+                    f"{e}\nExport stopped after {self.total_rows:,} rows; export to "
+                    "the same file again to resume."
+                )
+            else:
+                # Nothing was checkpointed, so the partial file cannot be resumed.
+                remove_file(self.writer.file_path)
+                self.error_occurred.emit(str(e))
+            return
+
+        if self._stopped:
+            logger.info(
+                f"Export of {self.table_name} paused after {self.total_rows} rows."
+            )
+            return
+        remove_file(self.checkpoint_file)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Exported {self.total_rows} rows of {self.table_name} to "
+            f"{self.writer.file_path} in {elapsed:.1f}s."
+        )
+        self.export_finished.emit(self.total_rows, elapsed)
+
+    def _export(self, resuming, started):
+        writer = self.writer
+        writer.open(append=resuming)
+        try:
+            first_range = not resuming
+            last_progress = started
+            exported = 0
+            while not self._stopped:
+                rows, description = self._fetch_range(first_range)
+                if writer.columns == [] and description:
+                    writer.prepare(self.connection, self.database, self.table_name)
+                    writer.begin([column[0] for column in description], description)
+                if not rows:
+                    break
+                writer.write_rows(rows)
+                writer.flush()
+                self.pager.last_key = tuple(rows[-1][i] for i in self.pager.key_indexes)
+                exported += len(rows)
+                self.save_checkpoint(
+                    self.total_rows + len(rows), os.path.getsize(writer.file_path)
+                )
+                self.total_rows += len(rows)
+                first_range = False
+
+                now = time.perf_counter()
+                if now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    self.progress.emit(self.total_rows, exported / (now - started))
+                if len(rows) < self.pager.page_size:
+                    break
+            if not self._stopped:
+                writer.end()
+        finally:
+            self._release_connection()
+            writer.close()
+
+    def _release_connection(self, discard=False):
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            get_pool().release(connection, discard=discard)
+
+    def _fetch_range(self, first_range):
+        """Read the next key range, reconnecting with backoff when the connection drops.
+
+        Other errors, such as a dropped table or a lock wait timeout, are
+        raised at once.
+        """
+        if first_range:
+            sql, args, _ = self.pager.first_page_query()
+        else:
+            sql, args, _ = self.pager.next_page_query()
+        delay = RETRY_DELAY
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                if self.connection is None:
+                    self.connection = get_pool().acquire()
+                    self.connection.select_db(self.database)
+                cursor = self.connection.cursor()
+                try:
+                    cursor.execute(sql, args)
+                    return cursor.fetchall(), cursor.description
+                finally:
+                    cursor.close()
+            except (pymysql.OperationalError, pymysql.InterfaceError) as e:
+                if not is_connection_lost(e):
+                    raise
+                self._release_connection(discard=True)
+                if attempt == MAX_RETRIES or self._stopped:
+                    raise
+                logger.warning(
+                    f"Export of {self.table_name} lost its connection ({e}), "
+                    f"retrying in {delay:g}s."
+                )
+                self._sleep(delay)
+                delay *= 2
+
+    def _sleep(self, seconds):
+        deadline = time.monotonic() + seconds
+        while not self._stopped and time.monotonic() < deadline:
+            time.sleep(0.1)
@@ -0,0 +1,163 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import threading
+import pymysql
+import pymysql.cursors
+from PyQt5.QtCore import QThread, pyqtSignal
+from classes.connectionPool import get_pool
+
+logger = logging.getLogger()
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_PENDING_BATCHES = 2
+# Seconds the server waits for a paused stream before dropping it; the
+# default net_write_timeout of 60 s is too short for a user reading a page.
+STREAM_WRITE_TIMEOUT = 3600
+
+# Threads stopped by stop_in_background() that are still running.
+_stopping_threads = set()
+
+
+def quote_identifier(name):
+    """Quote a table or column name for use in a MySQL statement."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def close_stream(connection, cursor, discard):
+    """Return a streaming connection to the pool without draining an abandoned result."""
+    if connection is None:
+        return
+    # Closing an SSCursor reads the rest of the result set, so when the
+    # stream was stopped early or failed the connection is discarded instead.
+    if not discard and cursor is not None:
+        try:
+            cursor.close()
+        except pymysql.MySQLError as e:
+            logger.debug(f"Error while closing streaming cursor: {e}")
+            discard = True
+    get_pool().release(connection, discard=discard)
+
+
+def kill_running_query(connection_id):
+    """Send KILL QUERY for a connection from a side thread, so the caller never waits."""
+    if connection_id is not None:
+        threading.Thread(
+            target=get_pool().kill_query, args=(connection_id,), daemon=True
+        ).start()
+
+
+def stop_in_background(thread):
+    """Stop a worker thread without waiting for it on the GUI thread.
+
+    The thread is referenced here until it finishes, as a QThread that is
+    garbage collected while running takes the process down with it.
+    """
+    thread.stop()
+    _stopping_threads.add(thread)
+    thread.finished.connect(lambda: _stopping_threads.discard(thread))
+    if thread.isFinished():
+        _stopping_threads.discard(thread)
+
+
+class RowStreamerThread(QThread):
+    """Thread that streams the rows of a query in batches using an unbuffered cursor.
+
+    At most MAX_PENDING_BATCHES batches are handed to the receiver before it
+    calls batch_consumed(); until then the thread waits with the result set
+    left on the server. The receiver decides how many rows it keeps, so a
+    receiver that asks for more only on demand also bounds its own memory.
+    """
+
+    columns_ready = pyqtSignal(list)
+    rows_fetched = pyqtSignal(list)
+    streaming_finished = pyqtSignal(int)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self, database, query, batch_size=DEFAULT_BATCH_SIZE, parent=None, args=None
+    ):
+        super().__init__(parent)
+        self.database = database
+        self.query = query
+        self.args = args
+        self.batch_size = max(1, int(batch_size))
+        self._stopped = False
+        self._pending = threading.Semaphore(MAX_PENDING_BATCHES)
+        self._lock = threading.Lock()
+        self.connection_id = None
+
+    def stop(self):
+        """Stop the stream, killing the query if the server is still running it."""
+        self._stopped = True
+        self._pending.release()
+        with self._lock:
+            connection_id = self.connection_id
+        kill_running_query(connection_id)
+
+    def batch_consumed(self):
+        """Let the thread read and emit one more batch."""
+        self._pending.release()
+
+    def _wait_for_receiver(self):
+        self._pending.acquire()
+        return not self._stopped
+
+    def run(self):
+        connection = None
+        cursor = None
+        failed = False
+        total_rows = 0
+        try:
+            connection = get_pool().acquire()
+            if self.database:
+                connection.select_db(self.database)
+            cursor = connection.cursor(pymysql.cursors.SSCursor)
+            cursor.execute(
+                "SET SESSION net_write_timeout = %s", (STREAM_WRITE_TIMEOUT,)
+            )
+            with self._lock:
+                self.connection_id = connection.thread_id()
+            cursor.execute(self.query, self.args)
+            self.columns_ready.emit(
+                [column[0] for column in cursor.description or []]
+            )
+
+            while self._wait_for_receiver():
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                total_rows += len(rows)
+                self.rows_fetched.emit(list(rows))
+
+            logger.debug(
+                f"Streamed {total_rows} rows from {self.database} "
+                f"({'stopped' if self._stopped else 'complete'})."
+            )
+            self.streaming_finished.emit(total_rows)
+        except pymysql.MySQLError as e:
+            failed = True
+            if self._stopped:
+                logger.info(f"Row stream stopped: {e}")
+            else:
+                logger.error(f"Failed to stream rows: {e}")
+                self.error_occurred.emit(str(e))
+        finally:
+            with self._lock:
+                self.connection_id = None
+            self._close(connection, cursor, failed or self._stopped)
+
+    def _close(self, connection, cursor, discard):
+        close_stream(connection, cursor, discard)
@@ -0,0 +1,222 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+import threading
+import time
+from classes.schemaIntrospection import (
+    load_columns_and_indexes,
+    load_schema_signature,
+    load_tables,
+)
+
+logger = logging.getLogger()
+
+# The table list of a schema is read again at least this often, in seconds;
+# the Refresh button and a change of the schema signature drop it sooner.
+VALIDATE_INTERVAL = 300
+# Cached metadata older than this is checked against the server before use:
+# the schema signature for table lists, a single-table query for one table.
+TABLE_VALIDATE_INTERVAL = 5
+
+
+class _SchemaEntry:
+    def __init__(self):
+        self.checked_at = 0.0
+        # When the schema signature was last compared with the server.
+        self.signature_checked_at = 0.0
+        # table name -> TableInfo
+        self.tables = {}
+        # table name -> when that table alone was last checked; defaults to checked_at.
+        self.table_checked_at = {}
+
+
+class SchemaCache:
+    """In-memory cache of database, table, and column metadata.
+
+    Entries are keyed by schema. The table list and row estimates of a
+    schema come from one information_schema.TABLES query over the whole
+    schema, repeated only every VALIDATE_INTERVAL seconds or after
+    invalidate(), since that scan opens every table and gets expensive on
+    schemas with thousands of them. In between, a cached list older than
+    TABLE_VALIDATE_INTERVAL seconds is checked with a cheap COUNT(*) and
+    MAX(CREATE_TIME) query, so tables created or dropped elsewhere show up
+    the next time the schema is used. A table being looked up is checked on
+    its own instead, with a TABLES query for that one table at most every
+    TABLE_VALIDATE_INTERVAL seconds. Columns and indexes are loaded for the
+    whole schema at once from information_schema.COLUMNS and STATISTICS the
+    first time any table is described, and reloaded only for tables whose
+    CREATE_TIME changed (MySQL rewrites it on every ALTER). Between checks,
+    lookups never leave the process.
+
+    The methods that take a connection may run queries and are meant to be
+    called from a worker thread, such as inside a QueryExecutor job.
+    """
+
+    def __init__(
+        self,
+        validate_interval=VALIDATE_INTERVAL,
+        table_validate_interval=TABLE_VALIDATE_INTERVAL,
+    ):
+        self.validate_interval = validate_interval
+        self.table_validate_interval = table_validate_interval
+        self._lock = threading.Lock()
+        self._schemas = {}
+        self._databases = None
+        self._databases_checked_at = 0.0
+
+    def invalidate(self, schema=None):
+        """Forget a schema, or everything when no schema is given."""
+        with self._lock:
+            if schema is None:
+                self._schemas.clear()
+                self._databases = None
+            else:
+                self._schemas.pop(schema, None)
+
+    def databases(self, connection):
+        """Return the names of all databases."""
+        with self._lock:
+            if self._databases is not None and not self._expired(
+                self._databases_checked_at
+            ):
+                return list(self._databases)
+
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SHOW DATABASES;")
+            databases = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self._databases = databases
+            self._databases_checked_at = time.monotonic()
+        return list(databases)
+
+    def table_infos(self, connection, schema):
+        """Return the TableInfo of every table in a schema, without columns loaded."""
+        return list(self._validated_entry(connection, schema).tables.values())
+
+    def table_info(self, connection, schema, table):
+        """Return the TableInfo of one table with columns and indexes loaded."""
+        entry = self._validated_entry(connection, schema)
+        self._validated_table(connection, schema, entry, table)
+        return self._load_missing_columns(connection, schema, entry)[table]
+
+    def _load_missing_columns(self, connection, schema, entry):
+        with self._lock:
+            tables = dict(entry.tables)
+        missing = [name for name, info in tables.items() if info.columns is None]
+        if missing:
+            load_columns_and_indexes(
+                connection,
+                schema,
+                tables,
+                None if len(missing) == len(tables) else missing,
+            )
+        return tables
+
+    def describe(self, connection, schema, table):
+        """Return the DESCRIBE rows of a table."""
+        return self.table_info(connection, schema, table).describe_rows()
+
+    def _expired(self, checked_at, interval=None):
+        interval = self.validate_interval if interval is None else interval
+        return time.monotonic() - checked_at >= interval
+
+    def _validated_entry(self, connection, schema):
+        with self._lock:
+            entry = self._schemas.get(schema)
+            if entry is not None and not self._expired(entry.checked_at):
+                if not self._expired(
+                    entry.signature_checked_at, self.table_validate_interval
+                ):
+                    return entry
+                cached_signature = _signature(entry.tables.values())
+            else:
+                cached_signature = None
+
+        if cached_signature is not None:
+            if load_schema_signature(connection, schema) == cached_signature:
+                with self._lock:
+                    entry.signature_checked_at = time.monotonic()
+                return entry
+            logger.debug(f"Tables of {schema} changed, reloading them.")
+
+        tables = load_tables(connection, schema)
+
+        with self._lock:
+            entry = self._schemas.get(schema)
+            if entry is None:
+                entry = _SchemaEntry()
+                self._schemas[schema] = entry
+            for name, info in tables.items():
+                cached = entry.tables.get(name)
+                if cached is not None and cached.create_time == info.create_time:
+                    info.columns = cached.columns
+                    info.indexes = cached.indexes
+                elif cached is not None:
+                    logger.debug(f"Table {schema}.{name} changed, dropping its cached columns.")
+            entry.tables = tables
+            entry.table_checked_at = {}
+            entry.checked_at = entry.signature_checked_at = time.monotonic()
+        return entry
+
+    def _validated_table(self, connection, schema, entry, table):
+        """Check one table against information_schema.TABLES when its metadata is old."""
+        with self._lock:
+            checked_at = entry.table_checked_at.get(table, entry.checked_at)
+            if table in entry.tables and not self._expired(
+                checked_at, self.table_validate_interval
+            ):
+                return
+
+        info = load_tables(connection, schema, [table]).get(table)
+
+        with self._lock:
+            cached = entry.tables.get(table)
+            if info is None:
+                entry.tables.pop(table, None)
+                entry.table_checked_at.pop(table, None)
+                raise ValueError(f"Table {schema}.{table} does not exist.")
+            if cached is not None and cached.create_time == info.create_time:
+                info.columns = cached.columns
+                info.indexes = cached.indexes
+            elif cached is not None:
+                logger.debug(f"Table {schema}.{table} changed, dropping its cached columns.")
+            entry.tables[table] = info
+            entry.table_checked_at[table] = time.monotonic()
+
+
+def _signature(table_infos):
+    """(table count, newest CREATE_TIME) of cached tables, as load_schema_signature reads it."""
+    table_infos = list(table_infos)
+    create_times = [
+        info.create_time for info in table_infos if info.create_time is not None
+    ]
+    return len(table_infos), max(create_times, default=None)
+
+
+_schema_cache = None
+_schema_cache_lock = threading.Lock()
+
+
+def get_schema_cache():
+    """Return the application-wide schema cache."""
+    global _schema_cache
+    with _schema_cache_lock:
+        if _schema_cache is None:
+            _schema_cache = SchemaCache()
+        return _schema_cache
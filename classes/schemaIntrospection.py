@@ -0,0 +1,182 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+
+logger = logging.getLogger()
+
+# Shown for functional key parts, which have no COLUMN_NAME (MySQL 8.0.13+).
+EXPRESSION_KEY_PART = "(expression)"
+
+
+class TableInfo:
+    """Metadata of one table as read from information_schema."""
+
+    def __init__(
+        self,
+        name,
+        table_type=None,
+        engine=None,
+        row_estimate=None,
+        data_length=None,
+        index_length=None,
+        create_time=None,
+    ):
+        self.name = name
+        self.table_type = table_type
+        self.engine = engine
+        self.row_estimate = row_estimate
+        self.data_length = data_length
+        self.index_length = index_length
+        self.create_time = create_time
+        # (Field, Type, Null, Key, Default, Extra), the same shape as DESCRIBE.
+        self.columns = None
+        # index name -> {"unique": bool, "columns": [column, ...]}
+        self.indexes = None
+
+    @property
+    def column_names(self):
+        return [column[0] for column in self.columns or []]
+
+    @property
+    def primary_key(self):
+        if self.indexes and "PRIMARY" in self.indexes:
+            return list(self.indexes["PRIMARY"]["columns"])
+        return [column[0] for column in self.columns or [] if column[3] == "PRI"]
+
+    def describe_rows(self):
+        """Return the columns as DESCRIBE would."""
+        return tuple(self.columns or ())
+
+    def summary(self):
+        """One-line description used in tooltips and labels."""
+        parts = []
+        if self.table_type == "VIEW":
+            parts.append("view")
+        elif self.engine:
+            parts.append(self.engine)
+        if self.row_estimate is not None:
+            parts.append(f"~{self.row_estimate:,} rows")
+        size = (self.data_length or 0) + (self.index_length or 0)
+        if size:
+            parts.append(f"{size / (1024 ** 2):.1f} MB")
+        return ", ".join(parts)
+
+    def index_summary(self):
+        """Indexes of the table as 'NAME (col, ...)' strings."""
+        return [
+            f"{name}{' UNIQUE' if index['unique'] and name != 'PRIMARY' else ''} "
+            f"({', '.join(index['columns'])})"
+            for name, index in (self.indexes or {}).items()
+        ]
+
+
+def load_tables(connection, schema, table_names=None):
+    """Read the tables of a schema with one information_schema.TABLES query.
+
+    table_names limits the query to some tables, which lets MySQL open only
+    their metadata instead of every table in the schema.
+    """
+    condition, condition_args = _table_filter(table_names)
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT TABLE_NAME, TABLE_TYPE, ENGINE, TABLE_ROWS, DATA_LENGTH, "
+            "INDEX_LENGTH, CREATE_TIME "
+            "FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s" + condition +
+            " ORDER BY TABLE_NAME",
+            (schema,) + condition_args,
+        )
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    return {row[0]: TableInfo(*row) for row in rows}
+
+
+def load_schema_signature(connection, schema):
+    """Return (table count, newest CREATE_TIME) of a schema, a cheap check for changes."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT COUNT(*), MAX(CREATE_TIME) FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = %s",
+            (schema,),
+        )
+        count, newest = cursor.fetchone()
+    finally:
+        cursor.close()
+    return count, newest
+
+
+def _table_filter(table_names):
+    if table_names is None:
+        return "", ()
+    placeholders = ", ".join(["%s"] * len(table_names))
+    return f" AND TABLE_NAME IN ({placeholders})", tuple(table_names)
+
+
+def load_columns_and_indexes(connection, schema, tables, table_names=None):
+    """Fill in columns and indexes of the given TableInfo objects.
+
+    Two queries, against information_schema.COLUMNS and STATISTICS, cover
+    every table at once. table_names limits the load to some tables.
+    """
+    if table_names is not None and not table_names:
+        return
+    condition, condition_args = _table_filter(table_names)
+    targets = tables if table_names is None else {
+        name: tables[name] for name in table_names if name in tables
+    }
+    columns = {name: [] for name in targets}
+    indexes = {name: {} for name in targets}
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, "
+            "COLUMN_DEFAULT, EXTRA FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s" + condition +
+            " ORDER BY TABLE_NAME, ORDINAL_POSITION",
+            (schema,) + condition_args,
+        )
+        for row in cursor.fetchall():
+            if row[0] in columns:
+                columns[row[0]].append(tuple(row[1:]))
+
+        cursor.execute(
+            "SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, COLUMN_NAME "
+            "FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = %s" + condition +
+            " ORDER BY TABLE_NAME, INDEX_NAME = 'PRIMARY' DESC, INDEX_NAME, SEQ_IN_INDEX",
+            (schema,) + condition_args,
+        )
+        for table_name, index_name, non_unique, column_name in cursor.fetchall():
+            if table_name not in indexes:
+                continue
+            index = indexes[table_name].setdefault(
+                index_name, {"unique": not int(non_unique), "columns": []}
+            )
+            index["columns"].append(
+                column_name if column_name is not None else EXPRESSION_KEY_PART
+            )
+    finally:
+        cursor.close()
+
+    # Assigned only once complete, so other threads never see a partial table.
+    for name, info in targets.items():
+        info.indexes = indexes[name]
+        info.columns = columns[name]
+    logger.debug(
+        f"Loaded columns and indexes of {len(targets)} table(s) in {schema}."
+    )
@@ -0,0 +1,132 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+import logging
+
+logger = logging.getLogger()
+
+DEFAULT_TOP_COUNT = 25
+DIGEST_COLUMNS = (
+    "SCHEMA_NAME, DIGEST, DIGEST_TEXT, COUNT_STAR, SUM_TIMER_WAIT, "
+    "SUM_ROWS_EXAMINED, SUM_ROWS_SENT"
+)
+DIGEST_QUERY = (
+    f"SELECT {DIGEST_COLUMNS} "
+    "FROM performance_schema.events_statements_summary_by_digest"
+)
+# Sort keys offered for the top-N lists, by DigestStats attribute.
+SORT_KEYS = {
+    "Total latency": "latency",
+    "Rows examined": "rows_examined",
+    "Rows sent": "rows_sent",
+    "Calls": "calls",
+}
+COUNTERS = ("calls", "latency", "rows_examined", "rows_sent")
+# performance_schema timers count picoseconds.
+PICOSECONDS_PER_MS = 10**9
+
+
+class DigestStats:
+    """Counters of one normalized statement, in total and since the previous refresh."""
+
+    def __init__(self, schema, digest, text, calls, latency, rows_examined, rows_sent):
+        self.schema = schema
+        self.digest = digest
+        # NULL for the row that collects statements once the digest table is full.
+        if digest is None:
+            text = "(statements over the digest limit)"
+        self.text = text or ""
+        self.calls = int(calls or 0)
+        self.latency = int(latency or 0)
+        self.rows_examined = int(rows_examined or 0)
+        self.rows_sent = int(rows_sent or 0)
+        self.delta = dict.fromkeys(COUNTERS, 0)
+
+    @property
+    def key(self):
+        return (self.schema, self.digest)
+
+    @property
+    def latency_ms(self):
+        return self.latency / PICOSECONDS_PER_MS
+
+    @property
+    def average_latency_ms(self):
+        return self.latency_ms / self.calls if self.calls else 0.0
+
+    def value(self, counter, since_refresh=False):
+        return self.delta[counter] if since_refresh else getattr(self, counter)
+
+
+class DigestTracker:
+    """Follows events_statements_summary_by_digest between refreshes.
+
+    The first refresh reads every digest. Later ones read only the digests
+    whose LAST_SEEN moved since the previous refresh, by the server clock,
+    and the difference to the remembered totals is the
+    activity in between. A digest whose counters went backwards was reset
+    (TRUNCATE or eviction), and its new totals count as the delta.
+    """
+
+    def __init__(self):
+        self.digests = {}
+        self.since = None
+        self.refreshes = 0
+
+    def refresh(self, collector):
+        """Read the digests changed since the last refresh; returns how many ran in between."""
+        # Whole seconds, as LAST_SEEN has no fraction on MySQL 5.7; the
+        # digests of the boundary second are read again, which is harmless.
+        now = collector.query("SELECT NOW()")[0][0]
+        if self.since is None:
+            rows = collector.query(DIGEST_QUERY)
+        else:
+            rows = collector.query(
+                DIGEST_QUERY + " WHERE LAST_SEEN >= %s", (self.since,)
+            )
+        self.since = now
+
+        first = self.refreshes == 0
+        self.refreshes += 1
+        changed = set()
+        for row in rows:
+            stats = DigestStats(*row)
+            previous = self.digests.get(stats.key)
+            for counter in COUNTERS:
+                total = getattr(stats, counter)
+                if first:
+                    stats.delta[counter] = 0
+                elif previous is None or total < getattr(previous, counter):
+                    stats.delta[counter] = total
+                else:
+                    stats.delta[counter] = total - getattr(previous, counter)
+            self.digests[stats.key] = stats
+            changed.add(stats.key)
+        # Digests not returned saw no statements since the previous refresh.
+        for key, stats in self.digests.items():
+            if key not in changed:
+                stats.delta = dict.fromkeys(COUNTERS, 0)
+        logger.debug(f"Fetched {len(rows)} changed statement digests.")
+        return sum(1 for stats in self.digests.values() if stats.delta["calls"])
+
+    def top(self, counter, since_refresh=False, count=DEFAULT_TOP_COUNT):
+        """The digests with the largest counter, in total or since the previous refresh."""
+        ranked = sorted(
+            self.digests.values(),
+            key=lambda stats: stats.value(counter, since_refresh),
+            reverse=True,
+        )
+        if since_refresh:
+            ranked = [stats for stats in ranked if stats.delta[counter] > 0]
+        return ranked[:count]
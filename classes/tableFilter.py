@@ -0,0 +1,141 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+from classes.rowStreamer import quote_identifier
+
+# Operator label -> whether it takes a value.
+OPERATORS = {
+    "=": True,
+    "!=": True,
+    "<": True,
+    "<=": True,
+    ">": True,
+    ">=": True,
+    "contains": True,
+    "starts with": True,
+    "in": True,
+    "is null": False,
+    "is not null": False,
+}
+
+
+def escape_like(value):
+    """Escape the LIKE wildcards in a user supplied value."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class ColumnFilter:
+    """A single condition on one column."""
+
+    def __init__(self, column, operator, value=None):
+        if operator not in OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        self.column = column
+        self.operator = operator
+        self.value = value
+
+    def sql(self):
+        """Return the condition as (sql, args) with the value as a parameter."""
+        column = quote_identifier(self.column)
+        if self.operator == "is null":
+            return f"{column} IS NULL", ()
+        if self.operator == "is not null":
+            return f"{column} IS NOT NULL", ()
+        if self.operator == "contains":
+            return f"{column} LIKE %s", (f"%{escape_like(self.value)}%",)
+        if self.operator == "starts with":
+            return f"{column} LIKE %s", (f"{escape_like(self.value)}%",)
+        if self.operator == "in":
+            values = [value.strip() for value in str(self.value).split(",")]
+            placeholders = ", ".join(["%s"] * len(values))
+            return f"{column} IN ({placeholders})", tuple(values)
+        operator = "<>" if self.operator == "!=" else self.operator
+        return f"{column} {operator} %s", (self.value,)
+
+    def __str__(self):
+        if OPERATORS[self.operator]:
+            return f"{self.column} {self.operator} {self.value!r}"
+        return f"{self.column} {self.operator}"
+
+
+class TableFilter:
+    """Row filters, sort order, and row limit that are run on the server.
+
+    The filters compile into a parameterized WHERE clause, so MySQL can use
+    its indexes and only matching rows are sent to the client.
+    """
+
+    def __init__(self):
+        self.filters = []
+        self.sort_column = None
+        self.sort_descending = False
+        self.limit = None
+
+    @property
+    def is_empty(self):
+        return not self.filters and self.sort_column is None and not self.limit
+
+    def add(self, column, operator, value=None):
+        self.filters.append(ColumnFilter(column, operator, value))
+
+    def clear(self):
+        self.filters = []
+
+    def set_sort(self, column, descending=False):
+        self.sort_column = column
+        self.sort_descending = descending
+
+    def conditions(self):
+        """Return ([sql, ...], args) for the filters, to be joined with AND."""
+        conditions = []
+        args = []
+        for column_filter in self.filters:
+            sql, filter_args = column_filter.sql()
+            conditions.append(sql)
+            args.extend(filter_args)
+        return conditions, args
+
+    def where_clause(self):
+        """Return (' WHERE ...', args), or ('', []) without filters."""
+        conditions, args = self.conditions()
+        if not conditions:
+            return "", args
+        return " WHERE " + " AND ".join(conditions), args
+
+    def order_clause(self):
+        if self.sort_column is None:
+            return ""
+        direction = " DESC" if self.sort_descending else ""
+        return f" ORDER BY {quote_identifier(self.sort_column)}{direction}"
+
+    def select(self, table_reference):
+        """Return (sql, args) selecting the filtered, sorted rows of a table."""
+        where, args = self.where_clause()
+        sql = f"SELECT * FROM {table_reference}{where}{self.order_clause()}"
+        if self.limit:
+            sql += " LIMIT %s"
+            args.append(int(self.limit))
+        return sql, tuple(args)
+
+    def describe(self):
+        """Human readable summary of the active filters and sort."""
+        parts = [" AND ".join(str(column_filter) for column_filter in self.filters)]
+        if self.sort_column is not None:
+            parts.append(
+                f"sorted by {self.sort_column} "
+                f"{'descending' if self.sort_descending else 'ascending'}"
+            )
+        if self.limit:
+            parts.append(f"at most {self.limit} rows")
+        return ", ".join(part for part in parts if part)
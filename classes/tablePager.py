@@ -0,0 +1,239 @@
+# Copyright (c) 2024 - <current year> AlmightyNan <almightynan@apollo-bot.xyz>
+#
+# This file is part of gamma.
+#
+# This file may be used only with explicit permission from AlmightyNan.
+# Redistribution, modification, or commercial use without prior written
+# consent is strictly prohibited.
+#
+# Proper credit must be given to AlmightyNan, and it must be displayed
+# visibly without shortening or obscuring the text.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY, AND FITNESS FOR A PARTICULAR PURPOSE.
+
+from classes.rowStreamer import quote_identifier
+from classes.tableFilter import TableFilter
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def primary_key_columns(table_description):
+    """Return the PRI columns from DESCRIBE output, in column order."""
+    return [row[0] for row in table_description if len(row) > 3 and row[3] == "PRI"]
+
+
+class TablePager:
+    """Builds the page queries for browsing a table one page at a time.
+
+    When the table has a primary key, pages are fetched with keyset
+    pagination (WHERE pk > last ORDER BY pk LIMIT n), so every page costs an
+    index range scan of n rows no matter how deep it is, and the last page is
+    read backwards from the end of the index. A sort column is paged the same
+    way with the key as tie breaker, as long as it cannot be NULL. Tables
+    without a key fall back to LIMIT/OFFSET. Filters from the TableFilter are
+    added to the WHERE clause of every page.
+
+    Each *_query method returns (sql, args, direction); once the rows are
+    fetched they are passed to page_loaded() with the same direction.
+    """
+
+    FIRST = "first"
+    NEXT = "next"
+    PREVIOUS = "previous"
+    LAST = "last"
+
+    def __init__(
+        self,
+        database,
+        table_name,
+        table_description,
+        page_size=DEFAULT_PAGE_SIZE,
+        key_columns=None,
+        table_filter=None,
+    ):
+        self.database = database
+        self.table_name = table_name
+        self.page_size = max(1, int(page_size))
+        self.table_filter = table_filter or TableFilter()
+        self.columns = [row[0] for row in table_description]
+        # Key columns in index order when known, so ORDER BY follows the index.
+        self.key_columns = list(key_columns or primary_key_columns(table_description))
+
+        sort_column = self.table_filter.sort_column
+        nullable = {row[0] for row in table_description if row[2] == "YES"}
+        self.descending = self.table_filter.sort_descending
+        if not self.key_columns or sort_column in nullable:
+            # Row comparisons cannot step over NULLs, so page by offset.
+            self.order_columns = []
+        elif sort_column is None:
+            self.order_columns = list(self.key_columns)
+        else:
+            self.order_columns = [sort_column] + [
+                column for column in self.key_columns if column != sort_column
+            ]
+        self.key_indexes = [self.columns.index(column) for column in self.order_columns]
+
+        self.first_key = None
+        self.last_key = None
+        self.offset = 0
+        self._pending_offset = 0
+        self.page_number = 0
+        self.pages_from_end = None
+        self.at_start = True
+        self.at_end = False
+
+    @property
+    def uses_keyset(self):
+        return bool(self.order_columns)
+
+    @property
+    def table_reference(self):
+        if self.database:
+            return f"{quote_identifier(self.database)}.{quote_identifier(self.table_name)}"
+        return quote_identifier(self.table_name)
+
+    def _order_by(self, descending=False):
+        direction = " DESC" if descending else ""
+        return ", ".join(
+            quote_identifier(column) + direction for column in self.order_columns
+        )
+
+    def _key_condition(self, operator):
+        if len(self.order_columns) == 1:
+            return f"{quote_identifier(self.order_columns[0])} {operator} %s"
+        columns = ", ".join(quote_identifier(column) for column in self.order_columns)
+        placeholders = ", ".join(["%s"] * len(self.order_columns))
+        return f"({columns}) {operator} ({placeholders})"
+
+    def _keyset_query(self, key, backwards):
+        descending = self.descending != backwards
+        conditions, args = self.table_filter.conditions()
+        if key is not None:
+            conditions.append(self._key_condition("<" if descending else ">"))
+            args.extend(key)
+        sql = f"SELECT * FROM {self.table_reference}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {self._order_by(descending)} LIMIT %s"
+        args.append(self.page_size)
+        return sql, tuple(args)
+
+    def _offset_query(self, offset):
+        self._pending_offset = max(0, offset)
+        where, args = self.table_filter.where_clause()
+        order = self.table_filter.order_clause()
+        if order and self.key_columns:
+            # Break ties on the key so rows do not move between pages.
+            order += ", " + ", ".join(
+                quote_identifier(column) for column in self.key_columns
+            )
+        sql = f"SELECT * FROM {self.table_reference}{where}{order} LIMIT %s OFFSET %s"
+        return sql, tuple(args) + (self.page_size, self._pending_offset)
+
+    def count_query(self):
+        """Query for the exact row count, needed to find the last page without a key."""
+        where, args = self.table_filter.where_clause()
+        return f"SELECT COUNT(*) FROM {self.table_reference}{where}", tuple(args)
+
+    def first_page_query(self):
+        if self.uses_keyset:
+            sql, args = self._keyset_query(None, False)
+        else:
+            sql, args = self._offset_query(0)
+        return sql, args, self.FIRST
+
+    def next_page_query(self):
+        if self.uses_keyset:
+            sql, args = self._keyset_query(self.last_key, False)
+        else:
+            sql, args = self._offset_query(self.offset + self.page_size)
+        return sql, args, self.NEXT
+
+    def previous_page_query(self):
+        if self.uses_keyset:
+            sql, args = self._keyset_query(self.first_key, True)
+        else:
+            sql, args = self._offset_query(self.offset - self.page_size)
+        return sql, args, self.PREVIOUS
+
+    def last_page_query(self, total_rows=None):
+        """Query for the last page; total_rows is required when there is no key."""
+        if self.uses_keyset:
+            sql, args = self._keyset_query(None, True)
+        else:
+            last_page = max(0, int(total_rows or 0) - 1) // self.page_size
+            sql, args = self._offset_query(last_page * self.page_size)
+        return sql, args, self.LAST
+
+    def page_loaded(self, rows, direction):
+        """Update the position from fetched rows and return them in table order."""
+        rows = list(rows)
+        if self.uses_keyset:
+            if direction in (self.PREVIOUS, self.LAST):
+                rows.reverse()
+            self._keyset_page_loaded(rows, direction)
+        else:
+            self._offset_page_loaded(rows, direction)
+        return rows
+
+    def _offset_page_loaded(self, rows, direction):
+        if not rows and direction == self.NEXT:
+            self.at_end = True
+            return
+        self.offset = self._pending_offset
+        self.page_number = self.offset // self.page_size
+        self.at_start = self.offset == 0
+        self.at_end = direction == self.LAST or len(rows) < self.page_size
+
+    def _keyset_page_loaded(self, rows, direction):
+        if not rows:
+            if direction == self.NEXT:
+                self.at_end = True
+            elif direction == self.PREVIOUS:
+                self.at_start = True
+            else:
+                self.at_start = self.at_end = True
+            return
+
+        full_page = len(rows) == self.page_size
+        if direction == self.FIRST:
+            self.page_number = 0
+            self.pages_from_end = None
+            self.at_start = True
+            self.at_end = not full_page
+        elif direction == self.NEXT:
+            if self.page_number is not None:
+                self.page_number += 1
+            if self.pages_from_end is not None:
+                self.pages_from_end = max(0, self.pages_from_end - 1)
+            self.at_start = False
+            self.at_end = not full_page
+        elif direction == self.PREVIOUS:
+            if not full_page:
+                # Ran into the start of the index part way through a page.
+                self.page_number = 0
+                self.pages_from_end = None
+            else:
+                if self.page_number is not None:
+                    self.page_number = max(0, self.page_number - 1)
+                if self.pages_from_end is not None:
+                    self.pages_from_end += 1
+            self.at_start = not full_page or self.page_number == 0
+            self.at_end = False
+        elif direction == self.LAST:
+            self.page_number = None if full_page else 0
+            self.pages_from_end = 0
+            self.at_start = not full_page
+            self.at_end = True
+
+        self.first_key = tuple(rows[0][i] for i in self.key_indexes)
+        self.last_key = tuple(rows[-1][i] for i in self.key_indexes)
+
+    def describe_position(self):
+        """Human readable description of the current page."""
+        if self.page_number is not None:
+            return f"Page {self.page_number + 1}"
+        if self.pages_from_end == 0:
+            return "Last page"
+        return f"{self.pages_from_end} page(s) before last"